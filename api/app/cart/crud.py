@@ -76,6 +76,8 @@ async def get_cart_items(
     page: int,
     limit: int = 1,
     return_all: bool = False,
+    cursor: str = None,
+    use_cursor: bool = False,
 ) -> CartItemFullResponse | List[CartItemResponse] | None:
     cart: Cart = await get_entity_by_params(
         session, Cart, user_id=user_id, options=[joinedload(Cart.items)]
@@ -83,16 +85,31 @@ async def get_cart_items(
     if not cart:
         return None
 
-    cart_items, total_pages = await get_entity_by_params(
-        session,
-        CartItem,
-        cart_id=cart.id,
-        page=page,
-        limit=limit,
-        with_total_pages=True,
-        order_by="id",
-        return_all=True,
-    )
+    next_cursor = prev_cursor = None
+
+    if use_cursor or cursor:
+        cart_items, total_pages, next_cursor, prev_cursor = await get_entity_by_params(
+            session,
+            CartItem,
+            cart_id=cart.id,
+            limit=limit,
+            order_by="id",
+            return_all=True,
+            use_cursor=True,
+            cursor=cursor,
+        )
+
+    else:
+        cart_items, total_pages = await get_entity_by_params(
+            session,
+            CartItem,
+            cart_id=cart.id,
+            page=page,
+            limit=limit,
+            with_total_pages=True,
+            order_by="id",
+            return_all=True,
+        )
 
     if not cart_items:
         return None
@@ -100,7 +117,12 @@ async def get_cart_items(
     if return_all:
         return cart.items
 
-    return CartItemFullResponse(**cart_items[0].model_dump(), total_pages=total_pages)
+    return CartItemFullResponse(
+        **cart_items[0].model_dump(),
+        total_pages=total_pages,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+    )
 
 
 async def get_item_by_id(session: SessionDep, item_id: int) -> CartItemResponse:
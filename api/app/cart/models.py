@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from ..company.models import Company
@@ -15,6 +16,8 @@ class Cart(CartBase, table=True):
 
 
 class CartItem(CartItemBase, table=True):
+    __table_args__ = (Index("ix_cartitem_cart_id_product_id", "cart_id", "product_id"),)
+
     id: int | None = Field(default=None, primary_key=True)
 
     cart: Optional[Cart] = Relationship(back_populates="items")
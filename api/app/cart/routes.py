@@ -28,10 +28,17 @@ async def get_cart(
     current_user: User = Depends(get_current_user),
     page: int = 1,
     return_all: bool = False,
+    cursor: str | None = None,
+    use_cursor: bool = False,
 ) -> CartItemFullResponse | List[CartItemResponse] | None:
 
     return await get_cart_items(
-        session=session, user_id=current_user.id, page=page, return_all=return_all
+        session=session,
+        user_id=current_user.id,
+        page=page,
+        return_all=return_all,
+        cursor=cursor,
+        use_cursor=use_cursor,
     )
 
 
@@ -1,14 +1,16 @@
+from typing import Optional
+
 from sqlmodel import Field, SQLModel
 
 
 class CartBase(SQLModel):
-    user_id: int = Field(foreign_key="user.id")
+    user_id: int = Field(foreign_key="user.id", index=True)
     company_id: int = Field(foreign_key="company.id")
 
 
 class CartItemBase(SQLModel):
     cart_id: int = Field(foreign_key="cart.id")
-    product_id: int = Field(foreign_key="product.id")
+    product_id: int = Field(foreign_key="product.id", index=True)
     quantity: int = Field(default=1)
     product_title_ua: str
     product_title_en: str
@@ -29,7 +31,9 @@ class CartItemResponse(CartItemBase):
 
 
 class CartItemFullResponse(CartItemResponse):
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
 
 class CartItemChangeAmount(SQLModel):
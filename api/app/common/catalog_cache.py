@@ -0,0 +1,175 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import asyncpg
+from sqlalchemy import text
+
+from bot.config import (
+    CATALOG_CACHE_MAX_ENTRIES,
+    CATALOG_CACHE_TTL_SECONDS,
+    CATALOG_LISTENER_RETRY_SECONDS,
+    PG_DB_HOST,
+    PG_DB_NAME,
+    PG_DB_PASSWORD,
+    PG_DB_PORT,
+    PG_DB_USER,
+)
+
+from ..utils import TTLCache
+from .dependencies import SessionDep
+
+logger = logging.getLogger(__name__)
+
+CATALOG_CHANNEL = "catalog_invalidation"
+
+CacheKey = Tuple
+
+
+def entity_key(table: str, entity_id: int) -> CacheKey:
+    return ("entity", table, entity_id)
+
+
+def list_key(table: str, parent_id: Optional[int] = None) -> CacheKey:
+    return ("list", table, parent_id)
+
+
+def entity_keys(
+    table: str, entity_id: int, parent_ids: Iterable[Optional[int]] = ()
+) -> List[CacheKey]:
+    keys = [entity_key(table, entity_id), list_key(table)]
+    keys.extend(
+        list_key(table, parent_id) for parent_id in set(parent_ids) if parent_id
+    )
+    return keys
+
+
+class CatalogCache:
+    def __init__(self, max_entries: int, ttl: float):
+        self._entries = TTLCache(max_size=max_entries, ttl=ttl)
+        # Pages of a list are cached under its current generation, so one
+        # bump retires every page/limit/cursor variant of that list at once.
+        self._generations: Dict[CacheKey, int] = {}
+        self.version = 0
+        self.origin = uuid.uuid4().hex
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    async def get_or_load(
+        self, key: CacheKey, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        value = self._entries.get(key)
+
+        if value is not None:
+            self.stats["hits"] += 1
+            return value
+
+        self.stats["misses"] += 1
+        version = self.version
+        value = await loader()
+
+        if value is not None and self.version == version:
+            self._entries.set(key, value)
+
+        return value
+
+    async def get_or_load_page(
+        self, key: CacheKey, page: Tuple, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        generation = self._generations.get(key, 0)
+        return await self.get_or_load((*key, generation, *page), loader)
+
+    def invalidate(self, keys: Iterable[CacheKey]) -> None:
+        self.version += 1
+        self.stats["invalidations"] += 1
+
+        for key in map(tuple, keys):
+            if key[0] == "list":
+                self._generations[key] = self._generations.get(key, 0) + 1
+            else:
+                self._entries.pop(key)
+
+    def clear(self) -> None:
+        self.version += 1
+        self._generations.clear()
+        self._entries.clear()
+
+    async def publish(self, session: SessionDep, keys: List[CacheKey]) -> None:
+        payload = json.dumps({"origin": self.origin, "keys": keys})
+        await session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": CATALOG_CHANNEL, "payload": payload},
+        )
+
+    def handle_notification(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+
+        except ValueError:
+            logger.warning(f"Ignoring malformed catalog notification: {payload}")
+            return
+
+        if message.get("origin") != self.origin:
+            self.invalidate(message.get("keys", []))
+
+
+class CatalogListener:
+    def __init__(self, cache: CatalogCache, retry_seconds: float):
+        self.cache = cache
+        self.retry_seconds = retry_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        self.cache.handle_notification(payload)
+
+    async def _listen(self) -> None:
+        while True:
+            connection = None
+
+            try:
+                connection = await asyncpg.connect(
+                    host=PG_DB_HOST,
+                    port=int(PG_DB_PORT),
+                    user=PG_DB_USER,
+                    password=PG_DB_PASSWORD,
+                    database=PG_DB_NAME,
+                )
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(CATALOG_CHANNEL, self._on_notification)
+
+                # Anything may have changed while we were not listening.
+                self.cache.clear()
+                await closed.wait()
+                logger.warning("Catalog listener connection closed")
+
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"Catalog listener failed: {e}")
+
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+
+            self.cache.clear()
+            await asyncio.sleep(self.retry_seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+
+catalog_cache = CatalogCache(
+    max_entries=int(CATALOG_CACHE_MAX_ENTRIES), ttl=float(CATALOG_CACHE_TTL_SECONDS)
+)
+catalog_listener = CatalogListener(
+    catalog_cache, retry_seconds=float(CATALOG_LISTENER_RETRY_SECONDS)
+)
@@ -0,0 +1,60 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Iterable, Optional, Tuple
+
+from fastapi import Request, Response, status
+
+
+def build_validators(
+    items: Iterable[Any], *extra: Any
+) -> Tuple[str, Optional[datetime]]:
+    digest = hashlib.sha1()
+    last_modified = None
+
+    for item in items:
+        updated_at = getattr(item, "updated_at", None)
+        digest.update(
+            f"{item.id}:{updated_at.isoformat() if updated_at else ''};".encode()
+        )
+
+        if updated_at and (last_modified is None or updated_at > last_modified):
+            last_modified = updated_at
+
+    digest.update(repr(extra).encode())
+    # Weak, because the compression middleware may send the same content as
+    # identity, gzip or br bytes under this one validator.
+    return f'W/"{digest.hexdigest()}"', last_modified
+
+
+def strip_weak(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison function (RFC 9110, 13.1.2).
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or strip_weak(etag) in map(strip_weak, candidates)
+
+
+def conditional_response(
+    request: Request, response: Response, items: Iterable[Any], *extra: Any
+) -> Optional[Response]:
+    etag, last_modified = build_validators(items, *extra)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+
+    response.headers.update(headers)
+
+    # The ETag also covers deletions, which a Last-Modified date cannot, so
+    # If-Modified-Since is not used for revalidation.
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return None
@@ -1,15 +1,37 @@
+from typing import Dict, Tuple
+
 from sqlalchemy.ext.asyncio.engine import create_async_engine
-from sqlmodel import SQLModel
 
-from bot.config import PG_DB_HOST, PG_DB_NAME, PG_DB_PASSWORD, PG_DB_PORT, PG_DB_USER
+from bot.config import (
+    API_WORKERS,
+    DB_MAX_CONNECTIONS,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_STATEMENT_CACHE_SIZE,
+    DB_STATEMENT_TIMEOUT_MS,
+    PG_DB_HOST,
+    PG_DB_NAME,
+    PG_DB_PASSWORD,
+    PG_DB_PORT,
+    PG_DB_USER,
+)
 
 from ..cart.models import Cart
 from ..company.models import Company
 from ..gastronomy.models import Kitchen
 from ..order.models import Order, OrderItem
 from ..product.models import Product
+from ..recommendation.models import (
+    ProductCoPurchase,
+    ProductPopularity,
+    UserProductScore,
+)
 from ..user.models import User
 from ..wishlist.models import Wishlist, WishlistItem
+from .migrations import is_schema_current, run_migrations
 
 Cart_model = Cart
 Company_model = Company
@@ -20,13 +42,72 @@ Wishlist_model = Wishlist
 WishlistItem_model = WishlistItem
 Order_model = Order
 OrderItem_model = OrderItem
+ProductPopularity_model = ProductPopularity
+ProductCoPurchase_model = ProductCoPurchase
+UserProductScore_model = UserProductScore
+
+SQLALCHEMY_DATABASE_URL = f"postgresql+asyncpg://{PG_DB_USER}:{PG_DB_PASSWORD}@{PG_DB_HOST}:{PG_DB_PORT}/{PG_DB_NAME}?prepared_statement_cache_size={int(DB_STATEMENT_CACHE_SIZE)}"
+
+
+def get_pool_limits() -> Tuple[int, int]:
+    # DB_MAX_CONNECTIONS is shared by all API workers. Each worker holds its
+    # pool (pool_size + max_overflow) plus one LISTEN connection for the
+    # catalog cache, so a worker gets DB_MAX_CONNECTIONS // API_WORKERS - 1.
+    budget = int(DB_MAX_CONNECTIONS) // int(API_WORKERS) - 1
+
+    if budget < 1:
+        raise RuntimeError(
+            f"DB_MAX_CONNECTIONS={DB_MAX_CONNECTIONS} is too small "
+            f"for API_WORKERS={API_WORKERS}"
+        )
+
+    pool_size = min(int(DB_POOL_SIZE), budget)
+    return pool_size, min(int(DB_MAX_OVERFLOW), budget - pool_size)
+
+
+pool_size, max_overflow = get_pool_limits()
 
-SQLALCHEMY_DATABASE_URL = f"postgresql+asyncpg://{PG_DB_USER}:{PG_DB_PASSWORD}@{PG_DB_HOST}:{PG_DB_PORT}/{PG_DB_NAME}"
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    pool_size=pool_size,
+    max_overflow=max_overflow,
+    pool_timeout=float(DB_POOL_TIMEOUT),
+    pool_recycle=int(DB_POOL_RECYCLE),
+    pool_pre_ping=DB_POOL_PRE_PING.lower() in ("1", "true", "yes"),
+    connect_args={
+        "statement_cache_size": int(DB_STATEMENT_CACHE_SIZE),
+        "server_settings": {"statement_timeout": str(int(DB_STATEMENT_TIMEOUT_MS))},
+    },
+)
 
-engine = create_async_engine(SQLALCHEMY_DATABASE_URL)
+
+_schema_ready = False
 
 
 async def create_db_and_tables() -> None:
+    global _schema_ready
+
+    if _schema_ready:
+        return
+
+    async with engine.connect() as conn:
+        if await is_schema_current(conn):
+            _schema_ready = True
+            return
+
     async with engine.begin() as conn:
         # await conn.run_sync(SQLModel.metadata.drop_all)
-        await conn.run_sync(SQLModel.metadata.create_all)
+        await run_migrations(conn)
+
+    _schema_ready = True
+
+
+def get_pool_status() -> Dict[str, int]:
+    pool = engine.pool
+
+    return {
+        "pool_size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
@@ -0,0 +1,170 @@
+from typing import Callable, List, Union
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlmodel import SQLModel
+
+SCHEMA_VERSION_TABLE = "schema_version"
+MIGRATIONS_LOCK_ID = 7_318_004
+
+MigrationStep = Union[str, Callable[[Connection], None]]
+
+
+class Migration:
+    def __init__(self, version: int, description: str, steps: List[MigrationStep]):
+        self.version = version
+        self.description = description
+        self.steps = steps
+
+
+def create_initial_schema(connection: Connection) -> None:
+    SQLModel.metadata.create_all(connection)
+
+
+def create_recommendation_tables(connection: Connection) -> None:
+    tables = ["product_popularity", "product_copurchase", "user_product_score"]
+    SQLModel.metadata.create_all(
+        connection, tables=[SQLModel.metadata.tables[name] for name in tables]
+    )
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Initial schema", [create_initial_schema]),
+    Migration(
+        2,
+        "Index hot lookup columns",
+        [
+            'CREATE INDEX IF NOT EXISTS ix_user_telegram_id ON "user" (telegram_id)',
+            "CREATE INDEX IF NOT EXISTS ix_product_company_id ON product (company_id)",
+            "CREATE INDEX IF NOT EXISTS ix_company_kitchen_id ON company (kitchen_id)",
+            "CREATE INDEX IF NOT EXISTS ix_cart_user_id ON cart (user_id)",
+            "CREATE INDEX IF NOT EXISTS ix_cartitem_cart_id_product_id "
+            "ON cartitem (cart_id, product_id)",
+            "CREATE INDEX IF NOT EXISTS ix_cartitem_product_id ON cartitem (product_id)",
+            "CREATE INDEX IF NOT EXISTS ix_wishlist_user_id ON wishlist (user_id)",
+            "CREATE INDEX IF NOT EXISTS ix_wishlistitem_wishlist_id_product_id "
+            "ON wishlistitem (wishlist_id, product_id)",
+            "CREATE INDEX IF NOT EXISTS ix_wishlistitem_product_id "
+            "ON wishlistitem (product_id)",
+            'CREATE INDEX IF NOT EXISTS ix_order_user_id_is_payed ON "order" '
+            "(user_id, is_payed)",
+            'CREATE INDEX IF NOT EXISTS ix_order_company_id ON "order" (company_id)',
+            "CREATE INDEX IF NOT EXISTS ix_order_item_order_id ON order_item (order_id)",
+        ],
+    ),
+    Migration(
+        3,
+        "Add order creation timestamp",
+        [
+            'ALTER TABLE "order" ADD COLUMN IF NOT EXISTS created_at '
+            "TIMESTAMPTZ NOT NULL DEFAULT now()",
+            'CREATE INDEX IF NOT EXISTS ix_order_created_at ON "order" (created_at)',
+        ],
+    ),
+    Migration(
+        4,
+        "Partial index on pending orders",
+        [
+            'CREATE INDEX IF NOT EXISTS ix_order_pending ON "order" (id) '
+            "WHERE is_payed AND NOT is_submitted",
+        ],
+    ),
+    Migration(
+        5,
+        "Precomputed recommendation tables",
+        [
+            create_recommendation_tables,
+            "INSERT INTO product_popularity (product_id, company_id, count) "
+            "SELECT product.id, product.company_id, sum(order_item.quantity) "
+            "FROM order_item JOIN product ON product.id = order_item.product_id "
+            "GROUP BY product.id, product.company_id "
+            "ON CONFLICT DO NOTHING",
+            "INSERT INTO product_copurchase (product_id, related_product_id, count) "
+            "SELECT a.product_id, b.product_id, count(DISTINCT a.order_id) "
+            "FROM order_item a JOIN order_item b "
+            "ON a.order_id = b.order_id AND a.product_id <> b.product_id "
+            "GROUP BY a.product_id, b.product_id "
+            "ON CONFLICT DO NOTHING",
+            "INSERT INTO user_product_score (user_id, product_id, score, purchased) "
+            'SELECT DISTINCT "order".user_id, order_item.product_id, 0, true '
+            'FROM order_item JOIN "order" ON "order".id = order_item.order_id '
+            "ON CONFLICT DO NOTHING",
+            "INSERT INTO user_product_score (user_id, product_id, score, purchased) "
+            "SELECT purchased.user_id, product_copurchase.related_product_id, "
+            "sum(product_copurchase.count), false "
+            "FROM user_product_score purchased JOIN product_copurchase "
+            "ON product_copurchase.product_id = purchased.product_id "
+            "GROUP BY purchased.user_id, product_copurchase.related_product_id "
+            "ON CONFLICT DO NOTHING",
+        ],
+    ),
+    Migration(
+        6,
+        "Add catalog update timestamps",
+        [
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS updated_at "
+            "TIMESTAMPTZ NOT NULL DEFAULT now()"
+            for table in ("product", "company", "kitchen")
+        ],
+    ),
+]
+
+LATEST_SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+async def get_applied_versions(conn: AsyncConnection) -> set[int]:
+    result = await conn.execute(text(f"SELECT version FROM {SCHEMA_VERSION_TABLE}"))
+    return set(result.scalars().all())
+
+
+async def is_schema_current(conn: AsyncConnection) -> bool:
+    try:
+        result = await conn.execute(
+            text(f"SELECT max(version) FROM {SCHEMA_VERSION_TABLE}")
+        )
+
+    except ProgrammingError:
+        return False
+
+    return (result.scalar() or 0) >= LATEST_SCHEMA_VERSION
+
+
+async def run_migrations(conn: AsyncConnection) -> List[int]:
+    await conn.execute(
+        text("SELECT pg_advisory_xact_lock(:lock_id)"),
+        {"lock_id": MIGRATIONS_LOCK_ID},
+    )
+    await conn.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} ("
+            "version INTEGER PRIMARY KEY, "
+            "description VARCHAR NOT NULL, "
+            "applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+        )
+    )
+
+    applied_versions = await get_applied_versions(conn)
+    newly_applied = []
+
+    for migration in MIGRATIONS:
+        if migration.version in applied_versions:
+            continue
+
+        for step in migration.steps:
+            if isinstance(step, str):
+                await conn.execute(text(step))
+            else:
+                await conn.run_sync(step)
+
+        await conn.execute(
+            text(
+                f"INSERT INTO {SCHEMA_VERSION_TABLE} (version, description) "
+                "VALUES (:version, :description)"
+            ),
+            {"version": migration.version, "description": migration.description},
+        )
+        newly_applied.append(migration.version)
+
+    return newly_applied
@@ -3,6 +3,12 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
+from ..common.catalog_cache import (
+    catalog_cache,
+    entity_key,
+    entity_keys,
+    list_key,
+)
 from ..common.dependencies import SessionDep
 from ..company.models import Company
 from ..company.schemas import (
@@ -12,7 +18,7 @@ from ..company.schemas import (
     CompanyResponse,
 )
 from ..product.crud import remove_product
-from ..utils import delete_file, get_entity_by_params, upload_file
+from ..utils import count_cache, delete_file, get_entity_by_params, upload_file
 
 COMPANY_NOT_FOUND = "Company not found"
 
@@ -50,7 +56,13 @@ async def create_company(
         db_company.image_id = image_data.get("image_id")
         db_company.image_link = image_data.get("url")
 
+        keys = entity_keys(
+            Company.__tablename__, db_company.id, [db_company.kitchen_id]
+        )
+        await catalog_cache.publish(session, keys)
         await session.commit()
+        count_cache.invalidate(Company)
+        catalog_cache.invalidate(keys)
 
     except GeneralError:
         await session.rollback()
@@ -69,33 +81,67 @@ async def get_all_companies(
     page: int = 1,
     limit: int = 6,
     kitchen_id: int = None,
+    cursor: str = None,
+    use_cursor: bool = False,
 ) -> CompanyListResponse:
-    result = await get_entity_by_params(
-        session,
-        Company,
-        page=page,
-        limit=limit,
-        kitchen_id=kitchen_id,
-        return_all=True,
-        with_total_pages=True,
-    )
+    async def load() -> CompanyListResponse:
+        if use_cursor or cursor:
+            companies, total_pages, next_cursor, prev_cursor = (
+                await get_entity_by_params(
+                    session,
+                    Company,
+                    limit=limit,
+                    kitchen_id=kitchen_id,
+                    return_all=True,
+                    use_cursor=True,
+                    cursor=cursor,
+                )
+            )
 
-    companies, total_pages = result
+            return CompanyListResponse(
+                companys=companies,
+                total_pages=total_pages,
+                next_cursor=next_cursor,
+                prev_cursor=prev_cursor,
+            )
 
-    return CompanyListResponse(companys=companies, total_pages=total_pages)
+        companies, total_pages = await get_entity_by_params(
+            session,
+            Company,
+            page=page,
+            limit=limit,
+            kitchen_id=kitchen_id,
+            return_all=True,
+            with_total_pages=True,
+            order_by="id",
+        )
+
+        return CompanyListResponse(companys=companies, total_pages=total_pages)
+
+    page_key = ("cursor", cursor, limit) if use_cursor or cursor else (page, limit)
+    return await catalog_cache.get_or_load_page(
+        list_key(Company.__tablename__, kitchen_id), page_key, load
+    )
 
 
 async def get_company_by_id(session: SessionDep, company_id: int) -> CompanyResponse:
-    statement = select(Company).filter(Company.id == company_id)
-    result = await session.exec(statement)
-    db_company = result.first()
+    async def load() -> CompanyResponse:
+        statement = select(Company).filter(Company.id == company_id)
+        result = await session.exec(statement)
+        db_company = result.first()
+
+        return CompanyResponse.model_validate(db_company) if db_company else None
+
+    company = await catalog_cache.get_or_load(
+        entity_key(Company.__tablename__, company_id), load
+    )
 
-    if not db_company:
+    if not company:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=COMPANY_NOT_FOUND
         )
 
-    return db_company
+    return company
 
 
 async def update_company(
@@ -126,6 +172,7 @@ async def update_company(
         existing_company.image_id = image_data.get("image_id")
         existing_company.image_link = image_data.get("url")
 
+    previous_kitchen_id = existing_company.kitchen_id
     update_data = {
         k: v
         for k, v in company.model_dump(exclude_unset=True, exclude={"image"}).items()
@@ -134,8 +181,16 @@ async def update_company(
     for key, value in update_data.items():
         setattr(existing_company, key, value)
 
+    keys = entity_keys(
+        Company.__tablename__,
+        existing_company.id,
+        [previous_kitchen_id, existing_company.kitchen_id],
+    )
     await session.merge(existing_company)
+    await catalog_cache.publish(session, keys)
     await session.commit()
+    count_cache.invalidate(Company)
+    catalog_cache.invalidate(keys)
     await session.refresh(existing_company)
 
     return existing_company
@@ -163,9 +218,16 @@ async def remove_company(session: SessionDep, company_id: int):
             detail="The image could not be deleted",
         )
 
+    keys = entity_keys(
+        Company.__tablename__, existing_company.id, [existing_company.kitchen_id]
+    )
+
     if existing_company.products:
         for product in existing_company.products:
             await remove_product(session, product.id)
 
     await session.delete(existing_company)
+    await catalog_cache.publish(session, keys)
     await session.commit()
+    count_cache.invalidate(Company)
+    catalog_cache.invalidate(keys)
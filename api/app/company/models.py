@@ -1,5 +1,7 @@
+from datetime import datetime, timezone
 from typing import List, Optional
 
+from sqlalchemy import Column, DateTime, func
 from sqlmodel import Field, Relationship
 
 from ..company.schemas import CompanyBase
@@ -8,6 +10,15 @@ from ..gastronomy.models import Kitchen
 
 class Company(CompanyBase, table=True):
     id: int | None = Field(default=None, primary_key=True)
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            DateTime(timezone=True),
+            server_default=func.now(),
+            onupdate=func.now(),
+            nullable=False,
+        ),
+    )
 
     kitchen: Optional[Kitchen] = Relationship(back_populates="companies")
     products: List["Product"] = Relationship(back_populates="company")  # type: ignore
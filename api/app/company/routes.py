@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
+from ..common.conditional import conditional_response
 from ..common.dependencies import SessionDep
 from ..company.crud import (
     create_company,
@@ -21,20 +22,43 @@ router = APIRouter()
 
 @router.get("/")
 async def company_list(
+    request: Request,
+    response: Response,
     session: SessionDep,
-    page: int = 1,
-    limit: int = 6,
+    page: int = Query(1, ge=1),
+    limit: int = Query(6, ge=1),
     kitchen_id: int | None = None,
+    cursor: str | None = None,
+    use_cursor: bool = False,
 ) -> CompanyListResponse:
 
-    return await get_all_companies(
-        session=session, page=page, limit=limit, kitchen_id=kitchen_id
+    companies = await get_all_companies(
+        session=session,
+        page=page,
+        limit=limit,
+        kitchen_id=kitchen_id,
+        cursor=cursor,
+        use_cursor=use_cursor,
+    )
+
+    return (
+        conditional_response(
+            request,
+            response,
+            companies.companys,
+            companies.total_pages,
+            companies.next_cursor,
+            companies.prev_cursor,
+        )
+        or companies
     )
 
 
 @router.get("/{company_id}/")
 async def company_detail(
     company_id: int,
+    request: Request,
+    response: Response,
     session: SessionDep,
 ) -> CompanyResponse:
     """
@@ -48,7 +72,9 @@ async def company_detail(
         CompanyResponse: The retrieved company.
     """
 
-    return await get_company_by_id(session=session, company_id=company_id)
+    company = await get_company_by_id(session=session, company_id=company_id)
+
+    return conditional_response(request, response, [company]) or company
 
 
 @router.post("/")
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 
 from fastapi import File, Form, UploadFile
@@ -14,16 +15,19 @@ class CompanyBase(SQLModel):
     image_link: str = Field(max_length=255, default="in progress", nullable=True)
     image_id: str = Field(max_length=255, default="in progress", nullable=True)
 
-    kitchen_id: int = Field(foreign_key="kitchen.id")
+    kitchen_id: int = Field(foreign_key="kitchen.id", index=True)
 
 
 class CompanyResponse(CompanyBase):
     id: int
+    updated_at: Optional[datetime] = None
 
 
 class CompanyListResponse(SQLModel):
     companys: list[CompanyResponse]
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
 
 class CompanyCreate(SQLModel):
@@ -5,17 +5,22 @@ from .service import CuisineCRUDService
 
 kitchen_service = CuisineCRUDService[
     Kitchen, KitchenCreate, KitchenUpdate, KitchenResponse
-](Kitchen)
+](Kitchen, KitchenResponse)
 
 
 async def get_all_kitchens(
     session: SessionDep,
     page: int = 1,
     limit: int = 6,
+    cursor: str = None,
+    use_cursor: bool = False,
 ) -> KitchenListResponse:
-    result = await kitchen_service.get_all(session, page, limit)
+    result = await kitchen_service.get_all(session, page, limit, cursor, use_cursor)
     return KitchenListResponse(
-        kitchens=result["items"], total_pages=result["total_pages"]
+        kitchens=result["items"],
+        total_pages=result["total_pages"],
+        next_cursor=result.get("next_cursor"),
+        prev_cursor=result.get("prev_cursor"),
     )
 
 
@@ -1,5 +1,7 @@
+from datetime import datetime, timezone
 from typing import List
 
+from sqlalchemy import Column, DateTime, func
 from sqlmodel import Field, Relationship
 
 from ..gastronomy.schemas import KitchenBase
@@ -7,5 +9,14 @@ from ..gastronomy.schemas import KitchenBase
 
 class Kitchen(KitchenBase, table=True):
     id: int | None = Field(default=None, primary_key=True)
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            DateTime(timezone=True),
+            server_default=func.now(),
+            onupdate=func.now(),
+            nullable=False,
+        ),
+    )
 
     companies: List["Company"] = Relationship(back_populates="kitchen")  # type: ignore
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
+from ..common.conditional import conditional_response
 from ..common.dependencies import SessionDep
 from ..gastronomy.crud import (
     create_kitchen,
@@ -21,12 +22,34 @@ router = APIRouter()
 
 @router.get("/kitchens/", response_model=KitchenListResponse)
 async def get_kitchens(
+    request: Request,
+    response: Response,
     session: SessionDep,
-    page: int = 1,
-    limit: int = 6,
+    page: int = Query(1, ge=1),
+    limit: int = Query(6, ge=1),
+    cursor: str | None = None,
+    use_cursor: bool = False,
 ) -> KitchenListResponse:
 
-    return await get_all_kitchens(session=session, page=page, limit=limit)
+    kitchens = await get_all_kitchens(
+        session=session,
+        page=page,
+        limit=limit,
+        cursor=cursor,
+        use_cursor=use_cursor,
+    )
+
+    return (
+        conditional_response(
+            request,
+            response,
+            kitchens.kitchens,
+            kitchens.total_pages,
+            kitchens.next_cursor,
+            kitchens.prev_cursor,
+        )
+        or kitchens
+    )
 
 
 @router.post("/kitchens/", response_model=KitchenResponse)
@@ -41,11 +64,14 @@ async def post_kitchen(
 
 @router.get("/kitchens/{kitchen_id}/", response_model=KitchenResponse)
 async def get_kitchen(
+    request: Request,
+    response: Response,
     session: SessionDep,
     kitchen_id: int,
 ) -> KitchenResponse:
+    kitchen = await get_kitchen_by_id(session=session, kitchen_id=kitchen_id)
 
-    return await get_kitchen_by_id(session=session, kitchen_id=kitchen_id)
+    return conditional_response(request, response, [kitchen]) or kitchen
 
 
 @router.patch("/kitchens/{kitchen_id}/", response_model=KitchenResponse)
@@ -1,4 +1,5 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
 from sqlmodel import SQLModel
 
@@ -10,6 +11,7 @@ class KitchenBase(SQLModel):
 
 class KitchenResponse(KitchenBase):
     id: int
+    updated_at: Optional[datetime] = None
 
 
 class KitchenCreate(KitchenBase):
@@ -22,4 +24,6 @@ class KitchenUpdate(KitchenBase):
 
 class KitchenListResponse(SQLModel):
     kitchens: List[KitchenResponse]
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
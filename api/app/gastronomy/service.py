@@ -1,9 +1,20 @@
 from typing import Generic, TypeVar
 
 from fastapi import HTTPException, status
-from sqlmodel import SQLModel, func, select
-
+from sqlmodel import SQLModel, select
+
+from ..common.catalog_cache import (
+    catalog_cache,
+    entity_key,
+    entity_keys,
+    list_key,
+)
 from ..common.dependencies import SessionDep
+from ..utils import (
+    count_cache,
+    get_entity_by_params,
+    get_entity_page_with_total,
+)
 
 ModelType = TypeVar("ModelType", bound=SQLModel)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=SQLModel)
@@ -14,8 +25,12 @@ ResponseSchemaType = TypeVar("ResponseSchemaType", bound=SQLModel)
 class CuisineCRUDService(
     Generic[ModelType, CreateSchemaType, UpdateSchemaType, ResponseSchemaType]
 ):
-    def __init__(self, model: type[ModelType]):
+    def __init__(
+        self, model: type[ModelType], response_model: type[ResponseSchemaType]
+    ):
         self.model = model
+        self.response_model = response_model
+        self.table_name = model.__tablename__
 
     async def create(
         self, session: SessionDep, obj_in: CreateSchemaType
@@ -38,27 +53,72 @@ class CuisineCRUDService(
             setattr(db_obj, key, value)
 
         session.add(db_obj)
+        await session.flush()
+
+        keys = entity_keys(self.table_name, db_obj.id)
+        await catalog_cache.publish(session, keys)
         await session.commit()
+        count_cache.invalidate(self.model)
+        catalog_cache.invalidate(keys)
         await session.refresh(db_obj)
 
         return db_obj
 
-    async def get_all(self, session: SessionDep, page: int = 1, limit: int = 6) -> dict:
-        statement = select(func.count()).select_from(self.model)
-        result = await session.exec(statement)
-        total_records = result.one()
-        total_pages = (total_records + limit - 1) // limit
+    async def get_all(
+        self,
+        session: SessionDep,
+        page: int = 1,
+        limit: int = 6,
+        cursor: str = None,
+        use_cursor: bool = False,
+    ) -> dict:
+        async def load() -> dict:
+            if use_cursor or cursor:
+                items, total_pages, next_cursor, prev_cursor = (
+                    await get_entity_by_params(
+                        session,
+                        self.model,
+                        limit=limit,
+                        return_all=True,
+                        use_cursor=True,
+                        cursor=cursor,
+                    )
+                )
+
+                return {
+                    "items": [self.response_model.model_validate(i) for i in items],
+                    "total_pages": total_pages,
+                    "next_cursor": next_cursor,
+                    "prev_cursor": prev_cursor,
+                }
+
+            items, total_pages = await get_entity_page_with_total(
+                session,
+                self.model,
+                limit=limit,
+                page=page,
+                order_by="id",
+            )
 
-        statement = select(self.model).limit(limit).offset((page - 1) * limit)
-        result = await session.exec(statement)
-        items = result.all()
+            return {
+                "items": [self.response_model.model_validate(i) for i in items],
+                "total_pages": total_pages,
+            }
 
-        return {"items": items, "total_pages": total_pages}
+        page_key = ("cursor", cursor, limit) if use_cursor or cursor else (page, limit)
+        return await catalog_cache.get_or_load_page(
+            list_key(self.table_name), page_key, load
+        )
 
     async def get_by_id(self, session: SessionDep, obj_id: int) -> ResponseSchemaType:
-        statement = select(self.model).filter(self.model.id == obj_id)
-        result = await session.exec(statement)
-        obj = result.first()
+        async def load() -> ResponseSchemaType:
+            statement = select(self.model).filter(self.model.id == obj_id)
+            result = await session.exec(statement)
+            obj = result.first()
+
+            return self.response_model.model_validate(obj) if obj else None
+
+        obj = await catalog_cache.get_or_load(entity_key(self.table_name, obj_id), load)
 
         if not obj:
             raise HTTPException(
@@ -87,8 +147,12 @@ class CuisineCRUDService(
             if value:
                 setattr(existing_obj, key, value)
 
+        keys = entity_keys(self.table_name, existing_obj.id)
         await session.merge(existing_obj)
+        await catalog_cache.publish(session, keys)
         await session.commit()
+        count_cache.invalidate(self.model)
+        catalog_cache.invalidate(keys)
         await session.refresh(existing_obj)
         return existing_obj
 
@@ -103,5 +167,9 @@ class CuisineCRUDService(
                 detail=f"{self.model.__name__} not found",
             )
 
+        keys = entity_keys(self.table_name, existing_obj.id)
         await session.delete(existing_obj)
+        await catalog_cache.publish(session, keys)
         await session.commit()
+        count_cache.invalidate(self.model)
+        catalog_cache.invalidate(keys)
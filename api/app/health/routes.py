@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Response, status
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..common.database import get_pool_status
+from ..common.dependencies import SessionDep
+from .schemas import DatabaseHealthResponse
+
+router = APIRouter()
+
+
+@router.get("/db/")
+async def database_health(
+    session: SessionDep, response: Response
+) -> DatabaseHealthResponse:
+    try:
+        await session.scalar(text("SELECT 1"))
+        db_status = "ok"
+
+    except (SQLAlchemyError, OSError):
+        db_status = "unavailable"
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return DatabaseHealthResponse(status=db_status, **get_pool_status())
@@ -0,0 +1,9 @@
+from sqlmodel import SQLModel
+
+
+class DatabaseHealthResponse(SQLModel):
+    status: str
+    pool_size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
@@ -1,9 +1,22 @@
+import math
+
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import select
+
 from ..cart.models import Cart
 from ..common.dependencies import SessionDep
 from ..product.models import Product
-from ..utils import get_entity_by_params
+from ..recommendation.crud import record_order_for_recommendations
+from ..utils import get_entity_by_params, get_entity_page_by_cursor
 from .models import Order, OrderItem
-from .schemas import OrderCreate
+from .schemas import (
+    OrderCountResponse,
+    OrderCreate,
+    OrderFilters,
+    OrderListResponse,
+    OrderSummaryListResponse,
+)
 
 
 async def create_order(
@@ -28,12 +41,19 @@ async def create_order(
     session.add(order)
     await session.flush()
 
+    quantities = {}
+
     for item in order_create.order_items:
         order_item = OrderItem(
             **item.model_dump(),
             order_id=order.id,
         )
         session.add(order_item)
+        quantities[item.product_id] = quantities.get(item.product_id, 0) + item.quantity
+
+    await record_order_for_recommendations(
+        session, user_id, product.company_id, quantities
+    )
 
     cart = await get_entity_by_params(session, Cart, user_id=user_id)
 
@@ -47,3 +67,100 @@ async def create_order(
         id=order.id,
         user_id=user_id,
     )
+
+
+ORDER_DETAIL_OPTIONS = [
+    selectinload(Order.order_items).selectinload(OrderItem.product),
+    joinedload(Order.user),
+    joinedload(Order.company),
+]
+
+
+async def get_orders_page(
+    session: SessionDep,
+    filters: OrderFilters = None,
+    page: int = 1,
+    limit: int = 10,
+    cursor: str = None,
+    use_cursor: bool = False,
+    summary: bool = False,
+    **params,
+) -> OrderListResponse | OrderSummaryListResponse:
+    params = {**(filters.to_params() if filters else {}), **params}
+    options = None if summary else ORDER_DETAIL_OPTIONS
+    response_class = OrderSummaryListResponse if summary else OrderListResponse
+
+    if use_cursor or cursor:
+        orders, total_pages, next_cursor, prev_cursor = await get_entity_by_params(
+            session,
+            Order,
+            limit=limit,
+            return_all=True,
+            use_cursor=True,
+            cursor=cursor,
+            options=options,
+            **params,
+        )
+
+        return response_class(
+            orders=orders,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+
+    orders, total_pages = await get_entity_by_params(
+        session,
+        Order,
+        page=page,
+        limit=limit,
+        order_by="id",
+        with_total_pages=True,
+        return_all=True,
+        options=options,
+        **params,
+    )
+
+    return response_class(orders=orders, total_pages=total_pages)
+
+
+async def get_pending_orders(
+    session: SessionDep,
+    page: int = 1,
+    limit: int = 10,
+    cursor: str = None,
+    use_cursor: bool = False,
+) -> OrderListResponse:
+    statement = (
+        select(Order)
+        .where(Order.is_payed, ~Order.is_submitted)
+        .options(*ORDER_DETAIL_OPTIONS)
+    )
+
+    if use_cursor or cursor:
+        orders, next_cursor, prev_cursor = await get_entity_page_by_cursor(
+            session, statement, Order, limit=limit, cursor=cursor
+        )
+
+        return OrderListResponse(
+            orders=orders, next_cursor=next_cursor, prev_cursor=prev_cursor
+        )
+
+    pending = await count_pending_orders(session)
+    result = await session.exec(
+        statement.order_by(Order.id).limit(limit).offset((page - 1) * limit)
+    )
+
+    return OrderListResponse(
+        orders=result.unique().all(), total_pages=math.ceil(pending.count / limit)
+    )
+
+
+async def count_pending_orders(session: SessionDep) -> OrderCountResponse:
+    count = await session.scalar(
+        select(func.count())
+        .select_from(Order)
+        .where(Order.is_payed, ~Order.is_submitted)
+    )
+
+    return OrderCountResponse(count=count)
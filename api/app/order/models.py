@@ -1,5 +1,7 @@
+from datetime import datetime, timezone
 from typing import List, Optional
 
+from sqlalchemy import Column, DateTime, Index, func, text
 from sqlmodel import Field, Relationship
 
 from ..company.models import Company
@@ -10,14 +12,31 @@ from .schemas import OrderBase, OrderItemBase
 
 class Order(OrderBase, table=True):
     __tablename__ = "order"
+    __table_args__ = (
+        Index("ix_order_user_id_is_payed", "user_id", "is_payed"),
+        Index(
+            "ix_order_pending",
+            "id",
+            postgresql_where=text("is_payed AND NOT is_submitted"),
+        ),
+    )
 
     id: int = Field(default=None, primary_key=True)
     is_payed: bool = Field(default=False)
     is_submitted: bool = Field(default=False)
     is_pay_on_delivery: bool = Field(default=False)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            DateTime(timezone=True),
+            server_default=func.now(),
+            nullable=False,
+            index=True,
+        ),
+    )
 
     user_id: int = Field(foreign_key="user.id")
-    company_id: int = Field(foreign_key="company.id")
+    company_id: int = Field(foreign_key="company.id", index=True)
 
     order_items: List["OrderItem"] = Relationship(back_populates="order")
     user: Optional[User] = Relationship(back_populates="orders")  # type: ignore
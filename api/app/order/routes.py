@@ -1,15 +1,29 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from bot.config import ORDER_PAGE_MAX_LIMIT, ORDER_SUMMARY_MAX_LIMIT
 
 from ..common.dependencies import SessionDep
 from ..user.crud import get_current_user, is_admin
 from ..user.models import User
 from ..utils import get_entity_by_params
-from .crud import create_order
-from .models import Order, OrderItem
-from .schemas import OrderCreate, OrderResponse
+from .crud import (
+    ORDER_DETAIL_OPTIONS,
+    count_pending_orders,
+    create_order,
+    get_orders_page,
+    get_pending_orders,
+)
+from .models import Order
+from .schemas import (
+    OrderCountResponse,
+    OrderCreate,
+    OrderFilters,
+    OrderListResponse,
+    OrderResponse,
+    OrderSummaryListResponse,
+)
 
 router = APIRouter()
 
@@ -68,17 +82,20 @@ async def accept_order(
 @router.get("/")
 async def get_order(
     session: SessionDep,
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=int(ORDER_PAGE_MAX_LIMIT)),
+    cursor: str | None = None,
+    use_cursor: bool = False,
+    filters: OrderFilters = Depends(OrderFilters.as_query),
     _: User = Depends(get_current_user),
-) -> List[OrderResponse]:
-    return await get_entity_by_params(
-        session,
-        Order,
-        options=[
-            joinedload(Order.order_items).joinedload(OrderItem.product),
-            joinedload(Order.user),
-            joinedload(Order.company),
-        ],
-        return_all=True,
+) -> OrderListResponse:
+    return await get_orders_page(
+        session=session,
+        filters=filters,
+        page=page,
+        limit=limit,
+        cursor=cursor,
+        use_cursor=use_cursor,
     )
 
 
@@ -93,26 +110,72 @@ async def get_paid_orders(
         user_id=current_user.id,
         is_payed=True,
         return_all=True,
-        options=[
-            joinedload(Order.order_items).joinedload(OrderItem.product),
-            joinedload(Order.user),
-            joinedload(Order.company),
-        ],
+        options=ORDER_DETAIL_OPTIONS,
     )
 
 
 @router.get("/admin/")
 async def get_all_orders(
     session: SessionDep,
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=int(ORDER_PAGE_MAX_LIMIT)),
+    cursor: str | None = None,
+    use_cursor: bool = False,
+    filters: OrderFilters = Depends(OrderFilters.as_query),
     _: User = Depends(is_admin),
-) -> List[OrderResponse]:
-    return await get_entity_by_params(
-        session,
-        Order,
-        return_all=True,
-        options=[
-            joinedload(Order.order_items).joinedload(OrderItem.product),
-            joinedload(Order.user),
-            joinedload(Order.company),
-        ],
+) -> OrderListResponse:
+    return await get_orders_page(
+        session=session,
+        filters=filters,
+        page=page,
+        limit=limit,
+        cursor=cursor,
+        use_cursor=use_cursor,
     )
+
+
+@router.get("/admin/summary/")
+async def get_orders_summary(
+    session: SessionDep,
+    page: int = Query(1, ge=1),
+    limit: int = Query(50, ge=1, le=int(ORDER_SUMMARY_MAX_LIMIT)),
+    cursor: str | None = None,
+    use_cursor: bool = False,
+    filters: OrderFilters = Depends(OrderFilters.as_query),
+    _: User = Depends(is_admin),
+) -> OrderSummaryListResponse:
+    return await get_orders_page(
+        session=session,
+        filters=filters,
+        page=page,
+        limit=limit,
+        cursor=cursor,
+        use_cursor=use_cursor,
+        summary=True,
+    )
+
+
+@router.get("/admin/pending/")
+async def get_admin_pending_orders(
+    session: SessionDep,
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=int(ORDER_PAGE_MAX_LIMIT)),
+    cursor: str | None = None,
+    use_cursor: bool = False,
+    _: User = Depends(is_admin),
+) -> OrderListResponse:
+    return await get_pending_orders(
+        session=session,
+        page=page,
+        limit=limit,
+        cursor=cursor,
+        use_cursor=use_cursor,
+    )
+
+
+@router.get("/admin/pending/count/")
+async def get_admin_pending_orders_count(
+    session: SessionDep,
+    _: User = Depends(is_admin),
+) -> OrderCountResponse:
+    return await count_pending_orders(session=session)
@@ -1,5 +1,7 @@
+from datetime import datetime
 from typing import List, Optional
 
+from fastapi import Query
 from sqlmodel import Field, SQLModel
 
 from ..company.models import Company
@@ -20,13 +22,76 @@ class OrderCreate(OrderBase):
 class OrderResponse(OrderBase):
     id: int
     is_submitted: bool = False
+    created_at: Optional[datetime] = None
     order_items: List["OrderItemResponse"] = []
     user: User = None
     company: Company = None
 
 
+class OrderListResponse(SQLModel):
+    orders: List[OrderResponse]
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+class OrderSummaryResponse(OrderBase):
+    id: int
+    user_id: int
+    company_id: int
+    is_payed: bool = False
+    is_submitted: bool = False
+    is_pay_on_delivery: bool = False
+    created_at: Optional[datetime] = None
+
+
+class OrderSummaryListResponse(SQLModel):
+    orders: List[OrderSummaryResponse]
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+class OrderCountResponse(SQLModel):
+    count: int
+
+
+class OrderFilters(SQLModel):
+    is_payed: Optional[bool] = None
+    is_submitted: Optional[bool] = None
+    company_id: Optional[int] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+    @classmethod
+    def as_query(
+        cls,
+        is_payed: Optional[bool] = Query(None),
+        is_submitted: Optional[bool] = Query(None),
+        company_id: Optional[int] = Query(None),
+        created_from: Optional[datetime] = Query(None),
+        created_to: Optional[datetime] = Query(None),
+    ):
+        return cls(
+            is_payed=is_payed,
+            is_submitted=is_submitted,
+            company_id=company_id,
+            created_from=created_from,
+            created_to=created_to,
+        )
+
+    def to_params(self) -> dict:
+        return {
+            "is_payed": self.is_payed,
+            "is_submitted": self.is_submitted,
+            "company_id": self.company_id,
+            "created_at__gte": self.created_from,
+            "created_at__lte": self.created_to,
+        }
+
+
 class OrderItemBase(SQLModel):
-    order_id: int = Field(foreign_key="order.id")
+    order_id: int = Field(foreign_key="order.id", index=True)
     product_id: int = Field(foreign_key="product.id")
     quantity: int
 
@@ -1,16 +1,23 @@
-import random
-
 from cloudinary.exceptions import GeneralError
 from fastapi import HTTPException, status
-from sqlalchemy.orm import joinedload
 from sqlmodel import select
 
+from ..common.catalog_cache import (
+    catalog_cache,
+    entity_key,
+    entity_keys,
+    list_key,
+)
 from ..common.dependencies import SessionDep
-from ..company.models import Company
 from ..product.models import Product
 from ..product.schemas import ProductCreate, ProductListResponse, ProductResponse
-from ..user.models import User
-from ..utils import delete_file, get_entity_by_params, upload_file
+from ..utils import (
+    count_cache,
+    delete_file,
+    get_entity_by_params,
+    random_id_pool,
+    upload_file,
+)
 
 PRODUCT_NOT_FOUND = "Product not found"
 
@@ -48,7 +55,14 @@ async def create_product(
         db_product.image_id = image_data.get("image_id")
         db_product.image_link = image_data.get("url")
 
+        keys = entity_keys(
+            Product.__tablename__, db_product.id, [db_product.company_id]
+        )
+        await catalog_cache.publish(session, keys)
         await session.commit()
+        count_cache.invalidate(Product)
+        random_id_pool.invalidate(Product)
+        catalog_cache.invalidate(keys)
     except GeneralError:
         await session.rollback()
 
@@ -66,31 +80,67 @@ async def get_all_products(
     page: int = 1,
     limit: int = 10,
     company_id: int = None,
+    cursor: str = None,
+    use_cursor: bool = False,
 ) -> ProductListResponse:
-    products, total_pages = await get_entity_by_params(
-        session,
-        Product,
-        page=page,
-        limit=limit,
-        company_id=company_id,
-        return_all=True,
-        with_total_pages=True,
-    )
+    async def load() -> ProductListResponse:
+        if use_cursor or cursor:
+            products, total_pages, next_cursor, prev_cursor = (
+                await get_entity_by_params(
+                    session,
+                    Product,
+                    limit=limit,
+                    company_id=company_id,
+                    return_all=True,
+                    use_cursor=True,
+                    cursor=cursor,
+                )
+            )
 
-    return ProductListResponse(products=products, total_pages=total_pages)
+            return ProductListResponse(
+                products=products,
+                total_pages=total_pages,
+                next_cursor=next_cursor,
+                prev_cursor=prev_cursor,
+            )
+
+        products, total_pages = await get_entity_by_params(
+            session,
+            Product,
+            page=page,
+            limit=limit,
+            company_id=company_id,
+            return_all=True,
+            with_total_pages=True,
+            order_by="id",
+        )
+
+        return ProductListResponse(products=products, total_pages=total_pages)
+
+    page_key = ("cursor", cursor, limit) if use_cursor or cursor else (page, limit)
+    return await catalog_cache.get_or_load_page(
+        list_key(Product.__tablename__, company_id), page_key, load
+    )
 
 
 async def get_product_by_id(session: SessionDep, product_id: int) -> ProductResponse:
-    statement = select(Product).filter(Product.id == product_id)
-    result = await session.exec(statement)
-    db_product = result.first()
+    async def load() -> ProductResponse:
+        statement = select(Product).filter(Product.id == product_id)
+        result = await session.exec(statement)
+        db_product = result.first()
 
-    if not db_product:
+        return ProductResponse.model_validate(db_product) if db_product else None
+
+    product = await catalog_cache.get_or_load(
+        entity_key(Product.__tablename__, product_id), load
+    )
+
+    if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=PRODUCT_NOT_FOUND
         )
 
-    return db_product
+    return product
 
 
 async def update_product(
@@ -123,6 +173,7 @@ async def update_product(
         existing_product.image_link = image_data.get("url")
         existing_product.image_id = image_data.get("image_id")
 
+    previous_company_id = existing_product.company_id
     update_data = {
         k: v
         for k, v in product.model_dump(exclude_unset=True, exclude={"image"}).items()
@@ -131,8 +182,17 @@ async def update_product(
     for key, value in update_data.items():
         setattr(existing_product, key, value)
 
+    keys = entity_keys(
+        Product.__tablename__,
+        existing_product.id,
+        [previous_company_id, existing_product.company_id],
+    )
     await session.merge(existing_product)
+    await catalog_cache.publish(session, keys)
     await session.commit()
+    count_cache.invalidate(Product)
+    random_id_pool.invalidate(Product)
+    catalog_cache.invalidate(keys)
     await session.refresh(existing_product)
 
     return existing_product
@@ -156,108 +216,12 @@ async def remove_product(session: SessionDep, product_id: int):
             detail="The image could not be deleted",
         )
 
+    keys = entity_keys(
+        Product.__tablename__, existing_product.id, [existing_product.company_id]
+    )
     await session.delete(existing_product)
+    await catalog_cache.publish(session, keys)
     await session.commit()
-
-
-async def get_product_recommendations(
-    session: SessionDep,
-    user: User,
-) -> ProductListResponse:
-    if not user.orders:
-        companies = await get_entity_by_params(
-            session,
-            Company,
-            return_all=True,
-        )
-        companies_ids = [company.id for company in companies]
-
-        if not companies_ids:
-            return ProductListResponse(products=[], total_pages=1)
-
-        target_company_id = random.choice(companies_ids)
-
-        products = await get_entity_by_params(
-            session,
-            Product,
-            return_all=True,
-            filters={"company_id": target_company_id},
-        )
-
-        random_products = random.sample(products, min(2, len(products)))
-        products_result = [
-            ProductResponse(
-                **product.model_dump(),
-                company_name_en=product.company.title_en,
-                company_name_ua=product.company.title_ua,
-            )
-            for product in random_products
-        ]
-
-        return ProductListResponse(products=products_result, total_pages=1)
-
-    else:
-        order_company_ids = list(set(order.company_id for order in user.orders))
-        target_company_id = random.choice(order_company_ids)
-
-        used_product_ids = set(
-            item.product_id for order in user.orders for item in order.order_items
-        )
-
-        all_products = await get_entity_by_params(
-            session,
-            Product,
-            return_all=True,
-            company_id=target_company_id,
-            options=[joinedload(Product.company)],
-        )
-
-        available_products = [
-            product for product in all_products if product.id not in used_product_ids
-        ]
-
-        if not available_products:
-            companies = await get_entity_by_params(
-                session,
-                Company,
-                return_all=True,
-            )
-            companies_ids = [company.id for company in companies]
-
-            if not companies_ids:
-                return ProductListResponse(products=[], total_pages=1)
-
-            target_company_id = random.choice(companies_ids)
-
-            products = await get_entity_by_params(
-                session,
-                Product,
-                return_all=True,
-                filters={"company_id": target_company_id},
-            )
-
-            random_products = random.sample(products, min(2, len(products)))
-
-            products_result = [
-                ProductResponse(
-                    **product.model_dump(),
-                    company_name_en=product.company.title_en,
-                    company_name_ua=product.company.title_ua,
-                )
-                for product in random_products
-            ]
-            return ProductListResponse(products=products_result, total_pages=1)
-
-        random_products = random.sample(
-            available_products, min(2, len(available_products))
-        )
-
-        products_result = [
-            ProductResponse(
-                **product.model_dump(),
-                company_name_en=product.company.title_en,
-                company_name_ua=product.company.title_ua,
-            )
-            for product in random_products
-        ]
-        return ProductListResponse(products=products_result, total_pages=1)
+    count_cache.invalidate(Product)
+    random_id_pool.invalidate(Product)
+    catalog_cache.invalidate(keys)
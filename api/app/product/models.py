@@ -1,5 +1,7 @@
+from datetime import datetime, timezone
 from typing import List, Optional
 
+from sqlalchemy import Column, DateTime, func
 from sqlmodel import Field, Relationship
 
 from ..company.models import Company
@@ -8,6 +10,15 @@ from ..product.schemas import ProductBase
 
 class Product(ProductBase, table=True):
     id: int | None = Field(default=None, primary_key=True)
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            DateTime(timezone=True),
+            server_default=func.now(),
+            onupdate=func.now(),
+            nullable=False,
+        ),
+    )
 
     company: Optional[Company] = Relationship(back_populates="products")
     cart_items: List["CartItem"] = Relationship(back_populates="product")  # type: ignore
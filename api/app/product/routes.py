@@ -1,42 +1,57 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import joinedload
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
+from ..common.conditional import conditional_response
 from ..common.dependencies import SessionDep
-from ..order.models import Order, OrderItem
 from ..product.crud import (
     create_product,
     get_all_products,
     get_product_by_id,
-    get_product_recommendations,
     remove_product,
     update_product,
 )
-from ..product.models import Product
 from ..product.schemas import (
     ProductCreate,
     ProductListResponse,
     ProductPatch,
     ProductResponse,
 )
+from ..recommendation.crud import get_product_recommendations
 from ..user.crud import get_current_user, is_admin
 from ..user.models import User
-from ..utils import get_entity_by_params
 
 router = APIRouter()
 
 
 @router.get("/")
 async def product_list(
+    request: Request,
+    response: Response,
     session: SessionDep,
-    page: int = 1,
-    limit: int = 10,
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1),
     company_id: int = None,
+    cursor: str | None = None,
+    use_cursor: bool = False,
 ) -> ProductListResponse:
-    return await get_all_products(
+    products = await get_all_products(
         session=session,
         page=page,
         limit=limit,
         company_id=company_id,
+        cursor=cursor,
+        use_cursor=use_cursor,
+    )
+
+    return (
+        conditional_response(
+            request,
+            response,
+            products.products,
+            products.total_pages,
+            products.next_cursor,
+            products.prev_cursor,
+        )
+        or products
     )
 
 
@@ -45,33 +60,16 @@ async def get_recommendations(
     session: SessionDep,
     current_user: User = Depends(get_current_user),
 ) -> ProductListResponse:
-    user = await get_entity_by_params(
-        session=session,
-        entity_class=User,
-        id=current_user.id,
-        options=[
-            joinedload(User.orders),
-            joinedload(User.orders).joinedload(Order.order_items),
-            joinedload(User.orders)
-            .joinedload(Order.order_items)
-            .joinedload(OrderItem.product),
-            joinedload(User.orders)
-            .joinedload(Order.order_items)
-            .joinedload(OrderItem.product)
-            .joinedload(Product.company),
-        ],
-        return_all=False,
-    )
-    return await get_product_recommendations(
-        session=session,
-        user=user,
-    )
+    return await get_product_recommendations(session=session, user_id=current_user.id)
 
 
 @router.get("/{product_id}/")
-async def product_detail(product_id: int, session: SessionDep) -> ProductResponse:
+async def product_detail(
+    product_id: int, request: Request, response: Response, session: SessionDep
+) -> ProductResponse:
+    product = await get_product_by_id(session=session, product_id=product_id)
 
-    return await get_product_by_id(session=session, product_id=product_id)
+    return conditional_response(request, response, [product]) or product
 
 
 @router.post("/")
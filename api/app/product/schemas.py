@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 
 from fastapi import File, Form, UploadFile
@@ -17,7 +18,9 @@ class ProductBase(SQLModel):
     image_id: str = Field(nullable=True, unique=True)
     price: int
 
-    company_id: Optional[int] = Field(default=None, foreign_key="company.id")
+    company_id: Optional[int] = Field(
+        default=None, foreign_key="company.id", index=True
+    )
 
 
 class ProductCreate(SQLModel):
@@ -53,6 +56,7 @@ class ProductCreate(SQLModel):
 
 class ProductResponse(ProductBase):
     id: int
+    updated_at: Optional[datetime] = None
     company_name_en: Optional[str] = None
     company_name_ua: Optional[str] = None
     company_id: Optional[int]
@@ -64,7 +68,9 @@ class ProductFullResponse(ProductBase):
 
 class ProductListResponse(SQLModel):
     products: list[ProductResponse]
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
 
 class ProductPatch(SQLModel):
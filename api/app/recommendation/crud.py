@@ -0,0 +1,203 @@
+import random
+from typing import Dict, List, Set, Tuple
+
+from sqlalchemy import func, literal
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import joinedload
+from sqlmodel import select
+
+from bot.config import (
+    RECOMMENDATION_CANDIDATES_LIMIT,
+    RECOMMENDATION_POPULAR_CACHE_TTL_SECONDS,
+    RECOMMENDATION_POPULAR_LIMIT,
+)
+
+from ..common.dependencies import SessionDep
+from ..product.models import Product
+from ..product.schemas import ProductListResponse, ProductResponse
+from ..utils import TTLCache, sample_entity_ids
+from .models import ProductCoPurchase, ProductPopularity, UserProductScore
+
+RECOMMENDATIONS_COUNT = 2
+COMPANY_POPULARITY_WEIGHT = 0.5
+POPULAR_PRODUCTS_KEY = "popular"
+
+popular_products_cache = TTLCache(
+    max_size=1, ttl=float(RECOMMENDATION_POPULAR_CACHE_TTL_SECONDS)
+)
+
+
+async def record_order_for_recommendations(
+    session: SessionDep,
+    user_id: int,
+    company_id: int,
+    quantities: Dict[int, int],
+) -> None:
+    product_ids = sorted(quantities)
+
+    statement = insert(ProductPopularity).values(
+        [
+            {
+                "product_id": product_id,
+                "company_id": company_id,
+                "count": quantities[product_id],
+            }
+            for product_id in product_ids
+        ]
+    )
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[ProductPopularity.product_id],
+            set_={"count": ProductPopularity.count + statement.excluded.count},
+        )
+    )
+
+    pairs = [
+        {"product_id": product_id, "related_product_id": related_id, "count": 1}
+        for product_id in product_ids
+        for related_id in product_ids
+        if product_id != related_id
+    ]
+
+    if pairs:
+        statement = insert(ProductCoPurchase).values(pairs)
+        await session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    ProductCoPurchase.product_id,
+                    ProductCoPurchase.related_product_id,
+                ],
+                set_={"count": ProductCoPurchase.count + 1},
+            )
+        )
+
+    statement = insert(UserProductScore).values(
+        [
+            {"user_id": user_id, "product_id": product_id, "purchased": True}
+            for product_id in product_ids
+        ]
+    )
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[UserProductScore.user_id, UserProductScore.product_id],
+            set_={"purchased": True},
+        )
+    )
+
+    co_purchased = (
+        select(
+            literal(user_id),
+            ProductCoPurchase.related_product_id,
+            func.sum(ProductCoPurchase.count),
+        )
+        .where(ProductCoPurchase.product_id.in_(product_ids))
+        .group_by(ProductCoPurchase.related_product_id)
+        .order_by(func.sum(ProductCoPurchase.count).desc())
+        .limit(int(RECOMMENDATION_CANDIDATES_LIMIT))
+    )
+    company_popular = (
+        select(
+            literal(user_id),
+            ProductPopularity.product_id,
+            ProductPopularity.count * COMPANY_POPULARITY_WEIGHT,
+        )
+        .where(ProductPopularity.company_id == company_id)
+        .order_by(ProductPopularity.count.desc())
+        .limit(int(RECOMMENDATION_CANDIDATES_LIMIT))
+    )
+
+    for candidates in (co_purchased, company_popular):
+        statement = insert(UserProductScore).from_select(
+            ["user_id", "product_id", "score"], candidates
+        )
+        await session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[UserProductScore.user_id, UserProductScore.product_id],
+                set_={"score": UserProductScore.score + statement.excluded.score},
+            )
+        )
+
+
+async def get_popular_product_ids(session: SessionDep) -> List[int]:
+    product_ids = popular_products_cache.get(POPULAR_PRODUCTS_KEY)
+
+    if product_ids is None:
+        result = await session.exec(
+            select(ProductPopularity.product_id)
+            .order_by(ProductPopularity.count.desc())
+            .limit(int(RECOMMENDATION_POPULAR_LIMIT))
+        )
+        product_ids = list(result.all())
+        popular_products_cache.set(POPULAR_PRODUCTS_KEY, product_ids)
+
+    return product_ids
+
+
+async def get_recommended_product_ids(
+    session: SessionDep, user_id: int
+) -> Tuple[List[int], Set[int]]:
+    result = await session.exec(
+        select(UserProductScore.product_id)
+        .where(UserProductScore.user_id == user_id, ~UserProductScore.purchased)
+        .order_by(UserProductScore.score.desc())
+        .limit(RECOMMENDATIONS_COUNT)
+    )
+    product_ids = list(result.all())
+
+    if len(product_ids) >= RECOMMENDATIONS_COUNT:
+        return product_ids, set()
+
+    result = await session.exec(
+        select(UserProductScore.product_id).where(
+            UserProductScore.user_id == user_id, UserProductScore.purchased
+        )
+    )
+    purchased_ids = set(result.all())
+    excluded_ids = purchased_ids | set(product_ids)
+    popular_ids = [
+        product_id
+        for product_id in await get_popular_product_ids(session)
+        if product_id not in excluded_ids
+    ]
+    missing = RECOMMENDATIONS_COUNT - len(product_ids)
+
+    product_ids += random.sample(popular_ids, min(missing, len(popular_ids)))
+
+    return product_ids, purchased_ids
+
+
+async def get_product_recommendations(
+    session: SessionDep, user_id: int
+) -> ProductListResponse:
+    product_ids, purchased_ids = await get_recommended_product_ids(session, user_id)
+
+    if len(product_ids) < RECOMMENDATIONS_COUNT:
+        product_ids += await sample_entity_ids(
+            session,
+            Product,
+            RECOMMENDATIONS_COUNT - len(product_ids),
+            exclude_ids=[*product_ids, *purchased_ids],
+        )
+
+    if not product_ids:
+        return ProductListResponse(products=[], total_pages=1)
+
+    result = await session.exec(
+        select(Product)
+        .where(Product.id.in_(product_ids))
+        .options(joinedload(Product.company))
+    )
+    products = {product.id: product for product in result.all()}
+
+    return ProductListResponse(
+        products=[
+            ProductResponse(
+                **products[product_id].model_dump(),
+                company_name_en=products[product_id].company.title_en,
+                company_name_ua=products[product_id].company.title_ua,
+            )
+            for product_id in product_ids
+            if product_id in products
+        ],
+        total_pages=1,
+    )
@@ -0,0 +1,47 @@
+from sqlalchemy import Index, text
+from sqlmodel import Field, SQLModel
+
+
+class ProductPopularity(SQLModel, table=True):
+    __tablename__ = "product_popularity"
+    __table_args__ = (
+        Index("ix_product_popularity_company_id_count", "company_id", "count"),
+        Index("ix_product_popularity_count", "count"),
+    )
+
+    product_id: int = Field(
+        foreign_key="product.id", primary_key=True, ondelete="CASCADE"
+    )
+    company_id: int = Field(foreign_key="company.id", ondelete="CASCADE")
+    count: int = Field(default=0)
+
+
+class ProductCoPurchase(SQLModel, table=True):
+    __tablename__ = "product_copurchase"
+
+    product_id: int = Field(
+        foreign_key="product.id", primary_key=True, ondelete="CASCADE"
+    )
+    related_product_id: int = Field(
+        foreign_key="product.id", primary_key=True, ondelete="CASCADE"
+    )
+    count: int = Field(default=0)
+
+
+class UserProductScore(SQLModel, table=True):
+    __tablename__ = "user_product_score"
+    __table_args__ = (
+        Index(
+            "ix_user_product_score_candidates",
+            "user_id",
+            "score",
+            postgresql_where=text("NOT purchased"),
+        ),
+    )
+
+    user_id: int = Field(foreign_key="user.id", primary_key=True, ondelete="CASCADE")
+    product_id: int = Field(
+        foreign_key="product.id", primary_key=True, ondelete="CASCADE"
+    )
+    score: float = Field(default=0)
+    purchased: bool = Field(default=False)
@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timedelta, timezone
 from typing import List
 
@@ -7,11 +8,18 @@ from fastapi.security import OAuth2PasswordBearer
 from jwt import PyJWTError
 from sqlmodel import or_, select
 
-from bot.config import ACCESS_TOKEN_EXPIRE_MINUTES, JWT_ALGORITHM, JWT_SECRET_KEY
+from bot.config import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    AUTH_CACHE_MAX_SIZE,
+    AUTH_CACHE_TTL_SECONDS,
+    JWT_ALGORITHM,
+    JWT_SECRET_KEY,
+)
 
 from ..common.dependencies import SessionDep
 from ..user.models import User
 from ..user.schemas import (
+    CurrentUser,
     Token,
     TokenData,
     UserCreate,
@@ -20,9 +28,14 @@ from ..user.schemas import (
     UserResponse,
     UserResponseMe,
 )
+from ..utils import TTLCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="users/token/")
 
+principal_cache = TTLCache(
+    max_size=int(AUTH_CACHE_MAX_SIZE), ttl=float(AUTH_CACHE_TTL_SECONDS)
+)
+
 
 async def create_user(session: SessionDep, user: UserCreate) -> UserResponse:
     statement = select(User).where(
@@ -193,6 +206,7 @@ async def authenticate_user(session: SessionDep, user_login: UserLogin) -> Token
     access_token_expires = timedelta(minutes=int(ACCESS_TOKEN_EXPIRE_MINUTES))
     access_token = create_access_token(
         data={
+            "user_id": existing_user.id,
             "phone_number": existing_user.phone_number,
             "telegram_id": existing_user.telegram_id,
             "role": existing_user.role,
@@ -222,7 +236,14 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     return encoded_jwt
 
 
-async def get_current_user(session: SessionDep, token: str = Depends(oauth2_scheme)):
+async def get_current_user(
+    session: SessionDep, token: str = Depends(oauth2_scheme)
+) -> CurrentUser:
+    current_user: CurrentUser = principal_cache.get(token)
+
+    if current_user is not None:
+        return current_user
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -237,22 +258,57 @@ async def get_current_user(session: SessionDep, token: str = Depends(oauth2_sche
         if phone_number is None or role is None:
             raise credentials_exception
 
-        token_data = TokenData(phone_number=phone_number, role=role)
+        token_data = TokenData(
+            phone_number=phone_number,
+            role=role,
+            user_id=payload.get("user_id"),
+            telegram_id=payload.get("telegram_id"),
+        )
 
     except PyJWTError:
         raise credentials_exception
 
-    current_user = await get_user_by_phone(
-        session, phone_number=token_data.phone_number
-    )
+    # Tokens outlive role changes and deletions, so the user is looked up on
+    # every cache miss. A cached principal can therefore be stale for at most
+    # AUTH_CACHE_TTL_SECONDS, in every worker.
+    statement = select(User.id, User.phone_number, User.telegram_id, User.role)
+
+    if token_data.user_id is not None:
+        statement = statement.where(User.id == token_data.user_id)
+
+    else:
+        statement = statement.where(User.phone_number == token_data.phone_number)
 
-    if current_user is None:
+    result = await session.exec(statement)
+    user = result.first()
+
+    if user is None:
         raise credentials_exception
 
+    current_user = CurrentUser(
+        id=user.id,
+        phone_number=user.phone_number,
+        telegram_id=user.telegram_id,
+        role=user.role,
+    )
+
+    expires_in = payload["exp"] - time.time()
+    principal_cache.set(token, current_user, ttl=min(principal_cache.ttl, expires_in))
+
     return current_user
 
 
-async def is_admin(user: User = Depends(get_current_user)):
+async def get_current_user_profile(
+    session: SessionDep, current_user: CurrentUser = Depends(get_current_user)
+) -> UserResponse:
+    return await get_user_by_id(session, current_user.id)
+
+
+async def is_admin(
+    session: SessionDep, current_user: CurrentUser = Depends(get_current_user)
+):
+    user = await get_user_by_id(session, current_user.id)
+
     if user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
@@ -8,6 +8,7 @@ from ..user.crud import (
     change_user_role,
     create_user,
     get_current_user,
+    get_current_user_profile,
     get_user_by_id,
     get_user_by_params,
     is_admin,
@@ -50,7 +51,7 @@ async def post_user(user: UserCreate, session: SessionDep) -> UserResponse:
 
 @router.get("/me/")
 async def get_me(
-    current_user: UserResponseMe = Depends(get_current_user),
+    current_user: UserResponseMe = Depends(get_current_user_profile),
 ) -> UserResponseMe:
     return current_user
 
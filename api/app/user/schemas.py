@@ -9,7 +9,7 @@ class UserBase(SQLModel):
     first_name: str
     last_name: Optional[str] = Field(nullable=True, default=None)
     phone_number: str = Field(unique=True, index=True)
-    telegram_id: int = Field(sa_column=Column(BigInteger))
+    telegram_id: int = Field(sa_column=Column(BigInteger, index=True))
     role: Optional[str] = Field(default="user")
 
 
@@ -58,3 +58,12 @@ class Token(SQLModel):
 class TokenData(SQLModel):
     phone_number: Optional[str] = None
     role: Optional[str] = None
+    user_id: Optional[int] = None
+    telegram_id: Optional[int] = None
+
+
+class CurrentUser(SQLModel):
+    id: int
+    phone_number: str
+    telegram_id: int
+    role: str
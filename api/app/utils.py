@@ -1,18 +1,32 @@
 import asyncio
+import base64
+import binascii
+import json
 import math
+import operator
 import os
+import random
+import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Optional, Tuple, Type, TypeVar
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type, TypeVar
 
 import aiofiles
 import cloudinary.uploader
 from cloudinary.exceptions import Error as CloudinaryError
 from cloudinary.exceptions import GeneralError
-from fastapi import File, UploadFile
-from sqlalchemy import func
+from fastapi import File, HTTPException, UploadFile, status
+from sqlalchemy import func, tuple_
 from sqlalchemy.orm import Load
 from sqlmodel import select
 
+from bot.config import (
+    COUNT_CACHE_TTL_SECONDS,
+    RANDOM_POOL_MAX_SIZE,
+    RANDOM_POOL_TTL_SECONDS,
+)
+
 from .cloudinary_config import configure_cloudinary
 from .common.dependencies import SessionDep
 
@@ -20,6 +34,173 @@ configure_cloudinary()
 
 T = TypeVar("T")
 
+CURSOR_NEXT = "n"
+CURSOR_PREV = "p"
+
+COUNT_CACHED_TABLES = {"product", "company", "kitchen"}
+
+FILTER_OPERATORS = {
+    "gte": operator.ge,
+    "gt": operator.gt,
+    "lte": operator.le,
+    "lt": operator.lt,
+}
+
+
+class CountCache:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._counts: Dict[Tuple, Tuple[float, int]] = {}
+
+    @staticmethod
+    def make_key(entity_class: Type[T], **params) -> Tuple:
+        filters = frozenset(
+            (key, value)
+            for key, value in params.items()
+            if resolve_filter(entity_class, key) and value is not None
+        )
+        return entity_class.__tablename__, filters
+
+    def get(self, key: Tuple) -> Optional[int]:
+        cached = self._counts.get(key)
+
+        if cached is None:
+            return None
+
+        expires_at, count = cached
+        if expires_at < time.monotonic():
+            self._counts.pop(key, None)
+            return None
+
+        return count
+
+    def set(self, key: Tuple, count: int) -> None:
+        self._counts[key] = (time.monotonic() + self.ttl, count)
+
+    def invalidate(self, entity_class: Type[T]) -> None:
+        table_name = entity_class.__tablename__
+        for key in [key for key in self._counts if key[0] == table_name]:
+            self._counts.pop(key, None)
+
+
+count_cache = CountCache(ttl=float(COUNT_CACHE_TTL_SECONDS))
+
+
+class TTLCache:
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._items: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        cached = self._items.get(key)
+
+        if cached is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = cached
+        if expires_at < time.monotonic():
+            self._items.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        self._items[key] = (time.monotonic() + ttl, value)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._items), "hits": self.hits, "misses": self.misses}
+
+
+class RandomIdPool:
+    def __init__(self, max_size: int, ttl: float, max_pools: int = 256):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_pools = max_pools
+        self._pools: Dict[str, TTLCache] = {}
+
+    def _table_pools(self, entity_class: Type[T]) -> TTLCache:
+        table_name = entity_class.__tablename__
+
+        if table_name not in self._pools:
+            self._pools[table_name] = TTLCache(max_size=self.max_pools, ttl=self.ttl)
+
+        return self._pools[table_name]
+
+    async def get_ids(
+        self, session: SessionDep, entity_class: Type[T], **params
+    ) -> List[int]:
+        pools = self._table_pools(entity_class)
+        key = CountCache.make_key(entity_class, **params)
+        ids = pools.get(key)
+
+        if ids is None:
+            ids = await self._load_ids(session, entity_class, **params)
+            pools.set(key, ids)
+
+        return ids
+
+    # ORDER BY random() would scan and sort the whole table on every miss.
+    # Instead the pool is the next max_size ids (in id order, wrapping around)
+    # from a random starting id, which only walks the primary key index. The
+    # sample is therefore biased: until the pool expires after ttl seconds,
+    # only these max_size ids can be returned, and ids that are close to each
+    # other are drawn together. Tables with at most max_size matching rows
+    # are pooled in full and are unaffected.
+    async def _load_ids(
+        self, session: SessionDep, entity_class: Type[T], **params
+    ) -> List[int]:
+        bounds = await session.exec(
+            select(func.min(entity_class.id), func.max(entity_class.id))
+        )
+        lowest, highest = bounds.one()
+
+        if lowest is None:
+            return []
+
+        start = random.randint(lowest, highest)
+        statement = apply_filters_to_statement(
+            select(entity_class.id), entity_class, **params
+        ).order_by(entity_class.id)
+
+        result = await session.exec(
+            statement.where(entity_class.id >= start).limit(self.max_size)
+        )
+        ids = list(result.all())
+
+        if len(ids) < self.max_size:
+            result = await session.exec(
+                statement.where(entity_class.id < start).limit(self.max_size - len(ids))
+            )
+            ids.extend(result.all())
+
+        return ids
+
+    def invalidate(self, entity_class: Type[T]) -> None:
+        self._pools.pop(entity_class.__tablename__, None)
+
+
+random_id_pool = RandomIdPool(
+    max_size=int(RANDOM_POOL_MAX_SIZE), ttl=float(RANDOM_POOL_TTL_SECONDS)
+)
+
 
 async def get_entity_by_params(
     session: SessionDep,
@@ -31,8 +212,15 @@ async def get_entity_by_params(
     page: Optional[int] = None,
     order_by: str = None,
     with_total_pages: bool = False,
+    use_cursor: bool = False,
+    cursor: Optional[str] = None,
     **params,
-) -> Tuple[List[T] | Optional[T], int]:
+) -> (
+    List[T]
+    | Optional[T]
+    | Tuple[List[T], int]
+    | Tuple[List[T], Optional[int], Optional[str], Optional[str]]
+):
     statement = select(entity_class)
     statement = apply_filters_to_statement(
         statement,
@@ -40,18 +228,43 @@ async def get_entity_by_params(
         **params,
     )
 
-    if order_by:
-        statement = statement.order_by(getattr(entity_class, order_by))
-
     if options:
         statement = statement.options(*options)
 
-    total_pages = await get_total_pages(
-        session,
-        entity_class,
-        limit,
-        **params,
-    )
+    if (use_cursor or cursor) and limit:
+        total_pages = None
+
+        if with_total_pages:
+            total_pages = await get_total_pages(
+                session,
+                entity_class,
+                limit,
+                **params,
+            )
+
+        items, next_cursor, prev_cursor = await get_entity_page_by_cursor(
+            session,
+            statement,
+            entity_class,
+            limit=limit,
+            order_by=order_by or "id",
+            cursor=cursor,
+        )
+        return items, total_pages, next_cursor, prev_cursor
+
+    if with_total_pages and limit and page and return_all:
+        return await get_entity_page_with_total(
+            session,
+            entity_class,
+            limit=limit,
+            page=page,
+            options=options,
+            order_by=order_by,
+            **params,
+        )
+
+    if order_by:
+        statement = statement.order_by(getattr(entity_class, order_by))
 
     if limit and page:
         offset = (page - 1) * limit
@@ -59,23 +272,198 @@ async def get_entity_by_params(
 
     result = await session.exec(statement)
 
-    if with_total_pages and limit and page and return_all:
-        return result.unique().all(), total_pages
-
     if return_all:
         return result.unique().all()
 
     return result.first()
 
 
+async def get_entity_page_with_total(
+    session: SessionDep,
+    entity_class: Type[T],
+    *,
+    limit: int,
+    page: int = 1,
+    options: Optional[List[Load]] = None,
+    order_by: str = None,
+    **params,
+) -> Tuple[List[T], int]:
+    use_cache = entity_class.__tablename__ in COUNT_CACHED_TABLES
+    cache_key = count_cache.make_key(entity_class, **params)
+    total_count = count_cache.get(cache_key) if use_cache else None
+
+    if total_count is None:
+        statement = select(entity_class, func.count().over().label("total_count"))
+    else:
+        statement = select(entity_class)
+
+    statement = apply_filters_to_statement(
+        statement,
+        entity_class,
+        **params,
+    )
+
+    if options:
+        statement = statement.options(*options)
+
+    if order_by:
+        statement = statement.order_by(getattr(entity_class, order_by))
+
+    statement = statement.limit(limit).offset((page - 1) * limit)
+    result = await session.exec(statement)
+
+    if total_count is not None:
+        return result.unique().all(), math.ceil(total_count / limit)
+
+    rows = result.unique().all()
+
+    if not rows:
+        return [], await get_total_pages(session, entity_class, limit, **params)
+
+    total_count = rows[0].total_count
+
+    if use_cache:
+        count_cache.set(cache_key, total_count)
+
+    return [row[0] for row in rows], math.ceil(total_count / limit)
+
+
+async def get_entity_page_by_cursor(
+    session: SessionDep,
+    statement,
+    entity_class: Type[T],
+    *,
+    limit: int,
+    order_by: str = "id",
+    cursor: Optional[str] = None,
+) -> Tuple[List[T], Optional[str], Optional[str]]:
+    key_names = [order_by] if order_by == "id" else [order_by, "id"]
+    key_columns = [getattr(entity_class, name) for name in key_names]
+
+    direction, values = decode_cursor(cursor) if cursor else (CURSOR_NEXT, None)
+
+    if values is not None:
+        if len(values) != len(key_columns):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+
+        values = [
+            coerce_cursor_value(column, value)
+            for column, value in zip(key_columns, values)
+        ]
+
+        if len(key_columns) == 1:
+            key, bound = key_columns[0], values[0]
+        else:
+            key, bound = tuple_(*key_columns), tuple_(*values)
+
+        statement = statement.where(
+            key < bound if direction == CURSOR_PREV else key > bound
+        )
+
+    if direction == CURSOR_PREV:
+        statement = statement.order_by(*(column.desc() for column in key_columns))
+    else:
+        statement = statement.order_by(*key_columns)
+
+    result = await session.exec(statement.limit(limit + 1))
+    items = list(result.unique().all())
+
+    has_more = len(items) > limit
+    items = items[:limit]
+
+    if direction == CURSOR_PREV:
+        items.reverse()
+        has_next, has_prev = True, has_more
+    else:
+        has_next, has_prev = has_more, cursor is not None
+
+    next_cursor = prev_cursor = None
+
+    if items and has_next:
+        next_cursor = encode_cursor(
+            [getattr(items[-1], name) for name in key_names], CURSOR_NEXT
+        )
+
+    if items and has_prev:
+        prev_cursor = encode_cursor(
+            [getattr(items[0], name) for name in key_names], CURSOR_PREV
+        )
+
+    return items, next_cursor, prev_cursor
+
+
+def encode_cursor(values: List, direction: str) -> str:
+    raw = json.dumps([direction, *values], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def coerce_cursor_value(column, value: Any) -> Any:
+    # Cursors come from clients, so a value has to fit its key column before
+    # it reaches the database; otherwise the driver fails with a 500.
+    python_type = column.type.python_type
+    invalid_cursor = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+    )
+
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise invalid_cursor
+
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+
+        coerced = python_type(value)
+
+    except (TypeError, ValueError):
+        raise invalid_cursor
+
+    if coerced != value and not isinstance(value, str):
+        raise invalid_cursor
+
+    return coerced
+
+
+def decode_cursor(cursor: str) -> Tuple[str, List]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, *values = json.loads(base64.urlsafe_b64decode(padded))
+
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+    if direction not in (CURSOR_NEXT, CURSOR_PREV) or not values:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+    return direction, values
+
+
+def resolve_filter(entity_class: Type[T], key: str) -> Optional[Tuple[Any, Callable]]:
+    field_name, _, operator_name = key.partition("__")
+    compare = FILTER_OPERATORS.get(operator_name) if operator_name else operator.eq
+
+    if compare is None or not hasattr(entity_class, field_name):
+        return None
+
+    return getattr(entity_class, field_name), compare
+
+
 def apply_filters_to_statement(
     statement,
     entity_class: Type[T],
     **params,
 ):
     for key, value in params.items():
-        if hasattr(entity_class, key) and value is not None:
-            statement = statement.where(getattr(entity_class, key) == value)
+        resolved = resolve_filter(entity_class, key)
+
+        if resolved and value is not None:
+            column, compare = resolved
+            statement = statement.where(compare(column, value))
 
     return statement
 
@@ -86,18 +474,44 @@ async def get_total_pages(
     limit: int,
     **kwargs,
 ) -> int:
+    use_cache = entity_class.__tablename__ in COUNT_CACHED_TABLES
+    cache_key = count_cache.make_key(entity_class, **kwargs)
+    total_count = count_cache.get(cache_key) if use_cache else None
 
-    count_statement = select(func.count()).select_from(entity_class)
-    count_statement = apply_filters_to_statement(
-        count_statement,
-        entity_class,
-        **kwargs,
-    )
+    if total_count is None:
+        count_statement = select(func.count()).select_from(entity_class)
+        count_statement = apply_filters_to_statement(
+            count_statement,
+            entity_class,
+            **kwargs,
+        )
+
+        total_count = await session.scalar(count_statement)
+
+        if use_cache:
+            count_cache.set(cache_key, total_count)
 
-    total_count = await session.scalar(count_statement)
     return math.ceil(total_count / limit) if limit else 1
 
 
+async def sample_entity_ids(
+    session: SessionDep,
+    entity_class: Type[T],
+    k: int,
+    *,
+    exclude_ids: Optional[List[int]] = None,
+    **params,
+) -> List[int]:
+    excluded = set(exclude_ids or [])
+    ids = [
+        entity_id
+        for entity_id in await random_id_pool.get_ids(session, entity_class, **params)
+        if entity_id not in excluded
+    ]
+
+    return random.sample(ids, min(k, len(ids)))
+
+
 async def upload_to_cloudinary(
     file_path: str, folder: str = "default_folder", public_id: str = None
 ) -> dict:
@@ -59,6 +59,8 @@ async def get_wishlist_items(
     page: int,
     limit: int = 1,
     return_all: bool = False,
+    cursor: str = None,
+    use_cursor: bool = False,
 ) -> WishlistItemFullResponse | List[WishlistItemResponse] | None:
     wishlist: Wishlist = await get_entity_by_params(
         session,
@@ -75,20 +77,39 @@ async def get_wishlist_items(
     if not wishlist:
         return None
 
-    wishlist_items, total_pages = await get_entity_by_params(
-        session,
-        WishlistItem,
-        wishlist_id=wishlist.id,
-        page=page,
-        limit=limit,
-        with_total_pages=True,
-        order_by="id",
-        return_all=True,
-        options=[
-            joinedload(WishlistItem.product),
-            joinedload(WishlistItem.product).joinedload(Product.company),
-        ],
-    )
+    item_options = [
+        joinedload(WishlistItem.product),
+        joinedload(WishlistItem.product).joinedload(Product.company),
+    ]
+    next_cursor = prev_cursor = None
+
+    if use_cursor or cursor:
+        wishlist_items, total_pages, next_cursor, prev_cursor = (
+            await get_entity_by_params(
+                session,
+                WishlistItem,
+                wishlist_id=wishlist.id,
+                limit=limit,
+                order_by="id",
+                return_all=True,
+                options=item_options,
+                use_cursor=True,
+                cursor=cursor,
+            )
+        )
+
+    else:
+        wishlist_items, total_pages = await get_entity_by_params(
+            session,
+            WishlistItem,
+            wishlist_id=wishlist.id,
+            page=page,
+            limit=limit,
+            with_total_pages=True,
+            order_by="id",
+            return_all=True,
+            options=item_options,
+        )
 
     if not wishlist_items:
         return None
@@ -99,7 +120,9 @@ async def get_wishlist_items(
     return WishlistItemFullResponse(
         **wishlist_items[0].model_dump(),
         company_id=wishlist_items[0].product.company.id,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
     )
 
 
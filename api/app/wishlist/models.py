@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from api.app.wishlist.schemas import WishlistBase, WishlistItemBase
@@ -15,6 +16,10 @@ class Wishlist(WishlistBase, table=True):
 
 
 class WishlistItem(WishlistItemBase, table=True):
+    __table_args__ = (
+        Index("ix_wishlistitem_wishlist_id_product_id", "wishlist_id", "product_id"),
+    )
+
     id: int | None = Field(default=None, primary_key=True)
 
     wishlist: Optional[Wishlist] = Relationship(back_populates="items")
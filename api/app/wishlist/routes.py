@@ -22,10 +22,17 @@ async def get_wishlist(
     current_user: User = Depends(get_current_user),
     page: int = 1,
     return_all: bool = False,
+    cursor: str | None = None,
+    use_cursor: bool = False,
 ) -> WishlistItemFullResponse | List[WishlistItemResponse] | None:
 
     return await get_wishlist_items(
-        session=session, user_id=current_user.id, page=page, return_all=return_all
+        session=session,
+        user_id=current_user.id,
+        page=page,
+        return_all=return_all,
+        cursor=cursor,
+        use_cursor=use_cursor,
     )
 
 
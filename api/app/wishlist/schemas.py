@@ -1,13 +1,15 @@
+from typing import Optional
+
 from sqlmodel import Field, SQLModel
 
 
 class WishlistBase(SQLModel):
-    user_id: int = Field(foreign_key="user.id")
+    user_id: int = Field(foreign_key="user.id", index=True)
 
 
 class WishlistItemBase(SQLModel):
     wishlist_id: int = Field(foreign_key="wishlist.id")
-    product_id: int = Field(foreign_key="product.id")
+    product_id: int = Field(foreign_key="product.id", index=True)
     product_title_ua: str
     product_title_en: str
     composition_ua: str
@@ -23,4 +25,6 @@ class WishlistItemResponse(WishlistItemBase):
 
 
 class WishlistItemFullResponse(WishlistItemResponse):
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
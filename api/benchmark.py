@@ -0,0 +1,195 @@
+import argparse
+import gzip
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import brotli
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import api.app.common.database  # noqa: E402,F401  registers every mapped model
+from api.app.company.models import Company  # noqa: E402
+from api.app.company.schemas import CompanyListResponse, CompanyResponse  # noqa: E402
+from api.app.order.schemas import (  # noqa: E402
+    OrderItemResponse,
+    OrderListResponse,
+    OrderResponse,
+)
+from api.app.product.schemas import ProductListResponse, ProductResponse  # noqa: E402
+from api.app.user.models import User  # noqa: E402
+
+
+def make_product(product_id: int, company_id: int) -> ProductResponse:
+    return ProductResponse(
+        id=product_id,
+        title_ua=f"Страва {product_id}",
+        title_en=f"Dish {product_id}",
+        composition_ua="Борошно, сир, томати, базилік, оливкова олія",
+        composition_en="Flour, cheese, tomatoes, basil, olive oil",
+        image_link=f"https://res.cloudinary.com/demo/product/{product_id}.jpg",
+        image_id=f"product/PRODUCT_ID-{product_id}",
+        price=100 + product_id % 400,
+        company_id=company_id,
+        company_name_en=f"Company {company_id}",
+        company_name_ua=f"Компанія {company_id}",
+    )
+
+
+def make_company(company_id: int) -> Dict[str, Any]:
+    return {
+        "id": company_id,
+        "title_ua": f"Компанія {company_id}",
+        "title_en": f"Company {company_id}",
+        "description_ua": "Опис закладу, кухні та умов доставки",
+        "description_en": "About the place, its cuisine and delivery terms",
+        "image_link": f"https://res.cloudinary.com/demo/company/{company_id}.jpg",
+        "image_id": f"company/COMPANY_ID-{company_id}",
+        "kitchen_id": company_id % 5 + 1,
+    }
+
+
+def make_order(order_id: int, items: int) -> OrderResponse:
+    company = make_company(order_id % 10 + 1)
+
+    return OrderResponse(
+        id=order_id,
+        total_price=450.5,
+        address=f"Khreshchatyk St, {order_id}",
+        time="18:30",
+        order_items=[
+            OrderItemResponse(
+                id=order_id * items + index,
+                order_id=order_id,
+                product_id=index,
+                quantity=index % 3 + 1,
+                product=make_product(index, company["id"]),
+            )
+            for index in range(1, items + 1)
+        ],
+        user=User(
+            id=order_id,
+            first_name="Taras",
+            phone_number=f"+38050{order_id:07d}",
+            telegram_id=100000 + order_id,
+        ),
+        company=Company(**company),
+    )
+
+
+def build_payloads(items: int, orders: int) -> Dict[str, Tuple[type, Any]]:
+    return {
+        "ProductListResponse": (
+            ProductListResponse,
+            ProductListResponse(
+                products=[make_product(index, 1) for index in range(1, items + 1)],
+                total_pages=1,
+            ),
+        ),
+        "CompanyListResponse": (
+            CompanyListResponse,
+            CompanyListResponse(
+                companys=[
+                    CompanyResponse(**make_company(index))
+                    for index in range(1, items + 1)
+                ],
+                total_pages=1,
+            ),
+        ),
+        "OrderListResponse": (
+            OrderListResponse,
+            OrderListResponse(
+                orders=[make_order(index, 3) for index in range(1, orders + 1)],
+                total_pages=1,
+            ),
+        ),
+    }
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    result = func()
+    started_at = time.perf_counter()
+
+    for _ in range(repeat):
+        result = func()
+
+    return (time.perf_counter() - started_at) / repeat * 1_000_000, result
+
+
+def benchmark(model: type, payload: Any, repeat: int, brotli_quality: int) -> Dict:
+    adapter = TypeAdapter(model)
+
+    def encode() -> Any:
+        # What FastAPI does for a route with a response model before rendering.
+        value = adapter.validate_python(payload, from_attributes=True)
+        return adapter.dump_python(value, mode="json")
+
+    encode_us, content = measure(encode, repeat)
+    json_us, json_body = measure(lambda: JSONResponse(content).body, repeat)
+    orjson_us, orjson_body = measure(lambda: ORJSONResponse(content).body, repeat)
+    gzip_us, gzip_body = measure(lambda: gzip.compress(orjson_body, 9), repeat)
+    brotli_us, brotli_body = measure(
+        lambda: brotli.compress(orjson_body, quality=brotli_quality), repeat
+    )
+
+    return {
+        "encode_us": encode_us,
+        "before_us": encode_us + json_us,
+        "after_us": encode_us + orjson_us,
+        "json_us": json_us,
+        "orjson_us": orjson_us,
+        "raw_bytes": len(json_body),
+        "gzip_bytes": len(gzip_body),
+        "gzip_us": gzip_us,
+        "brotli_bytes": len(brotli_body),
+        "brotli_us": brotli_us,
+    }
+
+
+def print_report(results: List[Tuple[str, Dict]]) -> None:
+    print(
+        f"{'payload':<22}{'before us':>11}{'after us':>11}{'speedup':>9}"
+        f"{'json us':>10}{'orjson us':>11}{'raw B':>9}"
+        f"{'gzip B':>9}{'gzip us':>9}{'br B':>9}{'br us':>9}"
+    )
+
+    for name, result in results:
+        print(
+            f"{name:<22}"
+            f"{result['before_us']:>11.1f}"
+            f"{result['after_us']:>11.1f}"
+            f"{result['before_us'] / result['after_us']:>8.2f}x"
+            f"{result['json_us']:>10.1f}"
+            f"{result['orjson_us']:>11.1f}"
+            f"{result['raw_bytes']:>9}"
+            f"{result['gzip_bytes']:>9}"
+            f"{result['gzip_us']:>9.1f}"
+            f"{result['brotli_bytes']:>9}"
+            f"{result['brotli_us']:>9.1f}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure API response serialization and compression cost"
+    )
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--orders", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--brotli-quality", type=int, default=4)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    payloads = build_payloads(args.items, args.orders)
+
+    print_report(
+        [
+            (name, benchmark(model, payload, args.repeat, args.brotli_quality))
+            for name, (model, payload) in payloads.items()
+        ]
+    )
@@ -1,24 +1,37 @@
 from contextlib import asynccontextmanager
 
+from brotli_asgi import BrotliMiddleware
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from api.app.cart.routes import router as cart_router
+from api.app.common.catalog_cache import catalog_listener
 from api.app.common.database import create_db_and_tables
 from api.app.company.routes import router as company_router
 from api.app.gastronomy.routes import router as cuisine_router
+from api.app.health.routes import router as health_router
 from api.app.order.routes import router as order_router
 from api.app.product.routes import router as product_router
 from api.app.user.routes import router as users_router
 from api.app.wishlist.routes import router as wishlist_router
+from bot.config import API_BROTLI_QUALITY, API_COMPRESSION_MIN_SIZE
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> None:
     await create_db_and_tables()
+    catalog_listener.start()
     yield
+    await catalog_listener.stop()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+app.add_middleware(
+    BrotliMiddleware,
+    quality=int(API_BROTLI_QUALITY),
+    minimum_size=int(API_COMPRESSION_MIN_SIZE),
+    gzip_fallback=True,
+)
 
 app.include_router(users_router, prefix="/users", tags=["user"])
 app.include_router(cuisine_router, prefix="/gastronomy", tags=["gastronomy"])
@@ -27,3 +40,4 @@ app.include_router(product_router, prefix="/product", tags=["product"])
 app.include_router(cart_router, prefix="/cart", tags=["card"])
 app.include_router(wishlist_router, prefix="/wishlist", tags=["wishlist"])
 app.include_router(order_router, prefix="/order", tags=["order"])
+app.include_router(health_router, prefix="/health", tags=["health"])
@@ -0,0 +1,31 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import uvicorn
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from bot.config import API_WORKERS, get_env_variable  # noqa: E402
+
+
+def is_installed(module_name: str) -> bool:
+    return importlib.util.find_spec(module_name) is not None
+
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "main:app",
+        host=get_env_variable("API_HOST", "0.0.0.0"),
+        port=int(get_env_variable("API_PORT", "8000")),
+        workers=int(API_WORKERS),
+        loop="uvloop" if is_installed("uvloop") else "asyncio",
+        http="httptools" if is_installed("httptools") else "h11",
+        reload=False,
+        server_header=False,
+        proxy_headers=True,
+        timeout_keep_alive=int(get_env_variable("API_KEEP_ALIVE_TIMEOUT", "5")),
+        timeout_graceful_shutdown=int(
+            get_env_variable("API_GRACEFUL_SHUTDOWN_TIMEOUT", "30")
+        ),
+    )
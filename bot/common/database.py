@@ -1,16 +1,68 @@
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlmodel import SQLModel
 
 from ..common.models import UserInfo
-from ..config import sqlite_path
+from ..config import SQLITE_BUSY_TIMEOUT_MS, SQLITE_READ_POOL_SIZE, sqlite_path
 
 USER_INFO = UserInfo
 
+SCHEMA_VERSION = 2
+
 SQLITE_DATABASE_URL = f"sqlite+aiosqlite:///{sqlite_path}"
-engine = create_async_engine(SQLITE_DATABASE_URL)
+
+engine = create_async_engine(
+    SQLITE_DATABASE_URL,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=int(SQLITE_READ_POOL_SIZE),
+    max_overflow=0,
+    connect_args={"timeout": int(SQLITE_BUSY_TIMEOUT_MS) / 1000},
+)
+
+# SQLite allows a single writer at a time, so writes queue on one pooled
+# connection instead of contending for the database lock.
+writer_engine = create_async_engine(
+    SQLITE_DATABASE_URL,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=1,
+    max_overflow=0,
+    pool_timeout=int(SQLITE_BUSY_TIMEOUT_MS) / 1000,
+    connect_args={"timeout": int(SQLITE_BUSY_TIMEOUT_MS) / 1000},
+)
+
+
+def set_sqlite_pragmas(dbapi_connection, _) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.close()
+
+
+event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+event.listen(writer_engine.sync_engine, "connect", set_sqlite_pragmas)
+
+_schema_ready = False
 
 
 async def create_db_and_tables():
-    async with engine.begin() as conn:
-        # await conn.run_sync(SQLModel.metadata.drop_all)
-        await conn.run_sync(SQLModel.metadata.create_all)
+    global _schema_ready
+
+    if _schema_ready:
+        return
+
+    async with writer_engine.begin() as conn:
+        result = await conn.execute(text("PRAGMA user_version"))
+
+        if result.scalar() < SCHEMA_VERSION:
+            # await conn.run_sync(SQLModel.metadata.drop_all)
+            await conn.run_sync(SQLModel.metadata.create_all)
+            await conn.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION}"))
+
+    _schema_ready = True
+
+
+async def dispose_engines() -> None:
+    await engine.dispose()
+    await writer_engine.dispose()
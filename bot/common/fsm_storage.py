@@ -0,0 +1,150 @@
+import json
+import logging
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import (
+    BaseStorage,
+    DefaultKeyBuilder,
+    StateType,
+    StorageKey,
+)
+from aiogram.fsm.storage.memory import MemoryStorage
+from sqlalchemy import case, delete, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ..config import (
+    FSM_EVICTION_INTERVAL_SECONDS,
+    FSM_REDIS_URL,
+    FSM_STATE_TTL_SECONDS,
+    FSM_STORAGE,
+)
+from .database import engine, writer_engine
+from .models import FSMRecord
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteStorage(BaseStorage):
+    def __init__(
+        self,
+        state_ttl: float,
+        eviction_interval: float,
+        key_builder: Optional[DefaultKeyBuilder] = None,
+    ):
+        self.state_ttl = state_ttl
+        self.eviction_interval = eviction_interval
+        self.key_builder = key_builder or DefaultKeyBuilder(with_destiny=True)
+        self._last_eviction = 0.0
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        state = state.state if isinstance(state, State) else state
+        await self._upsert(self.key_builder.build(key), state=state)
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        record = await self._get_record(self.key_builder.build(key))
+        return record.state if record else None
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        await self._upsert(self.key_builder.build(key), data=json.dumps(dict(data)))
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        record = await self._get_record(self.key_builder.build(key))
+        return json.loads(record.data) if record else {}
+
+    async def close(self) -> None:
+        await self.evict_expired()
+
+    async def evict_expired(self) -> int:
+        now = time.time()
+        self._last_eviction = now
+
+        async with AsyncSession(writer_engine) as session:
+            result = await session.execute(
+                delete(FSMRecord).where(FSMRecord.expires_at <= now)
+            )
+            await session.commit()
+
+        if result.rowcount:
+            logger.info(f"Evicted {result.rowcount} abandoned FSM states")
+
+        return result.rowcount
+
+    async def _get_record(self, storage_key: str) -> Optional[FSMRecord]:
+        async with AsyncSession(engine) as session:
+            result = await session.execute(
+                select(FSMRecord).where(
+                    FSMRecord.key == storage_key, FSMRecord.expires_at > time.time()
+                )
+            )
+            return result.scalar_one_or_none()
+
+    async def _upsert(self, storage_key: str, **values) -> None:
+        now = time.time()
+        expired = FSMRecord.expires_at <= now
+        updates = dict(values)
+
+        # An expired row that has not been evicted yet must not leak its old
+        # state or data into the fresh record.
+        if "state" not in values:
+            updates["state"] = case((expired, None), else_=FSMRecord.state)
+        if "data" not in values:
+            updates["data"] = case((expired, "{}"), else_=FSMRecord.data)
+
+        updates["expires_at"] = now + self.state_ttl
+        statement = (
+            insert(FSMRecord)
+            .values(key=storage_key, **values, expires_at=updates["expires_at"])
+            .on_conflict_do_update(index_elements=[FSMRecord.key], set_=updates)
+        )
+
+        async with AsyncSession(writer_engine) as session:
+            await session.execute(statement)
+            await session.commit()
+
+        if now - self._last_eviction >= self.eviction_interval:
+            await self.evict_expired()
+
+
+def create_redis_storage(url: str, state_ttl: int, redis=None) -> BaseStorage:
+    try:
+        from aiogram.fsm.storage.redis import RedisStorage
+    except ImportError as e:
+        raise RuntimeError(
+            "FSM_STORAGE=redis requires the 'redis' package to be installed"
+        ) from e
+
+    key_builder = DefaultKeyBuilder(with_destiny=True)
+
+    if redis is not None:
+        return RedisStorage(
+            redis=redis,
+            key_builder=key_builder,
+            state_ttl=state_ttl,
+            data_ttl=state_ttl,
+        )
+
+    return RedisStorage.from_url(
+        url, key_builder=key_builder, state_ttl=state_ttl, data_ttl=state_ttl
+    )
+
+
+def create_fsm_storage(backend: str = None) -> BaseStorage:
+    backend = (backend or FSM_STORAGE).lower()
+    state_ttl = int(FSM_STATE_TTL_SECONDS)
+
+    if backend == "memory":
+        return MemoryStorage()
+
+    if backend == "sqlite":
+        return SQLiteStorage(
+            state_ttl=state_ttl,
+            eviction_interval=float(FSM_EVICTION_INTERVAL_SECONDS),
+        )
+
+    if backend == "redis":
+        return create_redis_storage(FSM_REDIS_URL, state_ttl)
+
+    raise ValueError(f"Unknown FSM storage backend: {backend}")
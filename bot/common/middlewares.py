@@ -0,0 +1,55 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from aiogram import BaseMiddleware, Dispatcher
+from aiogram.types import TelegramObject, User
+
+from .services.user_info_service import get_user_info
+
+DEFAULT_LANGUAGE_CODE = "en"
+
+
+class ConcurrencyLimitMiddleware(BaseMiddleware):
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        async with self._semaphore:
+            return await handler(event, data)
+
+
+class UserInfoMiddleware(BaseMiddleware):
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        user: User | None = data.get("event_from_user")
+        user_info = await get_user_info(user.id) if user else None
+
+        data["user_info"] = user_info
+        data["language_code"] = (
+            user_info.language_code
+            if user_info and user_info.language_code
+            else DEFAULT_LANGUAGE_CODE
+        )
+
+        return await handler(event, data)
+
+
+def register_middlewares(
+    dispatcher: Dispatcher, max_concurrent_updates: Optional[int] = None
+) -> None:
+    if max_concurrent_updates:
+        dispatcher.update.outer_middleware(
+            ConcurrencyLimitMiddleware(max_concurrent_updates)
+        )
+
+    dispatcher.update.outer_middleware(UserInfoMiddleware())
@@ -13,3 +13,11 @@ class UserInfo(SQLModel, table=True):
     phone_number: Optional[str] = Field(nullable=True)
     is_registered: bool = Field(default=False)
     is_support_pending: bool = Field(default=False)
+
+
+class FSMRecord(SQLModel, table=True):
+    __tablename__ = "fsm_state"
+    key: str = Field(primary_key=True)
+    state: Optional[str] = Field(default=None, nullable=True)
+    data: str = Field(default="{}")
+    expires_at: float = Field(index=True)
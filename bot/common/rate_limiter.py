@@ -0,0 +1,86 @@
+import asyncio
+import time
+from typing import Dict, Hashable
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+
+            self.tokens -= 1
+
+    def reserve(self) -> float:
+        self._refill()
+        delay = max(0.0, (1 - self.tokens) / self.rate)
+        self.tokens -= 1
+        return delay
+
+    def is_idle(self) -> bool:
+        self._refill()
+        return self.tokens >= self.capacity and not self._lock.locked()
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        global_rate: float,
+        per_chat_rate: float,
+        per_chat_burst: float = 1,
+        max_chats: int = 10000,
+    ):
+        self.per_chat_rate = per_chat_rate
+        self.per_chat_burst = per_chat_burst
+        self.max_chats = max_chats
+        self.global_rate = global_rate
+        self.global_bucket = TokenBucket(global_rate)
+        self._chat_buckets: Dict[Hashable, TokenBucket] = {}
+
+    def reset(self) -> None:
+        self.global_bucket = TokenBucket(self.global_rate)
+        self._chat_buckets.clear()
+
+    def _chat_bucket(self, chat_id: Hashable) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+
+        if bucket is None:
+            if len(self._chat_buckets) >= self.max_chats:
+                self._prune_idle_buckets()
+
+            bucket = TokenBucket(self.per_chat_rate, capacity=self.per_chat_burst)
+            self._chat_buckets[chat_id] = bucket
+
+        return bucket
+
+    def _prune_idle_buckets(self) -> None:
+        for chat_id, bucket in list(self._chat_buckets.items()):
+            if bucket.is_idle():
+                del self._chat_buckets[chat_id]
+
+    def reserve(self, chat_id: Hashable) -> float:
+        return self._chat_bucket(chat_id).reserve()
+
+    async def acquire_global(self) -> None:
+        await self.global_bucket.acquire()
+
+    async def acquire(self, chat_id: Hashable) -> None:
+        await self._chat_bucket(chat_id).acquire()
+        await self.global_bucket.acquire()
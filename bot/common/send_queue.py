@@ -0,0 +1,320 @@
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Any, Deque, Dict, Hashable, Optional
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendMessage, TelegramMethod
+
+from ..config import (
+    OUTBOUND_QUEUE_MAX_SIZE,
+    OUTBOUND_QUEUE_WORKERS,
+    TG_GLOBAL_RATE_LIMIT,
+    TG_PER_CHAT_BURST,
+    TG_PER_CHAT_RATE_LIMIT,
+    TG_SEND_MAX_RETRIES,
+)
+from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    PAYMENT = 0
+    ORDER = 1
+    DEFAULT = 2
+    RENDER = 3
+
+
+class OutboundItem:
+    __slots__ = (
+        "priority",
+        "sequence",
+        "enqueued_at",
+        "bot",
+        "method",
+        "future",
+        "chat_id",
+        "retries",
+        "ready",
+    )
+
+    def __init__(
+        self,
+        priority: Priority,
+        sequence: int,
+        bot: Bot,
+        method: TelegramMethod,
+        future: asyncio.Future,
+    ):
+        self.priority = priority
+        self.sequence = sequence
+        self.enqueued_at = time.monotonic()
+        self.bot = bot
+        self.method = method
+        self.future = future
+        self.chat_id: Optional[Hashable] = getattr(method, "chat_id", None)
+        self.retries = 0
+        # Set once the item holds its chat's send slot and rate-limit token.
+        self.ready = False
+
+    def __lt__(self, other: "OutboundItem") -> bool:
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+
+# Each chat has at most one message in flight; later messages for it wait in a
+# per-chat backlog. A message whose chat has no rate-limit token left (or that
+# hit flood control) is put back on the queue by a timer instead of sleeping
+# inside a worker, so workers only ever wait on the global limit and a
+# throttled chat cannot hold up other chats' higher-priority messages.
+class OutboundQueue:
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        workers: int,
+        max_size: int,
+        max_retries: int,
+    ):
+        self.rate_limiter = rate_limiter
+        self.workers = workers
+        self.max_size = max_size
+        self.max_retries = max_retries
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._tasks = []
+        self._timers: Dict[asyncio.TimerHandle, OutboundItem] = {}
+        self._sequence = itertools.count()
+        self._chat_backlogs: Dict[Hashable, Deque[OutboundItem]] = {}
+        self._parked = 0
+        self._lane_depth = {priority: 0 for priority in Priority}
+        self.metrics = {
+            "enqueued": 0,
+            "sent": 0,
+            "failed": 0,
+            "retried": 0,
+            "deferred": 0,
+            "blocked": 0,
+            "max_depth": 0,
+            "wait_seconds": 0.0,
+        }
+
+    def _start(self) -> None:
+        self._queue = asyncio.PriorityQueue()
+        self._slots = asyncio.Semaphore(self.max_size)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def send(
+        self,
+        bot: Bot,
+        method: TelegramMethod,
+        priority: Priority = Priority.DEFAULT,
+    ) -> Any:
+        if self._queue is None:
+            self._start()
+
+        if self._slots.locked():
+            self.metrics["blocked"] += 1
+
+        await self._slots.acquire()
+
+        future = asyncio.get_running_loop().create_future()
+        item = OutboundItem(priority, next(self._sequence), bot, method, future)
+        self._lane_depth[priority] += 1
+        self._queue.put_nowait(item)
+
+        self.metrics["enqueued"] += 1
+        self.metrics["max_depth"] = max(self.metrics["max_depth"], self._queue.qsize())
+
+        return await future
+
+    async def send_message(
+        self,
+        bot: Bot,
+        chat_id: int | str,
+        text: str,
+        priority: Priority = Priority.DEFAULT,
+        **kwargs,
+    ) -> Any:
+        return await self.send(
+            bot, SendMessage(chat_id=chat_id, text=text, **kwargs), priority
+        )
+
+    def _park(self, item: OutboundItem, delay: float) -> None:
+        self._parked += 1
+
+        def resume() -> None:
+            self._timers.pop(timer, None)
+            self._parked -= 1
+            self._queue.put_nowait(item)
+
+        timer = asyncio.get_running_loop().call_later(delay, resume)
+        self._timers[timer] = item
+
+    def _schedule(self, item: OutboundItem) -> float:
+        item.ready = True
+        delay = self.rate_limiter.reserve(item.chat_id)
+
+        if delay > 0:
+            self.metrics["deferred"] += 1
+            self._park(item, delay)
+
+        return delay
+
+    def _release_chat(self, chat_id: Hashable) -> None:
+        backlog = self._chat_backlogs.get(chat_id)
+
+        if backlog:
+            self._parked -= 1
+            item = backlog.popleft()
+
+            if not self._schedule(item):
+                self._queue.put_nowait(item)
+        else:
+            self._chat_backlogs.pop(chat_id, None)
+
+    async def _worker(self) -> None:
+        while True:
+            item: OutboundItem = await self._queue.get()
+
+            try:
+                if item.chat_id is not None and not item.ready:
+                    if item.chat_id in self._chat_backlogs:
+                        self._chat_backlogs[item.chat_id].append(item)
+                        self._parked += 1
+                        continue
+
+                    self._chat_backlogs[item.chat_id] = deque()
+
+                    if self._schedule(item):
+                        continue
+
+                await self._process(item)
+
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, item: OutboundItem) -> None:
+        await self.rate_limiter.acquire_global()
+
+        try:
+            result = await item.bot(item.method)
+
+        except TelegramRetryAfter as e:
+            if item.retries < self.max_retries:
+                item.retries += 1
+                self.metrics["retried"] += 1
+                logger.warning(
+                    f"Flood control for chat {item.chat_id}, "
+                    f"retrying in {e.retry_after}s"
+                )
+                self._park(item, e.retry_after)
+                return
+
+            self._finish(item, error=e)
+
+        except Exception as e:
+            self._finish(item, error=e)
+
+        else:
+            self._finish(item, result=result)
+
+    def _finish(
+        self, item: OutboundItem, result: Any = None, error: Exception = None
+    ) -> None:
+        self._lane_depth[item.priority] -= 1
+        self._slots.release()
+        self.metrics["wait_seconds"] += time.monotonic() - item.enqueued_at
+
+        if error is None:
+            self.metrics["sent"] += 1
+
+            if not item.future.done():
+                item.future.set_result(result)
+        else:
+            self.metrics["failed"] += 1
+
+            if not item.future.done():
+                item.future.set_exception(error)
+
+        if item.chat_id is not None:
+            self._release_chat(item.chat_id)
+
+    def stats(self) -> Dict[str, Any]:
+        processed = self.metrics["sent"] + self.metrics["failed"]
+        return {
+            **self.metrics,
+            "wait_seconds": round(self.metrics["wait_seconds"], 3),
+            "avg_wait_ms": (
+                round(self.metrics["wait_seconds"] / processed * 1000, 2)
+                if processed
+                else 0
+            ),
+            "depth": self._queue.qsize() if self._queue else 0,
+            "parked": self._parked,
+            "throttled_chats": len(self._chat_backlogs),
+            "lanes": {
+                priority.name.lower(): depth
+                for priority, depth in self._lane_depth.items()
+            },
+        }
+
+    async def _drain(self) -> None:
+        while True:
+            await self._queue.join()
+
+            if not self._parked:
+                return
+
+            await asyncio.sleep(0.05)
+
+    async def close(self, timeout: float = 10) -> None:
+        if self._queue is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._drain(), timeout=timeout)
+
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Dropping {self._queue.qsize() + self._parked} queued outbound messages"
+            )
+
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        leftovers = list(self._timers.values())
+        for timer in self._timers:
+            timer.cancel()
+        for backlog in self._chat_backlogs.values():
+            leftovers.extend(backlog)
+        while not self._queue.empty():
+            leftovers.append(self._queue.get_nowait())
+        for item in leftovers:
+            item.future.cancel()
+
+        self._queue = None
+        self._slots = None
+        self._tasks = []
+        self._timers = {}
+        self._chat_backlogs = {}
+        self._parked = 0
+        self._lane_depth = {priority: 0 for priority in Priority}
+        self.rate_limiter.reset()
+
+
+outbound_queue = OutboundQueue(
+    rate_limiter=RateLimiter(
+        global_rate=float(TG_GLOBAL_RATE_LIMIT),
+        per_chat_rate=float(TG_PER_CHAT_RATE_LIMIT),
+        per_chat_burst=float(TG_PER_CHAT_BURST),
+    ),
+    workers=int(OUTBOUND_QUEUE_WORKERS),
+    max_size=int(OUTBOUND_QUEUE_MAX_SIZE),
+    max_retries=int(TG_SEND_MAX_RETRIES),
+)
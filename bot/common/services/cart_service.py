@@ -2,52 +2,52 @@ from typing import List
 
 from api.app.cart.schemas import CartItemFullResponse, CartItemResponse
 
-from ...common.utils import make_request
-from ...config import APIAuth, APIMethods
+from ...common.models import UserInfo
+from ...common.utils import build_auth_headers, make_request
+from ...config import APIMethods
 from .user_info_service import get_user_info
 
 BASE = "cart"
 
 
-async def add_to_cart(telegram_id: int, product_id: int, company_id: int) -> None:
-    user_info = await get_user_info(telegram_id)
+async def add_to_cart(
+    telegram_id: int, product_id: int, company_id: int, user_info: UserInfo = None
+) -> None:
+    user_info = user_info or await get_user_info(telegram_id)
     data = {"product_id": product_id, "quantity": 1, "company_id": company_id}
     response = await make_request(
         sub_url=f"{BASE}/add/",
         method=APIMethods.POST.value,
         body=data,
-        headers={
-            APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-        },
+        headers=build_auth_headers(user_info),
     )
 
     return response
 
 
-async def clear_cart(telegram_id: int) -> None:
-    user_info = await get_user_info(telegram_id)
+async def clear_cart(telegram_id: int, user_info: UserInfo = None) -> None:
+    user_info = user_info or await get_user_info(telegram_id)
     response = await make_request(
         sub_url=f"{BASE}/clear/",
         method=APIMethods.DELETE.value,
-        headers={
-            APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-        },
+        headers=build_auth_headers(user_info),
     )
 
     return response
 
 
 async def get_cart_items(
-    telegram_id: int, page: int = None, return_all: bool = False
+    telegram_id: int,
+    page: int = None,
+    return_all: bool = False,
+    user_info: UserInfo = None,
 ) -> CartItemFullResponse | List[CartItemResponse] | None:
-    user_info = await get_user_info(telegram_id)
+    user_info = user_info or await get_user_info(telegram_id)
     response = await make_request(
         sub_url=f"{BASE}/",
         method=APIMethods.GET.value,
         params={"page": page} if page else {"return_all": str(return_all)},
-        headers={
-            APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-        },
+        headers=build_auth_headers(user_info),
     )
 
     if response.get("data") is None:
@@ -59,29 +59,29 @@ async def get_cart_items(
     return CartItemFullResponse.model_validate(response.get("data"))
 
 
-async def change_amount(telegram_id: int, item_id: int, amount: int) -> None:
-    user_info = await get_user_info(telegram_id)
+async def change_amount(
+    telegram_id: int, item_id: int, amount: int, user_info: UserInfo = None
+) -> None:
+    user_info = user_info or await get_user_info(telegram_id)
     data = {"item_id": item_id, "amount": amount}
     response = await make_request(
         sub_url=f"{BASE}/amount/",
         method=APIMethods.PATCH.value,
         body=data,
-        headers={
-            APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-        },
+        headers=build_auth_headers(user_info),
     )
 
     return response
 
 
-async def remove_from_cart(telegram_id: int, item_id: int) -> None:
-    user_info = await get_user_info(telegram_id)
+async def remove_from_cart(
+    telegram_id: int, item_id: int, user_info: UserInfo = None
+) -> None:
+    user_info = user_info or await get_user_info(telegram_id)
     response = await make_request(
         sub_url=f"{BASE}/remove/{item_id}/",
         method=APIMethods.DELETE.value,
-        headers={
-            APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-        },
+        headers=build_auth_headers(user_info),
     )
 
     return response
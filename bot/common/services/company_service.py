@@ -4,8 +4,9 @@ from typing import Dict, List, Optional
 from api.app.company.schemas import CompanyListResponse, CompanyResponse
 
 from ...common.services.user_info_service import get_user_info
-from ...config import APIAuth, APIMethods
-from ..utils import make_request
+from ...config import APIMethods
+from ..models import UserInfo
+from ..utils import build_auth_headers, make_request
 from .gastronomy_service import kitchen_service
 
 
@@ -13,14 +14,14 @@ class CompanyEndpoints(Enum):
     BASE = "company/"
 
 
-async def create_company(telegram_id: int, data: Dict) -> Optional[CompanyResponse]:
-    user_info = await get_user_info(telegram_id)
+async def create_company(
+    telegram_id: int, data: Dict, user_info: UserInfo = None
+) -> Optional[CompanyResponse]:
+    user_info = user_info or await get_user_info(telegram_id)
     response = await make_request(
         sub_url=CompanyEndpoints.BASE.value,
         method=APIMethods.POST.value,
-        headers={
-            APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-        },
+        headers=build_auth_headers(user_info),
         body=data,
     )
     return CompanyResponse.model_validate(response.get("data"))
@@ -65,40 +66,38 @@ class CompanyService:
         )
         return CompanyResponse.model_validate(response.get("data"))
 
-    async def create(self, data: Dict, telegram_id: int) -> Optional[CompanyResponse]:
-        user_info = await get_user_info(telegram_id)
+    async def create(
+        self, data: Dict, telegram_id: int, user_info: UserInfo = None
+    ) -> Optional[CompanyResponse]:
+        user_info = user_info or await get_user_info(telegram_id)
         response = await make_request(
             sub_url=self.prefix,
             method=APIMethods.POST.value,
             data=data,
-            headers={
-                APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-            },
+            headers=build_auth_headers(user_info),
         )
         return CompanyResponse.model_validate(response.get("data"))
 
     async def update(
-        self, item_id: int, data: Dict, telegram_id: int
+        self, item_id: int, data: Dict, telegram_id: int, user_info: UserInfo = None
     ) -> Optional[CompanyResponse]:
-        user_info = await get_user_info(telegram_id)
+        user_info = user_info or await get_user_info(telegram_id)
         response = await make_request(
             sub_url=f"{self.prefix}{item_id}/",
             method=APIMethods.PATCH.value,
             data=data,
-            headers={
-                APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-            },
+            headers=build_auth_headers(user_info),
         )
         return CompanyResponse.model_validate(response.get("data"))
 
-    async def delete(self, item_id: int, telegram_id: int) -> None:
-        user_info = await get_user_info(telegram_id)
+    async def delete(
+        self, item_id: int, telegram_id: int, user_info: UserInfo = None
+    ) -> None:
+        user_info = user_info or await get_user_info(telegram_id)
         await make_request(
             sub_url=f"{self.prefix}{item_id}/",
             method=APIMethods.DELETE.value,
-            headers={
-                APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-            },
+            headers=build_auth_headers(user_info),
         )
 
 
@@ -4,8 +4,9 @@ from typing import Dict, Optional
 from api.app.gastronomy.schemas import KitchenListResponse, KitchenResponse
 
 from ...common.services.user_info_service import get_user_info
-from ...config import APIAuth, APIMethods
-from ..utils import make_request
+from ...config import APIMethods
+from ..models import UserInfo
+from ..utils import build_auth_headers, make_request
 
 
 class EntityType(Enum):
@@ -48,16 +49,16 @@ class GastronomyService:
 
             return {"error": error_msg, "status": "failed", "status_code": status_code}
 
-    async def create(self, data: Dict, telegram_id: int) -> Optional[Dict]:
+    async def create(
+        self, data: Dict, telegram_id: int, user_info: UserInfo = None
+    ) -> Optional[Dict]:
         try:
-            user_info = await get_user_info(telegram_id)
+            user_info = user_info or await get_user_info(telegram_id)
             response = await make_request(
                 sub_url=self.prefix,
                 method=APIMethods.POST.value,
                 body=data,
-                headers={
-                    APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-                },
+                headers=build_auth_headers(user_info),
             )
             return self.item_schema.model_validate(response.get("data"))
         except Exception as e:
@@ -67,17 +68,15 @@ class GastronomyService:
             return {"error": error_msg, "status": "failed", "status_code": status_code}
 
     async def update(
-        self, item_id: int, data: Dict, telegram_id: int
+        self, item_id: int, data: Dict, telegram_id: int, user_info: UserInfo = None
     ) -> Optional[Dict]:
         try:
-            user_info = await get_user_info(telegram_id)
+            user_info = user_info or await get_user_info(telegram_id)
             response = await make_request(
                 sub_url=f"{self.prefix}{item_id}/",
                 method=APIMethods.PATCH.value,
                 body=data,
-                headers={
-                    APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-                },
+                headers=build_auth_headers(user_info),
             )
             return self.item_schema.model_validate(response.get("data"))
         except Exception as e:
@@ -86,15 +85,15 @@ class GastronomyService:
 
             return {"error": error_msg, "status": "failed", "status_code": status_code}
 
-    async def delete(self, item_id: int, telegram_id: int) -> Optional[Dict]:
+    async def delete(
+        self, item_id: int, telegram_id: int, user_info: UserInfo = None
+    ) -> Optional[Dict]:
         try:
-            user_info = await get_user_info(telegram_id)
+            user_info = user_info or await get_user_info(telegram_id)
             await make_request(
                 sub_url=f"{self.prefix}{item_id}/",
                 method=APIMethods.DELETE.value,
-                headers={
-                    APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-                },
+                headers=build_auth_headers(user_info),
             )
             return {"status": "success"}
         except Exception as e:
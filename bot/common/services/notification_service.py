@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError
+
+from api.app.utils import TTLCache
+
+from ...config import ADMIN_CACHE_TTL_SECONDS
+from ..send_queue import OutboundQueue, Priority, outbound_queue
+from .user_info_service import get_user_info
+from .user_service import retrieve_admins
+
+logger = logging.getLogger(__name__)
+
+ADMINS_CACHE_KEY = "admins"
+
+
+class AdminNotifier:
+    def __init__(self, queue: OutboundQueue, admin_cache_ttl: float):
+        self.queue = queue
+        # Roles are only changed through the API, which the bot cannot observe,
+        # so a promoted or demoted admin is picked up once this entry expires
+        # (ADMIN_CACHE_TTL_SECONDS) rather than immediately.
+        self.admin_cache = TTLCache(max_size=1, ttl=admin_cache_ttl)
+        self.stats = {"sent": 0, "failed": 0}
+
+    async def get_admin_ids(self) -> List[int]:
+        admin_ids = self.admin_cache.get(ADMINS_CACHE_KEY)
+
+        if admin_ids is None:
+            admins = await retrieve_admins()
+            admin_ids = [admin.telegram_id for admin in admins if admin.telegram_id]
+            self.admin_cache.set(ADMINS_CACHE_KEY, admin_ids)
+
+        return admin_ids
+
+    async def send(self, bot: Bot, chat_id: int, text: str, **kwargs) -> bool:
+        try:
+            await self.queue.send_message(
+                bot, chat_id, text, priority=Priority.ORDER, **kwargs
+            )
+            return True
+
+        except TelegramAPIError as e:
+            logger.warning(f"Failed to send message to chat {chat_id}: {e}")
+            return False
+
+    async def notify_admins(
+        self, bot: Bot, build_text: Callable[[str], str], **kwargs
+    ) -> Dict:
+        started_at = time.perf_counter()
+
+        try:
+            admin_ids = await self.get_admin_ids()
+
+        except Exception:
+            logger.exception("Failed to load admins for notification")
+            admin_ids = []
+
+        async def notify(admin_id: int) -> bool:
+            user_info = await get_user_info(admin_id)
+            language_code = user_info.language_code if user_info else "en"
+            return await self.send(bot, admin_id, build_text(language_code), **kwargs)
+
+        # One admin's failure (lookup error, closed queue) must not abort the
+        # rest of the fan-out or reach the caller, which has already answered
+        # the user.
+        results = await asyncio.gather(
+            *(notify(admin_id) for admin_id in admin_ids), return_exceptions=True
+        )
+
+        for admin_id, result in zip(admin_ids, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to notify admin {admin_id}: {result!r}")
+
+        sent = sum(result is True for result in results)
+        report = {
+            "admins": len(admin_ids),
+            "sent": sent,
+            "failed": len(results) - sent,
+            "elapsed": round(time.perf_counter() - started_at, 3),
+        }
+        for key in self.stats:
+            self.stats[key] += report[key]
+
+        logger.info(f"Admin notification delivered: {report}")
+        return report
+
+
+admin_notifier = AdminNotifier(
+    queue=outbound_queue, admin_cache_ttl=float(ADMIN_CACHE_TTL_SECONDS)
+)
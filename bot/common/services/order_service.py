@@ -1,70 +1,81 @@
 from api.app.order.models import Order
-from api.app.order.schemas import OrderCreate, OrderResponse
+from api.app.order.schemas import (
+    OrderCountResponse,
+    OrderCreate,
+    OrderListResponse,
+    OrderResponse,
+)
 
 from ...common.models import UserInfo
 from ...common.services.user_info_service import get_user_info
-from ...common.utils import make_request
-from ...config import APIAuth, APIMethods
+from ...common.utils import build_auth_headers, make_request
+from ...config import APIMethods
 
 BASE = "order"
 
 
-async def create_order(order_create: OrderCreate, user_id: int):
-    user_info = await get_user_info(user_id)
+async def create_order(
+    order_create: OrderCreate, user_id: int, user_info: UserInfo = None
+):
+    user_info = user_info or await get_user_info(user_id)
     response = await make_request(
         sub_url=f"{BASE}/",
         method=APIMethods.POST.value,
         body=order_create.model_dump(),
-        headers={
-            APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-        },
+        headers=build_auth_headers(user_info),
     )
 
     return Order.model_validate(response.get("data"))
 
 
-async def update_order_purchase_info(order_id: int, user_id: int):
-    user_info = await get_user_info(user_id)
+async def update_order_purchase_info(
+    order_id: int, user_id: int, user_info: UserInfo = None
+):
+    user_info = user_info or await get_user_info(user_id)
     await make_request(
         sub_url=f"{BASE}/pay/{order_id}/",
         method=APIMethods.PUT.value,
-        headers={
-            APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-        },
+        headers=build_auth_headers(user_info),
     )
 
 
-async def accept_order(order_id: int, user_id: int):
-    user_info = await get_user_info(user_id)
+async def accept_order(order_id: int, user_id: int, user_info: UserInfo = None):
+    user_info = user_info or await get_user_info(user_id)
     response = await make_request(
         sub_url=f"{BASE}/accept/{order_id}/",
         method=APIMethods.PUT.value,
-        headers={
-            APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-        },
+        headers=build_auth_headers(user_info),
     )
     return response
 
 
-async def get_paid_orders(user_id: int):
-    user_info = await get_user_info(user_id)
+async def get_paid_orders(user_id: int, user_info: UserInfo = None):
+    user_info = user_info or await get_user_info(user_id)
     response = await make_request(
         sub_url=f"{BASE}/paid/",
         method=APIMethods.GET.value,
-        headers={
-            APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-        },
+        headers=build_auth_headers(user_info),
     )
 
     return [OrderResponse.model_validate(item) for item in response.get("data")]
 
 
-async def get_orders(user_info: UserInfo):
+async def get_pending_orders(
+    user_info: UserInfo, page: int = 1, limit: int = 10
+) -> OrderListResponse:
     response = await make_request(
-        sub_url=f"{BASE}/",
+        sub_url=f"{BASE}/admin/pending/",
         method=APIMethods.GET.value,
-        headers={
-            APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-        },
+        params={"page": page, "limit": limit},
+        headers=build_auth_headers(user_info),
     )
-    return [OrderResponse.model_validate(item) for item in response.get("data")]
+    return OrderListResponse.model_validate(response.get("data"))
+
+
+async def count_pending_orders(user_info: UserInfo) -> int:
+    response = await make_request(
+        sub_url=f"{BASE}/admin/pending/count/",
+        method=APIMethods.GET.value,
+        headers=build_auth_headers(user_info),
+    )
+    return OrderCountResponse.model_validate(response.get("data")).count
@@ -10,9 +10,9 @@ from api.app.product.crud import create_product
 from api.app.product.schemas import ProductCreate, ProductListResponse, ProductResponse
 
 from ...common.services.user_info_service import get_user_info
-from ...config import APIAuth, APIMethods
+from ...config import APIMethods
 from ..models import UserInfo
-from ..utils import make_request
+from ..utils import build_auth_headers, make_request
 
 
 class ProductEndpoints(Enum):
@@ -40,9 +40,7 @@ class ProductService:
         response = await make_request(
             sub_url=f"{self.prefix}recommendations/",
             method=APIMethods.GET.value,
-            headers={
-                APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-            },
+            headers=build_auth_headers(user_info),
         )
         return ProductListResponse.model_validate(response.get("data"))
 
@@ -66,27 +64,25 @@ class ProductService:
             await create_product(session=session, product_create=product_create)
 
     async def update(
-        self, item_id: int, data: Dict, telegram_id: int
+        self, item_id: int, data: Dict, telegram_id: int, user_info: UserInfo = None
     ) -> Optional[ProductResponse]:
-        user_info = await get_user_info(telegram_id)
+        user_info = user_info or await get_user_info(telegram_id)
         response = await make_request(
             sub_url=f"{self.prefix}{item_id}/",
             method=APIMethods.PATCH.value,
             data=data,
-            headers={
-                APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-            },
+            headers=build_auth_headers(user_info),
         )
         return ProductResponse.model_validate(response.get("data"))
 
-    async def delete(self, item_id: int, telegram_id: int) -> None:
-        user_info = await get_user_info(telegram_id)
+    async def delete(
+        self, item_id: int, telegram_id: int, user_info: UserInfo = None
+    ) -> None:
+        user_info = user_info or await get_user_info(telegram_id)
         await make_request(
             sub_url=f"{self.prefix}{item_id}/",
             method=APIMethods.DELETE.value,
-            headers={
-                APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-            },
+            headers=build_auth_headers(user_info),
         )
 
 
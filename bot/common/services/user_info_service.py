@@ -1,65 +1,93 @@
-from typing import Optional
+from typing import Dict, Optional
 
-from sqlmodel import select
+from sqlalchemy import update
+from sqlalchemy.dialects.sqlite import insert
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from ...common.database import engine
+from api.app.utils import TTLCache
+
+from ...common.database import engine, writer_engine
 from ...common.models import UserInfo
+from ...config import USER_INFO_CACHE_SIZE, USER_INFO_CACHE_TTL_SECONDS
+
+user_info_cache = TTLCache(
+    max_size=int(USER_INFO_CACHE_SIZE), ttl=float(USER_INFO_CACHE_TTL_SECONDS)
+)
 
 
 async def get_user_info(telegram_id: int) -> Optional[UserInfo]:
-    async with AsyncSession(engine) as session:
-        statement = select(UserInfo).where(UserInfo.telegram_id == telegram_id)
-        result = await session.exec(statement)
-        user_info = result.first()
-        return user_info
+    user_info = user_info_cache.get(telegram_id)
 
+    if user_info is not None:
+        return user_info
 
-async def create_user_info(telegram_id: int, language_code: str) -> UserInfo:
     async with AsyncSession(engine) as session:
-        existing_user = await get_user_info(telegram_id)
+        user_info = await session.get(UserInfo, telegram_id)
+
+    if user_info is not None:
+        user_info_cache.set(telegram_id, user_info)
+
+    return user_info
 
-        if existing_user:
-            existing_user.language_code = language_code
-            await session.commit()
-            return existing_user
 
-        user_info = UserInfo(telegram_id=telegram_id, language_code=language_code)
-        session.add(user_info)
+async def create_user_info(telegram_id: int, language_code: str) -> UserInfo:
+    statement = (
+        insert(UserInfo)
+        .values(telegram_id=telegram_id, language_code=language_code)
+        .on_conflict_do_update(
+            index_elements=[UserInfo.telegram_id],
+            set_={"language_code": language_code},
+        )
+        .returning(UserInfo)
+    )
+
+    async with AsyncSession(writer_engine, expire_on_commit=False) as session:
+        result = await session.execute(statement)
+        user_info = result.scalar_one()
         await session.commit()
-        await session.refresh(user_info)
 
-        return user_info
+    user_info_cache.set(telegram_id, user_info)
+    return user_info
 
 
 async def update_user_info(telegram_id: int, **fields) -> UserInfo:
-    async with AsyncSession(engine) as session:
-        existing_user = await get_user_info(telegram_id)
+    for field_name in fields:
+        if field_name not in UserInfo.model_fields:
+            raise AttributeError(f"Field {field_name} does not exist in user object")
 
-        if existing_user is None:
-            raise ValueError(f"User with telegram_id {telegram_id} not found")
+    statement = (
+        update(UserInfo)
+        .where(UserInfo.telegram_id == telegram_id)
+        .values(**fields)
+        .returning(UserInfo)
+    )
 
-        for field_name, new_value in fields.items():
-            if not hasattr(existing_user, field_name):
-                raise AttributeError(
-                    f"Field {field_name} does not exist in user object"
-                )
+    async with AsyncSession(writer_engine, expire_on_commit=False) as session:
+        result = await session.execute(statement)
+        existing_user = result.scalar_one_or_none()
 
-            setattr(existing_user, field_name, new_value)
+        if existing_user is None:
+            raise ValueError(f"User with telegram_id {telegram_id} not found")
 
-        session.add(existing_user)
         await session.commit()
-        await session.refresh(existing_user)
 
-        return existing_user
+    user_info_cache.set(telegram_id, existing_user)
+    return existing_user
 
 
 async def delete_user_info(telegram_id: int) -> None:
-    async with AsyncSession(engine) as session:
-        existing_user = await get_user_info(telegram_id)
+    async with AsyncSession(writer_engine) as session:
+        existing_user = await session.get(UserInfo, telegram_id)
 
         if existing_user is None:
+            user_info_cache.pop(telegram_id)
             raise ValueError(f"User with telegram_id {telegram_id} not found")
 
         await session.delete(existing_user)
         await session.commit()
+
+    user_info_cache.pop(telegram_id)
+
+
+def get_user_info_cache_stats() -> Dict[str, int]:
+    return user_info_cache.stats()
@@ -17,9 +17,10 @@ from api.app.user.schemas import (
 from api.app.utils import get_entity_by_params
 
 from ...common.services.user_info_service import get_user_info
-from ...config import APIAuth, APIMethods
+from ...config import APIMethods
+from ..models import UserInfo
 from ..services.user_info_service import delete_user_info, get_user_info
-from ..utils import make_request
+from ..utils import build_auth_headers, make_request
 
 user_prefix = "users"
 
@@ -31,8 +32,10 @@ class UserEndpoints(Enum):
     USER_LOGIN = f"{user_prefix}/token/"
 
 
-async def get_user(telegram_id: int) -> UserResponseMe | None:
-    user_info = await get_user_info(telegram_id)
+async def get_user(
+    telegram_id: int, user_info: UserInfo = None
+) -> UserResponseMe | None:
+    user_info = user_info or await get_user_info(telegram_id)
 
     if not user_info or not user_info.is_registered:
         return None
@@ -40,9 +43,7 @@ async def get_user(telegram_id: int) -> UserResponseMe | None:
     response = await make_request(
         sub_url=UserEndpoints.USER_GET_ME.value,
         method=APIMethods.GET.value,
-        headers={
-            APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-        },
+        headers=build_auth_headers(user_info),
     )
 
     if response.get("status") == status.HTTP_401_UNAUTHORIZED:
@@ -59,8 +60,10 @@ async def retrieve_admins() -> List[UserResponse]:
         )
 
 
-async def update_user(telegram_id: int, **fields) -> UserResponseMe | None:
-    user_info = await get_user_info(telegram_id)
+async def update_user(
+    telegram_id: int, user_info: UserInfo = None, **fields
+) -> UserResponseMe | None:
+    user_info = user_info or await get_user_info(telegram_id)
 
     if not user_info or not user_info.is_registered:
         return None
@@ -68,9 +71,7 @@ async def update_user(telegram_id: int, **fields) -> UserResponseMe | None:
     response = await make_request(
         sub_url=UserEndpoints.USER_UPDATE_ME.value,
         method=APIMethods.PATCH.value,
-        headers={
-            APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"
-        },
+        headers=build_auth_headers(user_info),
         body=fields,
     )
 
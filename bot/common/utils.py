@@ -1,8 +1,64 @@
-from typing import Dict
+from typing import Dict, Optional
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
-from bot.config import API_BASE_URL
+from api.app.utils import TTLCache
+from bot.config import (
+    API_BASE_URL,
+    API_CLIENT_CONNECT_TIMEOUT,
+    API_CLIENT_KEEPALIVE_TIMEOUT,
+    API_CLIENT_LIMIT,
+    API_CLIENT_LIMIT_PER_HOST,
+    API_CLIENT_TIMEOUT,
+    API_VALIDATOR_CACHE_SIZE,
+    API_VALIDATOR_CACHE_TTL_SECONDS,
+    APIAuth,
+)
+
+from .models import UserInfo
+
+_client_session: Optional[ClientSession] = None
+
+validator_cache = TTLCache(
+    max_size=int(API_VALIDATOR_CACHE_SIZE),
+    ttl=float(API_VALIDATOR_CACHE_TTL_SECONDS),
+)
+
+
+async def get_client_session() -> ClientSession:
+    global _client_session
+
+    if _client_session is None or _client_session.closed:
+        _client_session = ClientSession(
+            connector=TCPConnector(
+                limit=int(API_CLIENT_LIMIT),
+                limit_per_host=int(API_CLIENT_LIMIT_PER_HOST),
+                keepalive_timeout=float(API_CLIENT_KEEPALIVE_TIMEOUT),
+                ttl_dns_cache=300,
+            ),
+            timeout=ClientTimeout(
+                total=float(API_CLIENT_TIMEOUT),
+                connect=float(API_CLIENT_CONNECT_TIMEOUT),
+            ),
+        )
+
+    return _client_session
+
+
+async def close_client_session() -> None:
+    global _client_session
+
+    if _client_session is not None and not _client_session.closed:
+        await _client_session.close()
+
+    _client_session = None
+
+
+def build_auth_headers(user_info: Optional[UserInfo]) -> Dict:
+    if not user_info or not user_info.access_token:
+        return {}
+
+    return {APIAuth.AUTH.value: f"{user_info.token_type} {user_info.access_token}"}
 
 
 async def make_request(
@@ -13,28 +69,51 @@ async def make_request(
     params: Dict = None,
     headers: Dict = None,
 ) -> Dict:
-    async with ClientSession() as session:
-        url = f"{API_BASE_URL}/{sub_url}"
-
-        try:
-            async with session.request(
-                method=method,
-                url=url,
-                json=body,
-                data=data,
-                params=params,
-                headers=headers,
-            ) as response:
-                status_code = response.status
-                data = await response.json()
-                if status_code >= 400:
-                    return {
-                        "status": status_code,
-                        "error": data.get("error"),
-                        "detail": data.get("detail"),
-                    }
-
-                return {"status": status_code, "data": data}
-
-        except Exception as e:
-            return {"status": 400, "data": {"error": str(e)}}
+    session = await get_client_session()
+    url = f"{API_BASE_URL}/{sub_url}"
+    cache_key = None
+    cached = None
+
+    if method.upper() == "GET":
+        cache_key = (
+            url,
+            frozenset((params or {}).items()),
+            (headers or {}).get(APIAuth.AUTH.value),
+        )
+        cached = validator_cache.get(cache_key)
+
+        if cached is not None:
+            headers = {**(headers or {}), "If-None-Match": cached[0]}
+
+    try:
+        async with session.request(
+            method=method,
+            url=url,
+            json=body,
+            data=data,
+            params=params,
+            headers=headers,
+        ) as response:
+            status_code = response.status
+
+            if status_code == 304 and cached is not None:
+                validator_cache.set(cache_key, cached)
+                return {"status": 200, "data": cached[1]}
+
+            data = await response.json()
+            if status_code >= 400:
+                return {
+                    "status": status_code,
+                    "error": data.get("error"),
+                    "detail": data.get("detail"),
+                }
+
+            etag = response.headers.get("ETag")
+
+            if cache_key is not None and etag:
+                validator_cache.set(cache_key, (etag, data))
+
+            return {"status": status_code, "data": data}
+
+    except Exception as e:
+        return {"status": 400, "data": {"error": str(e)}}
@@ -1,5 +1,6 @@
 import os
 from enum import Enum
+from typing import Optional
 
 from aiogram import Bot
 from dotenv import load_dotenv
@@ -20,8 +21,25 @@ def get_env_variable(var_name: str, default_var_name: str = None) -> str:
     return value
 
 
+_bot: Optional[Bot] = None
+
+
 async def get_bot() -> Bot:
-    return Bot(token=TG_TOKEN)
+    global _bot
+
+    if _bot is None:
+        _bot = Bot(token=TG_TOKEN)
+
+    return _bot
+
+
+async def close_bot() -> None:
+    global _bot
+
+    if _bot is not None:
+        await _bot.session.close()
+
+    _bot = None
 
 
 class APIMethods(Enum):
@@ -53,3 +71,65 @@ JWT_ALGORITHM = get_env_variable("JWT_ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = get_env_variable("ACCESS_TOKEN_EXPIRE_MINUTES")
 API_BASE_URL = get_env_variable("API_BASE_URL")
 PAYMENTS_TOKEN = get_env_variable("PAYMENTS_TOKEN")
+COUNT_CACHE_TTL_SECONDS = get_env_variable("COUNT_CACHE_TTL_SECONDS", "30")
+DB_POOL_SIZE = get_env_variable("DB_POOL_SIZE", "10")
+DB_MAX_OVERFLOW = get_env_variable("DB_MAX_OVERFLOW", "20")
+DB_POOL_TIMEOUT = get_env_variable("DB_POOL_TIMEOUT", "30")
+DB_POOL_RECYCLE = get_env_variable("DB_POOL_RECYCLE", "1800")
+DB_POOL_PRE_PING = get_env_variable("DB_POOL_PRE_PING", "true")
+DB_STATEMENT_CACHE_SIZE = get_env_variable("DB_STATEMENT_CACHE_SIZE", "100")
+DB_STATEMENT_TIMEOUT_MS = get_env_variable("DB_STATEMENT_TIMEOUT_MS", "30000")
+AUTH_CACHE_TTL_SECONDS = get_env_variable("AUTH_CACHE_TTL_SECONDS", "60")
+AUTH_CACHE_MAX_SIZE = get_env_variable("AUTH_CACHE_MAX_SIZE", "10000")
+API_CLIENT_LIMIT = get_env_variable("API_CLIENT_LIMIT", "100")
+API_CLIENT_LIMIT_PER_HOST = get_env_variable("API_CLIENT_LIMIT_PER_HOST", "30")
+API_CLIENT_KEEPALIVE_TIMEOUT = get_env_variable("API_CLIENT_KEEPALIVE_TIMEOUT", "30")
+API_CLIENT_TIMEOUT = get_env_variable("API_CLIENT_TIMEOUT", "30")
+API_CLIENT_CONNECT_TIMEOUT = get_env_variable("API_CLIENT_CONNECT_TIMEOUT", "5")
+USER_INFO_CACHE_SIZE = get_env_variable("USER_INFO_CACHE_SIZE", "10000")
+USER_INFO_CACHE_TTL_SECONDS = get_env_variable("USER_INFO_CACHE_TTL_SECONDS", "300")
+SQLITE_BUSY_TIMEOUT_MS = get_env_variable("SQLITE_BUSY_TIMEOUT_MS", "5000")
+SQLITE_READ_POOL_SIZE = get_env_variable("SQLITE_READ_POOL_SIZE", "5")
+FSM_STORAGE = get_env_variable("FSM_STORAGE", "sqlite")
+FSM_STATE_TTL_SECONDS = get_env_variable("FSM_STATE_TTL_SECONDS", "86400")
+FSM_EVICTION_INTERVAL_SECONDS = get_env_variable("FSM_EVICTION_INTERVAL_SECONDS", "600")
+FSM_REDIS_URL = get_env_variable("FSM_REDIS_URL", "redis://localhost:6379/0")
+BOT_MODE = get_env_variable("BOT_MODE", "polling")
+WEBHOOK_BASE_URL = get_env_variable("WEBHOOK_BASE_URL", "")
+WEBHOOK_PATH = get_env_variable("WEBHOOK_PATH", "/webhook")
+WEBHOOK_SECRET = get_env_variable("WEBHOOK_SECRET", "")
+WEBHOOK_HOST = get_env_variable("WEBHOOK_HOST", "0.0.0.0")
+WEBHOOK_PORT = get_env_variable("WEBHOOK_PORT", "8080")
+WEBHOOK_MAX_CONCURRENT_UPDATES = get_env_variable(
+    "WEBHOOK_MAX_CONCURRENT_UPDATES", "100"
+)
+TG_GLOBAL_RATE_LIMIT = get_env_variable("TG_GLOBAL_RATE_LIMIT", "30")
+TG_PER_CHAT_RATE_LIMIT = get_env_variable("TG_PER_CHAT_RATE_LIMIT", "1")
+TG_PER_CHAT_BURST = get_env_variable("TG_PER_CHAT_BURST", "3")
+TG_SEND_MAX_RETRIES = get_env_variable("TG_SEND_MAX_RETRIES", "3")
+ADMIN_CACHE_TTL_SECONDS = get_env_variable("ADMIN_CACHE_TTL_SECONDS", "300")
+OUTBOUND_QUEUE_WORKERS = get_env_variable("OUTBOUND_QUEUE_WORKERS", "8")
+OUTBOUND_QUEUE_MAX_SIZE = get_env_variable("OUTBOUND_QUEUE_MAX_SIZE", "1000")
+ADMIN_ORDERS_PAGE_SIZE = get_env_variable("ADMIN_ORDERS_PAGE_SIZE", "10")
+RECOMMENDATION_CANDIDATES_LIMIT = get_env_variable(
+    "RECOMMENDATION_CANDIDATES_LIMIT", "20"
+)
+RECOMMENDATION_POPULAR_LIMIT = get_env_variable("RECOMMENDATION_POPULAR_LIMIT", "50")
+RECOMMENDATION_POPULAR_CACHE_TTL_SECONDS = get_env_variable(
+    "RECOMMENDATION_POPULAR_CACHE_TTL_SECONDS", "300"
+)
+RANDOM_POOL_MAX_SIZE = get_env_variable("RANDOM_POOL_MAX_SIZE", "1000")
+RANDOM_POOL_TTL_SECONDS = get_env_variable("RANDOM_POOL_TTL_SECONDS", "300")
+CATALOG_CACHE_MAX_ENTRIES = get_env_variable("CATALOG_CACHE_MAX_ENTRIES", "10000")
+CATALOG_CACHE_TTL_SECONDS = get_env_variable("CATALOG_CACHE_TTL_SECONDS", "3600")
+CATALOG_LISTENER_RETRY_SECONDS = get_env_variable("CATALOG_LISTENER_RETRY_SECONDS", "5")
+API_VALIDATOR_CACHE_SIZE = get_env_variable("API_VALIDATOR_CACHE_SIZE", "512")
+API_VALIDATOR_CACHE_TTL_SECONDS = get_env_variable(
+    "API_VALIDATOR_CACHE_TTL_SECONDS", "3600"
+)
+API_COMPRESSION_MIN_SIZE = get_env_variable("API_COMPRESSION_MIN_SIZE", "1024")
+API_BROTLI_QUALITY = get_env_variable("API_BROTLI_QUALITY", "4")
+API_WORKERS = get_env_variable("API_WORKERS", "2")
+DB_MAX_CONNECTIONS = get_env_variable("DB_MAX_CONNECTIONS", "80")
+ORDER_PAGE_MAX_LIMIT = get_env_variable("ORDER_PAGE_MAX_LIMIT", "100")
+ORDER_SUMMARY_MAX_LIMIT = get_env_variable("ORDER_SUMMARY_MAX_LIMIT", "500")
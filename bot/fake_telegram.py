@@ -0,0 +1,114 @@
+import argparse
+import asyncio
+import time
+from collections import Counter
+from typing import Dict, List
+
+from aiohttp import ClientSession
+
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+def make_user(user_id: int) -> Dict:
+    return {"id": user_id, "is_bot": False, "first_name": f"User {user_id}"}
+
+
+def make_message_update(update_id: int, user_id: int, text: str) -> Dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": user_id, "type": "private"},
+            "from": make_user(user_id),
+            "text": text,
+        },
+    }
+
+
+def make_callback_update(update_id: int, user_id: int, data: str) -> Dict:
+    return {
+        "update_id": update_id,
+        "callback_query": {
+            "id": str(update_id),
+            "from": make_user(user_id),
+            "chat_instance": str(user_id),
+            "data": data,
+            "message": {
+                "message_id": update_id,
+                "date": int(time.time()),
+                "chat": {"id": user_id, "type": "private"},
+                "text": "",
+            },
+        },
+    }
+
+
+def make_updates(
+    count: int, users: int, text: str = "/start", callback_data: str = None
+) -> List[Dict]:
+    return [
+        (
+            make_callback_update(i, 1000 + i % users, callback_data)
+            if callback_data
+            else make_message_update(i, 1000 + i % users, text)
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+# session is anything with aiohttp's post(url, json=..., headers=...), so the
+# same sender drives a live webhook through a ClientSession or an in-process
+# app through aiohttp.test_utils.TestClient.
+async def post_updates(
+    session, url: str, secret: str, updates: List[Dict], concurrency: int = 10
+) -> Dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses = Counter()
+    latencies = []
+
+    async def send(update: Dict) -> None:
+        async with semaphore:
+            started_at = time.perf_counter()
+            async with session.post(
+                url, json=update, headers={SECRET_HEADER: secret}
+            ) as response:
+                statuses[response.status] += 1
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(send(update) for update in updates))
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        "sent": len(updates),
+        "statuses": dict(statuses),
+        "elapsed": round(elapsed, 3),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2) if latencies else 0,
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0,
+    }
+
+
+async def send_updates(
+    url: str, secret: str, updates: List[Dict], concurrency: int = 10
+) -> Dict:
+    async with ClientSession() as session:
+        return await post_updates(session, url, secret, updates, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Send fake Telegram updates to the bot webhook"
+    )
+    parser.add_argument("--url", default="http://localhost:8080/webhook")
+    parser.add_argument("--secret", required=True)
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--text", default="/start")
+    parser.add_argument("--callback-data")
+    args = parser.parse_args()
+
+    updates = make_updates(args.count, args.users, args.text, args.callback_data)
+    print(asyncio.run(send_updates(args.url, args.secret, updates, args.concurrency)))
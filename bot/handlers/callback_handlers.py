@@ -1,9 +1,10 @@
 import json
 
-from aiogram import Dispatcher, Router
+from aiogram import Bot, Dispatcher, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
 
+from ..common.models import UserInfo
 from ..common.services import product_service
 from ..common.services.cart_service import (
     add_to_cart,
@@ -13,10 +14,8 @@ from ..common.services.cart_service import (
 )
 from ..common.services.company_service import company_service
 from ..common.services.gastronomy_service import kitchen_service
-from ..common.services.order_service import get_orders
 from ..common.services.product_service import product_service
 from ..common.services.text_service import text_service
-from ..common.services.user_info_service import get_user_info
 from ..common.services.wishlist_service import (
     add_to_wishlist,
     move_to_cart,
@@ -40,7 +39,7 @@ from .entity_handlers.order_handlers import (
     handle_accept_order,
     handle_order_create,
     proceed_payment_on_delivery,
-    send_admin_orders_info,
+    send_admin_orders_page,
 )
 from .entity_handlers.product_handlers import (
     handle_edit_product_image,
@@ -69,11 +68,13 @@ SERVICES = {
 
 
 @router.callback_query()
-async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
-    user_info = await get_user_info(callback.from_user.id)
-    language_code = user_info.language_code
-    if not language_code:
-        language_code = "en"
+async def handle_callbacks(
+    callback: CallbackQuery,
+    state: FSMContext,
+    bot: Bot,
+    user_info: UserInfo,
+    language_code: str,
+):
     try:
         data = json.loads(callback.data)
         action = data.get("a")
@@ -93,8 +94,7 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
         message_id = data[3]
 
     if content_type == "admin-orders":
-        orders = await get_orders(user_info)
-        await send_admin_orders_info(user_info, orders)
+        await send_admin_orders_page(bot, user_info, page)
         await callback.answer()
         return
 
@@ -106,6 +106,7 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
             language_code=language_code,
             extra_arg=extra_arg,
             kitchen_id=kitchen_id,
+            user_info=user_info,
         )
 
     elif action == "back":
@@ -115,14 +116,22 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
 
         elif content_type == CONTENT_TYPES["ADMIN_PRODUCT"]:
             await update_paginated_message(
-                callback, "admin-company", page, language_code, extra_arg
+                callback,
+                "admin-company",
+                page,
+                language_code,
+                extra_arg,
+                user_info=user_info,
             )
         elif content_type in [
             CONTENT_TYPES["ADMIN_COMPANY"],
             CONTENT_TYPES["ADMIN_KITCHEN"],
         ]:
             await handle_admin(
-                callback.message, language_code, telegram_id=callback.from_user.id
+                callback.message,
+                language_code,
+                telegram_id=callback.from_user.id,
+                user_info=user_info,
             )
 
         elif content_type == "user-products":
@@ -133,12 +142,18 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
                 language_code=language_code,
                 extra_arg=extra_arg,
                 kitchen_id=kitchen_id,
+                user_info=user_info,
             )
 
         elif content_type.endswith("-details"):
             new_content_type = content_type.replace("-details", "")
             await update_paginated_message(
-                callback, new_content_type, page, language_code, extra_arg
+                callback,
+                new_content_type,
+                page,
+                language_code,
+                extra_arg,
+                user_info=user_info,
             )
 
     elif action == "add":
@@ -215,30 +230,47 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
                 text_service.get_text("successful_deleting", language_code)
             )
             await update_paginated_message(
-                callback, content_type, page, language_code, extra_arg
+                callback,
+                content_type,
+                page,
+                language_code,
+                extra_arg,
+                user_info=user_info,
             )
             await state.clear()
 
     elif action == "cancel":
         await state.clear()
         await update_paginated_message(
-            callback, content_type, page, language_code, extra_arg
+            callback, content_type, page, language_code, extra_arg, user_info=user_info
         )
 
     elif action == "products":
         await update_paginated_message(
-            callback, "admin-product", 1, language_code, extra_arg=str(item_id)
+            callback,
+            "admin-product",
+            1,
+            language_code,
+            extra_arg=str(item_id),
+            user_info=user_info,
         )
 
     elif action == "list" and content_type == "user-products":
         await update_paginated_message(
-            callback, "user-products", page, language_code, extra_arg
+            callback,
+            "user-products",
+            page,
+            language_code,
+            extra_arg,
+            user_info=user_info,
         )
 
     elif action == "add_to_cart" and content_type == "user-products":
         product_id = extra_arg
         company_id = data.get("c")
-        response = await add_to_cart(callback.from_user.id, product_id, company_id)
+        response = await add_to_cart(
+            callback.from_user.id, product_id, company_id, user_info=user_info
+        )
         if response["status"] == 200:
             await callback.message.answer(
                 "Product added to cart!"
@@ -260,7 +292,7 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
     elif action == "clear_cart":
         product_id = extra_arg
         company_id = data.get("c")
-        await clear_cart(callback.from_user.id)
+        await clear_cart(callback.from_user.id, user_info=user_info)
         await callback.message.delete()
         await callback.message.answer(
             "Previous cart cleared!"
@@ -268,7 +300,7 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
             else "Попередній кошик очищено!"
         )
         response = await add_to_cart(
-            callback.from_user.id, int(product_id), int(company_id)
+            callback.from_user.id, int(product_id), int(company_id), user_info=user_info
         )
         if response["status"] == 200:
             await callback.message.answer(
@@ -288,7 +320,9 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
 
     elif action == "add_to_wishlist" and content_type == "user-products":
         product_id = extra_arg
-        response = await add_to_wishlist(callback.from_user.id, product_id)
+        response = await add_to_wishlist(
+            callback.from_user.id, product_id, user_info=user_info
+        )
         if response["status"] == 200:
             await callback.message.answer(
                 "Product added to wishlist!"
@@ -304,7 +338,7 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
         await callback.answer()
 
     elif action == "plus":
-        await change_amount(callback.from_user.id, item_id, 1)
+        await change_amount(callback.from_user.id, item_id, 1, user_info=user_info)
         await update_paginated_message(
             callback,
             "cart",
@@ -312,11 +346,12 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
             language_code,
             callback.from_user.id,
             with_back_button=False,
+            user_info=user_info,
         )
         await callback.answer()
 
     elif action == "minus":
-        await change_amount(callback.from_user.id, item_id, -1)
+        await change_amount(callback.from_user.id, item_id, -1, user_info=user_info)
         await update_paginated_message(
             callback,
             "cart",
@@ -324,14 +359,17 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
             language_code,
             callback.from_user.id,
             with_back_button=False,
+            user_info=user_info,
         )
         await callback.answer()
 
     elif action == "remove" and content_type in ["cart", "wishlist"]:
         if content_type == "wishlist":
-            await remove_from_wishlist(callback.from_user.id, item_id)
+            await remove_from_wishlist(
+                callback.from_user.id, item_id, user_info=user_info
+            )
         else:
-            await remove_from_cart(callback.from_user.id, item_id)
+            await remove_from_cart(callback.from_user.id, item_id, user_info=user_info)
 
         await update_paginated_message(
             callback,
@@ -340,13 +378,16 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
             language_code,
             callback.from_user.id,
             with_back_button=False,
+            user_info=user_info,
         )
         await callback.answer()
 
     elif action == "m_cart" and content_type == "wl":
         product_id = extra_arg
         company_id = data.get("c")
-        response = await move_to_cart(callback.from_user.id, item_id)
+        response = await move_to_cart(
+            callback.from_user.id, item_id, user_info=user_info
+        )
         if response["status"] == 200:
             await callback.message.answer(
                 "Product moved to cart!"
@@ -370,6 +411,7 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
             language_code,
             callback.from_user.id,
             with_back_button=False,
+            user_info=user_info,
         )
         await callback.answer()
 
@@ -414,6 +456,7 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
 
     elif action == "s_answer":
         await answer_message(
+            bot=bot,
             chat_id=chat_id,
             user_id=user_id,
             question_message_id=message_id,
@@ -424,6 +467,7 @@ async def handle_callbacks(callback: CallbackQuery, state: FSMContext):
 
     elif action == "s_ignore":
         await ignore_message(
+            bot=bot,
             message_id=callback.message.message_id,
             chat_id=chat_id,
             user_id=user_id,
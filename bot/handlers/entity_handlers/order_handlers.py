@@ -10,20 +10,26 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder, InlineKeyboardButton
 from api.app.order.schemas import OrderCreate, OrderItemCreate, OrderResponse
 
 from ...common.models import UserInfo
+from ...common.send_queue import Priority, outbound_queue
 from ...common.services.cart_service import get_cart_items
+from ...common.services.notification_service import admin_notifier
 from ...common.services.order_service import (
     accept_order,
+    count_pending_orders,
     create_order,
+    get_pending_orders,
     update_order_purchase_info,
 )
 from ...common.services.text_service import text_service
 from ...common.services.user_info_service import get_user_info
-from ...common.services.user_service import retrieve_admins
-from ...config import get_bot
+from ...config import ADMIN_ORDERS_PAGE_SIZE
 from ...handlers.entity_handlers.handler_utils import convert_raw_text_to_valid_dict
 
 router = Router()
 
+TELEGRAM_MESSAGE_LIMIT = 4096
+ORDER_SEPARATOR = "\n\n" + "—" * 12 + "\n\n"
+
 
 class Form(StatesGroup):
     process_order_details = State()
@@ -152,108 +158,207 @@ async def confirm_order(message: Message, order_id: int, user_info: UserInfo):
         if user_info.language_code == "ua"
         else f"Your order #{order_id} will be processed and you will receive a notification when it is accepted!"
     )
-    await send_order_info_to_admins()
+    await send_order_info_to_admins(message.bot)
+
+
+def format_order(order: OrderResponse, language_code: str) -> str:
+    order_status_en = "Accepted" if order.is_submitted else "Pending"
+    order_status_ua = "Прийнято" if order.is_submitted else "В обробці"
+    order_status_name = "Status" if language_code == "en" else "Статус"
+    order_address_name = "Address" if language_code == "en" else "Адреса"
+    order_time_name = "Time" if language_code == "en" else "Час"
+    order_total_price_name = "Total price" if language_code == "en" else "Всього"
+
+    order_message = f"№{order.id}\n{order_status_name}: {order_status_en if language_code == 'en' else order_status_ua}\n\n"
+
+    for order_item in order.order_items:
+        order_item_caption = "Item" if language_code == "en" else "Позиція"
+        order_item_price_name = "Price" if language_code == "en" else "Ціна"
+        order_item_quantity_name = "Quantity" if language_code == "en" else "Кількість"
+
+        order_message += f"{order_item_caption}: {order_item.product.title_ua if language_code == 'ua' else order_item.product.title_en} \n"
+        order_message += f"{order_item_quantity_name}: {order_item.quantity}\n"
+        order_message += f"{order_item_price_name}: ${order_item.product.price}\n\n"
+
+    order_message += f"{order_address_name}: {order.address}\n"
+    order_message += f"{order_time_name}: {order.time}\n"
+    order_message += f"{order_total_price_name}: ${order.total_price}"
+
+    return order_message
 
 
 async def render_orders(
     bot: Bot, orders: List[OrderResponse], language_code: str, user_id: int
 ):
     for order in orders:
-        order_status_en = "Accepted" if order.is_submitted else "Pending"
-        order_status_ua = "Прийнято" if order.is_submitted else "В обробці"
-        order_status_name = "Status" if language_code == "en" else "Статус"
-        order_address_name = "Address" if language_code == "en" else "Адреса"
-        order_time_name = "Time" if language_code == "en" else "Час"
-        order_total_price_name = "Total price" if language_code == "en" else "Всього"
-
-        order_message = f"№{order.id}\n{order_status_name}: {order_status_en if language_code == 'en' else order_status_ua}\n\n"
-
-        for order_item in order.order_items:
-            order_item_caption = "Item" if language_code == "en" else "Позиція"
-            order_item_price_name = "Price" if language_code == "en" else "Ціна"
-            order_item_quantity_name = (
-                "Quantity" if language_code == "en" else "Кількість"
+        await outbound_queue.send_message(
+            bot, user_id, format_order(order, language_code), priority=Priority.RENDER
+        )
+
+
+async def send_order_info_to_admins(bot: Bot):
+    await admin_notifier.notify_admins(
+        bot,
+        lambda language_code: (
+            "New order received!"
+            if language_code == "en"
+            else "Нове замовлення отримано!"
+        ),
+    )
+
+
+def format_admin_order(order: OrderResponse, language_code: str) -> str:
+    if language_code == "en":
+        caption = f"Order #{order.id}\n\n Client information:\nName: {order.user.first_name} {order.user.last_name}\nPhone: {order.user.phone_number}\n\nDetails:"
+    else:
+        caption = f"Замовлення #{order.id}\n\nПерсональні дані клієнта:\nІм'я: {order.user.first_name} {order.user.last_name if order.user.last_name else ''}\nТелефон: {order.user.phone_number}\n\nДеталі:"
+
+    return f"{caption}\n{format_order(order, language_code)}"
+
+
+# Telegram counts message length in UTF-16 code units, so characters outside
+# the BMP (most emoji) take two.
+def utf16_len(text: str) -> int:
+    return len(text.encode("utf-16-le")) // 2
+
+
+def utf16_prefix(text: str, limit: int) -> str:
+    encoded = text.encode("utf-16-le")[: limit * 2]
+
+    # Do not cut between the two halves of a surrogate pair.
+    last_unit = int.from_bytes(encoded[-2:], "little")
+
+    if 0xD800 <= last_unit <= 0xDBFF:
+        encoded = encoded[:-2]
+
+    return encoded.decode("utf-16-le")
+
+
+def pack_messages(blocks: List[str], limit: int = TELEGRAM_MESSAGE_LIMIT) -> List[str]:
+    messages = []
+    current = ""
+
+    for block in blocks:
+        while utf16_len(block) > limit:
+            if current:
+                messages.append(current)
+                current = ""
+
+            head = utf16_prefix(block, limit) or block[0]
+            messages.append(head)
+            block = block[len(head) :]
+
+        candidate = f"{current}{ORDER_SEPARATOR}{block}" if current else block
+
+        if utf16_len(candidate) > limit:
+            messages.append(current)
+            current = block
+        else:
+            current = candidate
+
+    if current:
+        messages.append(current)
+
+    return messages
+
+
+def get_admin_orders_keyboard(
+    orders: List[OrderResponse], page: int, total_pages: int, language_code: str
+) -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    accept_text = "Accept" if language_code == "en" else "Прийняти"
+
+    for order in orders:
+        if order.is_submitted:
+            continue
+
+        builder.row(
+            InlineKeyboardButton(
+                text=f"{accept_text} #{order.id}",
+                callback_data=json.dumps(
+                    {"a": "accept", "o": order.id, "u": order.user.telegram_id},
+                    separators=(",", ":"),
+                ),
             )
+        )
 
-            order_message += f"{order_item_caption}: {order_item.product.title_ua if language_code == 'ua' else order_item.product.title_en} \n"
-            order_message += f"{order_item_quantity_name}: {order_item.quantity}\n"
-            order_message += f"{order_item_price_name}: ${order_item.product.price}\n\n"
+    navigation = []
+    if page > 1:
+        navigation.append(
+            InlineKeyboardButton(
+                text="⬅️",
+                callback_data=json.dumps(
+                    {"t": "admin-orders", "a": "nav", "p": page - 1},
+                    separators=(",", ":"),
+                ),
+            )
+        )
 
-        order_message += f"{order_address_name}: {order.address}\n"
-        order_message += f"{order_time_name}: {order.time}\n"
-        order_message += f"{order_total_price_name}: ${order.total_price}"
+    if page < total_pages:
+        navigation.append(
+            InlineKeyboardButton(
+                text="➡️",
+                callback_data=json.dumps(
+                    {"t": "admin-orders", "a": "nav", "p": page + 1},
+                    separators=(",", ":"),
+                ),
+            )
+        )
 
-        await bot.send_message(user_id, order_message)
+    if navigation:
+        builder.row(*navigation)
 
+    return builder.as_markup()
 
-async def send_order_info_to_admins():
-    bot = await get_bot()
-    admins = await retrieve_admins()
 
-    for admin in admins:
-        user_info = await get_user_info(admin.telegram_id)
-        language_code = user_info.language_code if user_info else "en"
+async def send_admin_orders_page(bot: Bot, user_info: UserInfo, page: int = 1):
+    language_code = user_info.language_code if user_info else "en"
+    pending_count = await count_pending_orders(user_info)
 
-        await bot.send_message(
-            admin.telegram_id,
+    if not pending_count:
+        await outbound_queue.send_message(
+            bot,
+            user_info.telegram_id,
             (
-                "New order received!"
+                "There are no new orders"
                 if language_code == "en"
-                else "Нове замовлення отримано!"
+                else "Нових замовлень немає"
             ),
+            priority=Priority.RENDER,
         )
+        return
 
-    await bot.session.close()
+    order_list = await get_pending_orders(
+        user_info, page=page, limit=int(ADMIN_ORDERS_PAGE_SIZE)
+    )
 
+    if not order_list.orders:
+        page = order_list.total_pages
+        order_list = await get_pending_orders(
+            user_info, page=page, limit=int(ADMIN_ORDERS_PAGE_SIZE)
+        )
 
-async def send_admin_orders_info(
-    user_info: UserInfo,
-    orders: List[OrderResponse],
-):
-    bot = await get_bot()
-    language_code = user_info.language_code if user_info else "en"
+    header = (
+        f"New orders: {pending_count}, page {page}/{order_list.total_pages}"
+        if language_code == "en"
+        else f"Нові замовлення: {pending_count}, сторінка {page}/{order_list.total_pages}"
+    )
+    messages = pack_messages(
+        [header]
+        + [format_admin_order(order, language_code) for order in order_list.orders]
+    )
+    keyboard = get_admin_orders_keyboard(
+        order_list.orders, page, order_list.total_pages, language_code
+    )
 
-    for order in orders:
-        if user_info and language_code == "en":
-            caption = f"Order #{order.id}\n\n Client information:\nName: {order.user.first_name} {order.user.last_name}\nPhone: {order.user.phone_number}\n\nDetails:"
-        else:
-            caption = f"Замовлення #{order.id}\n\nПерсональні дані клієнта:\nІм'я: {order.user.first_name} {order.user.last_name if order.user.last_name else ''}\nТелефон: {order.user.phone_number}\n\nДеталі:"
-
-        await bot.send_message(
-            chat_id=user_info.telegram_id,
-            text=caption,
-            reply_markup=(
-                InlineKeyboardMarkup(
-                    inline_keyboard=[
-                        [
-                            InlineKeyboardButton(
-                                text=(
-                                    "Accept" if language_code == "en" else "Прийняти"
-                                ),
-                                callback_data=json.dumps(
-                                    {
-                                        "a": "accept",
-                                        "o": order.id,
-                                        "u": order.user.telegram_id,
-                                    },
-                                    separators=(",", ":"),
-                                ),
-                            )
-                        ]
-                    ]
-                )
-                if not order.is_submitted
-                else None
-            ),
+    for index, text in enumerate(messages):
+        await outbound_queue.send_message(
+            bot,
+            user_info.telegram_id,
+            text,
+            priority=Priority.RENDER,
+            reply_markup=keyboard if index == len(messages) - 1 else None,
         )
-        await render_orders(
-            bot=bot,
-            orders=[order],
-            language_code=language_code,
-            user_id=user_info.telegram_id,
-        ),
-
-    await bot.session.close()
 
 
 async def handle_accept_order(
@@ -277,17 +382,17 @@ async def handle_accept_order(
         if language_code == "en"
         else "Замовлення успішно прийнято!"
     )
-    bot = await get_bot()
     user_info = await get_user_info(user_id)
-    await bot.send_message(
+    await outbound_queue.send_message(
+        message.bot,
         user_id,
         (
             f"Your order №{order_id} has been accepted!"
             if user_info.language_code == "en"
             else f"Ваше замовлення №{order_id} прийнято!"
         ),
+        priority=Priority.ORDER,
     )
-    await bot.session.close()
 
 
 def register_handlers(dispatcher: Dispatcher):
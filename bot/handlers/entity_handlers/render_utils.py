@@ -7,6 +7,7 @@ from api.app.cart.schemas import CartItemFullResponse
 from api.app.product.schemas import ProductListResponse
 from api.app.wishlist.schemas import WishlistItemFullResponse
 
+from ...common.models import UserInfo
 from ...common.services.cart_service import get_cart_items
 from ...common.services.company_service import company_service
 from ...common.services.gastronomy_service import kitchen_service
@@ -156,10 +157,10 @@ async def render_user_product_list(
 
 
 async def render_user_cart_product(
-    page: int, language_code: str, telegram_id: int
+    page: int, language_code: str, telegram_id: int, user_info: UserInfo = None
 ) -> Tuple[str, Optional[str], int, InlineKeyboardBuilder]:
     cart_item: CartItemFullResponse = await get_cart_items(
-        telegram_id=telegram_id, page=page
+        telegram_id=telegram_id, page=page, user_info=user_info
     )
 
     if not cart_item:
@@ -243,10 +244,10 @@ async def render_user_cart_product(
 
 
 async def render_user_wishlist_product(
-    page: int, language_code: str, telegram_id: int
+    page: int, language_code: str, telegram_id: int, user_info: UserInfo = None
 ) -> Tuple[str, Optional[str], int, InlineKeyboardBuilder]:
     wishlist_item: WishlistItemFullResponse = await get_wishlist_items(
-        telegram_id=telegram_id, page=page
+        telegram_id=telegram_id, page=page, user_info=user_info
     )
 
     if not wishlist_item:
@@ -1,11 +1,12 @@
-from aiogram import Dispatcher, Router
+from aiogram import Bot, Dispatcher, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import Message
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from ...common.send_queue import outbound_queue
 from ...common.services.user_info_service import update_user_info
-from ...config import GROUP_ID, get_bot
+from ...config import GROUP_ID
 
 router = Router()
 
@@ -16,11 +17,10 @@ class Form(StatesGroup):
 
 
 @router.message(Form.support_question)
-async def send_question_to_support_group(message: Message, state: FSMContext):
+async def send_question_to_support_group(message: Message, state: FSMContext, bot: Bot):
     data = await state.get_data()
     language_code = data["language_code"]
     user_id = message.from_user.id
-    bot = await get_bot()
 
     await message.reply(
         "Your question was sent"
@@ -46,7 +46,8 @@ async def send_question_to_support_group(message: Message, state: FSMContext):
     else:
         caption = f'<b>Нове питання було взято!</b>\n<b>Від:</b> {message.from_user.first_name}\nID: {message.chat.id}\n<b>Повідомлення:</b> "{message.text}"'
 
-    await bot.send_message(
+    await outbound_queue.send_message(
+        bot,
         int(GROUP_ID),
         caption,
         reply_markup=markup.as_markup(),
@@ -55,11 +56,11 @@ async def send_question_to_support_group(message: Message, state: FSMContext):
 
     await update_user_info(user_id, is_support_pending=True)
 
-    await bot.session.close()
     await state.clear()
 
 
 async def answer_message(
+    bot: Bot,
     message_id,
     chat_id: int,
     user_id: int,
@@ -67,8 +68,8 @@ async def answer_message(
     state: FSMContext,
     language_code: str,
 ):
-    bot = await get_bot()
-    await bot.send_message(
+    await outbound_queue.send_message(
+        bot,
         GROUP_ID,
         "Enter your answer: " if language_code == "en" else "Введіть вашу відповідь",
     )
@@ -81,12 +82,9 @@ async def answer_message(
         language_code=language_code,
     )
 
-    await bot.session.close()
-
 
 @router.message(Form.answer)
-async def send_answer(message: Message, state: FSMContext):
-    bot = await get_bot()
+async def send_answer(message: Message, state: FSMContext, bot: Bot):
     data = await state.get_data()
     chat_id = data.get("chat_id")
     user_id = data.get("user_id")
@@ -94,7 +92,8 @@ async def send_answer(message: Message, state: FSMContext):
     message_id = data.get("message_id")
     language_code = data.get("language_code")
 
-    await bot.send_message(
+    await outbound_queue.send_message(
+        bot,
         chat_id,
         (
             f"You have received an answer:\n<b>{message.text}</b>"
@@ -113,18 +112,17 @@ async def send_answer(message: Message, state: FSMContext):
     await bot.delete_message(GROUP_ID, message_id)
     await state.clear()
 
-    await bot.session.close()
-
 
 async def ignore_message(
+    bot: Bot,
     message_id,
     chat_id: int,
     user_id: int,
     question_message_id: int,
     language_code: str,
 ):
-    bot = await get_bot()
-    await bot.send_message(
+    await outbound_queue.send_message(
+        bot,
         chat_id,
         (
             "Unfortunately, your question was denied"
@@ -136,7 +134,6 @@ async def ignore_message(
 
     await bot.delete_message(GROUP_ID, message_id)
     await update_user_info(user_id, is_support_pending=False)
-    await bot.session.close()
 
 
 def register_handlers(dispatcher: Dispatcher):
@@ -35,10 +35,9 @@ logger = logging.getLogger(__name__)
 
 
 @router.message(lambda msg: msg.text in text_service.language_buttons)
-async def handle_language_choice(message: Message):
+async def handle_language_choice(message: Message, user_info: UserInfo = None):
     telegram_id = message.from_user.id
     language_code = "ua" if message.text == "🇺🇦 Українська" else "en"
-    user_info = await get_user_info(telegram_id)
 
     if user_info:
         await update_user_info(telegram_id, language_code=language_code)
@@ -85,8 +84,7 @@ async def handle_contact(message: Message, user_info: UserInfo = None):
 
 
 @router.message(lambda message: message.successful_payment is not None)
-async def successful_payment(message: Message):
-    user_info = await get_user_info(message.from_user.id)
+async def successful_payment(message: Message, user_info: UserInfo):
     payment_info = message.successful_payment
 
     payload_data = json.loads(payment_info.invoice_payload)
@@ -112,9 +110,9 @@ async def pre_checkout_query(pre_checkout_query: PreCheckoutQuery):
 
 
 @router.message()
-async def handle_buttons(message: Message, state: FSMContext):
-    user_info = await get_user_info(message.from_user.id)
-
+async def handle_buttons(
+    message: Message, state: FSMContext, user_info: UserInfo = None
+):
     if not user_info:
         await message.answer(
             text_service.get_text("select_language", "ua"),
@@ -146,7 +144,7 @@ async def handle_buttons(message: Message, state: FSMContext):
     if text in text_service.buttons.get(language_code, {}).values():
         handler = button_handlers.get(text)
         if handler:
-            await handler(message, language_code, state)
+            await handler(message, language_code, state, user_info=user_info)
         else:
             await message.answer(text_service.get_text("unknown_option", language_code))
     else:
@@ -10,6 +10,7 @@ from aiogram.types import (
 )
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from ..common.models import UserInfo
 from .entity_handlers.render_utils import (
     render_admin_list,
     render_company_list,
@@ -155,6 +156,7 @@ async def update_paginated_message(
     extra_arg: str = "",
     kitchen_id: str = "",
     with_back_button: bool = True,
+    user_info: UserInfo = None,
 ):
     content = await get_content(
         content_type=content_type,
@@ -162,6 +164,7 @@ async def update_paginated_message(
         language_code=language_code,
         extra_arg=extra_arg,
         kitchen_id=kitchen_id,
+        user_info=user_info,
     )
     if not content:
         await callback.answer("Content not available")
@@ -230,6 +233,7 @@ async def send_paginated_message(
     extra_arg: str = "",
     kitchen_id: str = "",
     with_back_button: bool = True,
+    user_info: UserInfo = None,
 ):
     content = await get_content(
         content_type=content_type,
@@ -237,6 +241,7 @@ async def send_paginated_message(
         language_code=language_code,
         extra_arg=extra_arg,
         kitchen_id=kitchen_id,
+        user_info=user_info,
     )
     if not content:
         await message.answer("Content not available")
@@ -286,6 +291,7 @@ async def get_content(
     language_code: str,
     extra_arg: str = "",
     kitchen_id: str = "",
+    user_info: UserInfo = None,
 ):
     if content_type == "user-company":
         return await render_company_list(page, language_code, kitchen_id, extra_arg)
@@ -301,9 +307,11 @@ async def get_content(
         return await render_user_product_list(page, language_code, extra_arg)
 
     elif content_type == "cart":
-        return await render_user_cart_product(page, language_code, extra_arg)
+        return await render_user_cart_product(page, language_code, extra_arg, user_info)
 
     elif content_type == "wishlist":
-        return await render_user_wishlist_product(page, language_code, extra_arg)
+        return await render_user_wishlist_product(
+            page, language_code, extra_arg, user_info
+        )
 
     return None
@@ -1,11 +1,11 @@
 import json
 
 from aiogram import Router
+from aiogram.methods import SendInvoice
 from aiogram.types import LabeledPrice, Message
 
-from bot.config import get_bot
-
-from ..config import PAYMENTS_TOKEN, get_bot
+from ..common.send_queue import Priority, outbound_queue
+from ..config import PAYMENTS_TOKEN
 
 router = Router()
 
@@ -17,11 +17,11 @@ async def proceed_payment(
     total_price: float,
     **_,
 ):
-    bot = await get_bot()
+    bot = message.bot
 
     payload = json.dumps({"order_id": order_id})
 
-    await bot.send_invoice(
+    invoice = SendInvoice(
         chat_id=message.chat.id,
         title="Оплата замовлення" if language_code == "ua" else "Order payment",
         description=(
@@ -45,5 +45,4 @@ async def proceed_payment(
         photo_size=416,
         is_flexible=False,
     )
-
-    await bot.session.close()
+    await outbound_queue.send(bot, invoice, priority=Priority.PAYMENT)
@@ -8,11 +8,10 @@ from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup, Message
 from api.app.order.schemas import OrderResponse
 from api.app.user.schemas import UserResponseMe
 
+from ..common.models import UserInfo
 from ..common.services.order_service import get_paid_orders
 from ..common.services.text_service import text_service
-from ..common.services.user_info_service import get_user_info
 from ..common.services.user_service import get_user
-from ..config import get_bot
 from ..handlers.entity_handlers.main_handlers import show_main_menu
 from ..handlers.entity_handlers.order_handlers import render_orders
 from ..handlers.entity_handlers.product_handlers import render_user_recommendations
@@ -41,8 +40,9 @@ def admin_required(func):
     async def wrapper(
         message: Message, language_code: str, _: FSMContext = None, **kwargs
     ):
-        user = await get_user(message.from_user.id) or await get_user(
-            kwargs.get("telegram_id", message.from_user.id)
+        user = await get_user(
+            kwargs.get("telegram_id", message.from_user.id),
+            user_info=kwargs.get("user_info"),
         )
 
         if not user:
@@ -64,8 +64,15 @@ def admin_required(func):
 @register_button_handler(
     text_service.buttons["en"]["profile"], text_service.buttons["ua"]["profile"]
 )
-async def handle_profile(message: Message, language_code: str, _: FSMContext = None):
-    user_data: UserResponseMe = await get_user(message.from_user.id)
+async def handle_profile(
+    message: Message,
+    language_code: str,
+    _: FSMContext = None,
+    user_info: UserInfo = None,
+):
+    user_data: UserResponseMe = await get_user(
+        message.from_user.id, user_info=user_info
+    )
 
     if not user_data:
         await message.answer(
@@ -105,7 +112,10 @@ async def handle_profile(message: Message, language_code: str, _: FSMContext = N
     text_service.buttons["en"]["restaurants"], text_service.buttons["ua"]["restaurants"]
 )
 async def handle_restaurants(
-    message: Message, language_code: str, _: FSMContext = None
+    message: Message,
+    language_code: str,
+    _: FSMContext = None,
+    user_info: UserInfo = None,
 ):
     await message.answer(
         text_service.get_text("select_category", language_code),
@@ -116,23 +126,44 @@ async def handle_restaurants(
 @register_button_handler(
     text_service.buttons["en"]["back"], text_service.buttons["ua"]["back"]
 )
-async def handle_back(message: Message, language_code: str, _: FSMContext = None):
+async def handle_back(
+    message: Message,
+    language_code: str,
+    _: FSMContext = None,
+    user_info: UserInfo = None,
+):
     await show_main_menu(message, language_code)
 
 
 @register_button_handler(
     text_service.buttons["en"]["cart"], text_service.buttons["ua"]["cart"]
 )
-async def handle_cart(message: Message, language_code: str, _: FSMContext = None):
+async def handle_cart(
+    message: Message,
+    language_code: str,
+    _: FSMContext = None,
+    user_info: UserInfo = None,
+):
     await send_paginated_message(
-        message, "cart", 1, language_code, message.from_user.id, with_back_button=False
+        message,
+        "cart",
+        1,
+        language_code,
+        message.from_user.id,
+        with_back_button=False,
+        user_info=user_info,
     )
 
 
 @register_button_handler(
     text_service.buttons["en"]["wishlist"], text_service.buttons["ua"]["wishlist"]
 )
-async def handle_wishlist(message: Message, language_code: str, _: FSMContext = None):
+async def handle_wishlist(
+    message: Message,
+    language_code: str,
+    _: FSMContext = None,
+    user_info: UserInfo = None,
+):
     await send_paginated_message(
         message,
         "wishlist",
@@ -140,6 +171,7 @@ async def handle_wishlist(message: Message, language_code: str, _: FSMContext =
         language_code,
         message.from_user.id,
         with_back_button=False,
+        user_info=user_info,
     )
 
 
@@ -163,8 +195,15 @@ async def handle_admin(
     text_service.buttons["en"]["orders"],
     text_service.buttons["ua"]["orders"],
 )
-async def handle_orders(message: Message, language_code: str, _: FSMContext = None):
-    orders: List[OrderResponse] = await get_paid_orders(message.from_user.id)
+async def handle_orders(
+    message: Message,
+    language_code: str,
+    _: FSMContext = None,
+    user_info: UserInfo = None,
+):
+    orders: List[OrderResponse] = await get_paid_orders(
+        message.from_user.id, user_info=user_info
+    )
     if not orders:
         await message.answer(
             "You have no orders" if language_code == "en" else "У вас немає замовлень"
@@ -174,24 +213,28 @@ async def handle_orders(message: Message, language_code: str, _: FSMContext = No
         "Your orders:" if language_code == "en" else "Ваші замовлення:"
     )
 
-    bot = await get_bot()
-    await render_orders(bot, orders, language_code, message.from_user.id)
-    await bot.session.close()
+    await render_orders(message.bot, orders, language_code, message.from_user.id)
 
 
 @register_button_handler(
     text_service.buttons["en"]["recommendations"],
     text_service.buttons["ua"]["recommendations"],
 )
-async def handle_recommendations(message: Message, _: str, state: FSMContext = None):
+async def handle_recommendations(
+    message: Message, _: str, state: FSMContext = None, user_info: UserInfo = None
+):
     await render_user_recommendations(message, message.from_user.id)
 
 
 @register_button_handler(
     text_service.buttons["en"]["support"], text_service.buttons["ua"]["support"]
 )
-async def handle_help(message: Message, language_code: str, state: FSMContext = None):
-    user_info = await get_user_info(message.from_user.id)
+async def handle_help(
+    message: Message,
+    language_code: str,
+    state: FSMContext = None,
+    user_info: UserInfo = None,
+):
     if not user_info.is_support_pending:
         await message.answer(
             "Enter your question" if language_code == "en" else "Введіть ваше питання",
@@ -225,7 +268,12 @@ async def handle_help(message: Message, language_code: str, state: FSMContext =
 @register_button_handler(
     text_service.buttons["en"]["about_us"], text_service.buttons["ua"]["about_us"]
 )
-async def handle_help(message: Message, language_code: str, state: FSMContext = None):
+async def handle_help(
+    message: Message,
+    language_code: str,
+    state: FSMContext = None,
+    user_info: UserInfo = None,
+):
     if language_code == "en":
         caption = "Flavour Flow is an intelligent Telegram bot designed for quick and convenient online ordering of food from restaurants. The bot allows you to view menus, place orders, pay for them, choose a delivery method, and receive personalized recommendations based on your taste preferences.\n\nDeveloper: Andrii Kiiko, student of group KN-322SV"
     else:
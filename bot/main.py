@@ -3,10 +3,20 @@ import logging
 import time
 
 from aiogram import Dispatcher
-from aiogram.fsm.storage.memory import MemoryStorage
 
-from bot.common.database import create_db_and_tables
-from bot.config import get_bot
+from bot.common.database import create_db_and_tables, dispose_engines
+from bot.common.fsm_storage import create_fsm_storage
+from bot.common.middlewares import register_middlewares
+from bot.common.send_queue import outbound_queue
+from bot.common.services.notification_service import admin_notifier
+from bot.common.services.user_info_service import get_user_info_cache_stats
+from bot.common.utils import close_client_session, get_client_session
+from bot.config import (
+    BOT_MODE,
+    WEBHOOK_MAX_CONCURRENT_UPDATES,
+    close_bot,
+    get_bot,
+)
 from bot.handlers.callback_handlers import register_callback_handlers
 from bot.handlers.command_handlers import register_command_handlers
 from bot.handlers.entity_handlers.entity_handlers import (
@@ -23,6 +33,7 @@ from bot.handlers.entity_handlers.support_handlers import (
     register_handlers as register_support_handlers,
 )
 from bot.handlers.main_message_handlers import register_main_message_handlers
+from bot.webhook import run_webhook
 
 logging.basicConfig(
     level=logging.INFO,
@@ -38,8 +49,15 @@ logger = logging.getLogger(__name__)
 async def main():
     try:
         await create_db_and_tables()
+        await get_client_session()
         bot = await get_bot()
-        dispatcher = Dispatcher(storage=MemoryStorage())
+        dispatcher = Dispatcher(storage=create_fsm_storage())
+        register_middlewares(
+            dispatcher,
+            max_concurrent_updates=(
+                int(WEBHOOK_MAX_CONCURRENT_UPDATES) if BOT_MODE == "webhook" else None
+            ),
+        )
 
         register_command_handlers(dispatcher)
         register_callback_handlers(dispatcher)
@@ -51,13 +69,27 @@ async def main():
 
         register_main_message_handlers(dispatcher)
 
-        logger.info("Starting bot polling...")
-        await dispatcher.start_polling(bot)
+        if BOT_MODE == "webhook":
+            logger.info("Starting bot webhook server...")
+            await run_webhook(dispatcher, bot)
+        else:
+            logger.info("Starting bot polling...")
+            await bot.delete_webhook()
+            await dispatcher.start_polling(bot)
 
     except Exception as e:
         logger.error(f"Error in main: {e}", exc_info=True)
         raise
 
+    finally:
+        logger.info(f"UserInfo cache stats: {get_user_info_cache_stats()}")
+        logger.info(f"Admin notification stats: {admin_notifier.stats}")
+        await outbound_queue.close()
+        logger.info(f"Outbound queue stats: {outbound_queue.stats()}")
+        await close_client_session()
+        await close_bot()
+        await dispose_engines()
+
 
 def run_bot_with_retries():
     max_retries = 10
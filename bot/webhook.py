@@ -0,0 +1,59 @@
+import asyncio
+import logging
+
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+
+from bot.config import (
+    WEBHOOK_BASE_URL,
+    WEBHOOK_HOST,
+    WEBHOOK_PATH,
+    WEBHOOK_PORT,
+    WEBHOOK_SECRET,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def build_webhook_app(
+    dispatcher: Dispatcher, bot: Bot, secret_token: str, path: str
+) -> web.Application:
+    app = web.Application()
+    SimpleRequestHandler(
+        dispatcher=dispatcher,
+        bot=bot,
+        secret_token=secret_token,
+        handle_in_background=True,
+    ).register(app, path=path)
+    setup_application(app, dispatcher, bot=bot)
+
+    return app
+
+
+async def run_webhook(dispatcher: Dispatcher, bot: Bot):
+    if not WEBHOOK_SECRET:
+        raise RuntimeError("WEBHOOK_SECRET must be set when BOT_MODE is 'webhook'")
+
+    app = build_webhook_app(dispatcher, bot, WEBHOOK_SECRET, WEBHOOK_PATH)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, host=WEBHOOK_HOST, port=int(WEBHOOK_PORT))
+
+    try:
+        await site.start()
+        logger.info(f"Webhook server listening on {WEBHOOK_HOST}:{WEBHOOK_PORT}")
+
+        if WEBHOOK_BASE_URL:
+            await bot.set_webhook(
+                url=f"{WEBHOOK_BASE_URL.rstrip('/')}{WEBHOOK_PATH}",
+                secret_token=WEBHOOK_SECRET,
+                allowed_updates=dispatcher.resolve_used_update_types(),
+            )
+        else:
+            logger.warning("WEBHOOK_BASE_URL is not set, skipping setWebhook")
+
+        await asyncio.Event().wait()
+
+    finally:
+        await runner.cleanup()
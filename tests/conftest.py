@@ -0,0 +1,22 @@
+import os
+
+for name, value in {
+    "TG_TOKEN": "123456:TEST",
+    "GROUP_ID": "1",
+    "ADMIN_ID": "1",
+    "ADMIN2_ID": "2",
+    "DB_NAME": "flavourflow",
+    "DB_USER": "flavourflow",
+    "DB_PASSWORD": "flavourflow",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "CLOUDINARY_CLOUD_NAME": "test",
+    "CLOUDINARY_API_KEY": "test",
+    "CLOUDINARY_API_SECRET": "test",
+    "JWT_SECRET_KEY": "test",
+    "JWT_ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+    "API_BASE_URL": "http://localhost:8000",
+    "PAYMENTS_TOKEN": "test",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,20 @@
+from types import SimpleNamespace
+
+from api.app.common.conditional import build_validators, etag_matches
+
+
+def test_etag_is_weak():
+    etag, _ = build_validators([SimpleNamespace(id=1, updated_at=None)])
+
+    assert etag.startswith('W/"')
+
+
+def test_etag_matches_uses_weak_comparison():
+    etag, _ = build_validators([SimpleNamespace(id=1, updated_at=None)])
+    opaque = etag[2:]
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(opaque, etag)
+    assert etag_matches(f'"other", {opaque}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"other"', etag)
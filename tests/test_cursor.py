@@ -0,0 +1,25 @@
+import pytest
+from fastapi import HTTPException
+
+from api.app.order.models import Order
+from api.app.utils import (
+    CURSOR_NEXT,
+    coerce_cursor_value,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor_round_trip():
+    direction, values = decode_cursor(encode_cursor([42], CURSOR_NEXT))
+
+    assert direction == CURSOR_NEXT
+    assert coerce_cursor_value(Order.id, values[0]) == 42
+
+
+@pytest.mark.parametrize("value", ["abc", [1], {"id": 1}, None, True, 1.5])
+def test_mistyped_cursor_value_is_rejected(value):
+    with pytest.raises(HTTPException) as error:
+        coerce_cursor_value(Order.id, value)
+
+    assert error.value.status_code == 400
@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+from aiogram.fsm.storage.base import StorageKey
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from bot.common import fsm_storage
+from bot.common.fsm_storage import SQLiteStorage, create_redis_storage
+
+KEY = StorageKey(bot_id=1, chat_id=2, user_id=3)
+
+
+def run_with_storage(tmp_path, monkeypatch, scenario):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bot.db'}")
+    monkeypatch.setattr(fsm_storage, "engine", engine)
+    monkeypatch.setattr(fsm_storage, "writer_engine", engine)
+
+    async def main():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+        try:
+            storage = SQLiteStorage(state_ttl=60, eviction_interval=3600)
+            storage._last_eviction = float("inf")
+            return await scenario(storage)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def test_state_and_data_round_trip(tmp_path, monkeypatch):
+    async def scenario(storage):
+        await storage.set_state(KEY, "Support:question")
+        await storage.set_data(KEY, {"cart": "pizza"})
+        return await storage.get_state(KEY), await storage.get_data(KEY)
+
+    state, data = run_with_storage(tmp_path, monkeypatch, scenario)
+
+    assert state == "Support:question"
+    assert data == {"cart": "pizza"}
+
+
+def test_expired_record_is_not_revived_by_set_state(tmp_path, monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(fsm_storage.time, "time", lambda: clock["now"])
+
+    async def scenario(storage):
+        await storage.set_state(KEY, "Order:address")
+        await storage.set_data(KEY, {"cart": "old abandoned"})
+
+        clock["now"] += 120
+        await storage.set_state(KEY, "Support:question")
+        return await storage.get_state(KEY), await storage.get_data(KEY)
+
+    state, data = run_with_storage(tmp_path, monkeypatch, scenario)
+
+    assert state == "Support:question"
+    assert data == {}
+
+
+def test_expired_record_is_not_revived_by_set_data(tmp_path, monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(fsm_storage.time, "time", lambda: clock["now"])
+
+    async def scenario(storage):
+        await storage.set_state(KEY, "Order:address")
+
+        clock["now"] += 120
+        await storage.set_data(KEY, {"cart": "new"})
+        return await storage.get_state(KEY), await storage.get_data(KEY)
+
+    state, data = run_with_storage(tmp_path, monkeypatch, scenario)
+
+    assert state is None
+    assert data == {"cart": "new"}
+
+
+class FakeRedis:
+    """The part of redis.asyncio.Redis that RedisStorage uses, with a fake clock."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.items = {}
+        self.expiries = []
+
+    async def set(self, key, value, ex=None):
+        self.expiries.append(ex)
+        expires_at = self.clock["now"] + ex if ex else None
+        self.items[key] = (value.encode(), expires_at)
+
+    async def get(self, key):
+        value, expires_at = self.items.get(key, (None, None))
+
+        if expires_at is not None and expires_at <= self.clock["now"]:
+            del self.items[key]
+            return None
+
+        return value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.items.pop(key, None)
+
+    async def aclose(self, close_connection_pool=True):
+        pass
+
+
+def test_redis_storage_round_trip_and_ttl():
+    pytest.importorskip("redis")
+    clock = {"now": 1000.0}
+    redis = FakeRedis(clock)
+    storage = create_redis_storage("redis://unused", state_ttl=60, redis=redis)
+
+    async def scenario():
+        await storage.set_state(KEY, "Support:question")
+        await storage.set_data(KEY, {"cart": "pizza"})
+        fresh = await storage.get_state(KEY), await storage.get_data(KEY)
+
+        clock["now"] += 61
+        expired = await storage.get_state(KEY), await storage.get_data(KEY)
+
+        await storage.set_state(KEY, "Order:address")
+        await storage.set_state(KEY, None)
+        cleared = await storage.get_state(KEY)
+
+        await storage.close()
+        return fresh, expired, cleared
+
+    fresh, expired, cleared = asyncio.run(scenario())
+
+    assert fresh == ("Support:question", {"cart": "pizza"})
+    assert expired == (None, {})
+    assert cleared is None
+    assert set(redis.expiries) == {60}
@@ -0,0 +1,43 @@
+import asyncio
+
+from api.app.user.schemas import UserResponse
+from bot.common.services import notification_service
+from bot.common.services.notification_service import AdminNotifier
+
+
+class FakeQueue:
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, bot, chat_id, text, **kwargs):
+        if chat_id == 3:
+            raise asyncio.CancelledError()
+
+        self.sent.append((chat_id, text))
+
+
+def test_one_admin_failure_does_not_abort_the_fan_out(monkeypatch):
+    async def retrieve_admins():
+        return [
+            UserResponse(id=i, first_name="Admin", phone_number=str(i), telegram_id=i)
+            for i in (1, 2, 3)
+        ]
+
+    async def get_user_info(telegram_id):
+        if telegram_id == 2:
+            raise RuntimeError("database is locked")
+
+        return None
+
+    monkeypatch.setattr(notification_service, "retrieve_admins", retrieve_admins)
+    monkeypatch.setattr(notification_service, "get_user_info", get_user_info)
+
+    queue = FakeQueue()
+    notifier = AdminNotifier(queue=queue, admin_cache_ttl=60)
+
+    report = asyncio.run(notifier.notify_admins(None, lambda language: "New order"))
+
+    assert queue.sent == [(1, "New order")]
+    assert report["admins"] == 3
+    assert report["sent"] == 1
+    assert report["failed"] == 2
@@ -0,0 +1,29 @@
+from bot.handlers.entity_handlers.order_handlers import (
+    ORDER_SEPARATOR,
+    pack_messages,
+    utf16_len,
+)
+
+
+def test_utf16_len_counts_surrogate_pairs():
+    assert utf16_len("abc") == 3
+    assert utf16_len("🍕") == 2
+
+
+def test_long_block_is_split_by_utf16_units():
+    block = "🍕" * 10
+
+    messages = pack_messages([block], limit=5)
+
+    assert messages == ["🍕🍕", "🍕🍕", "🍕🍕", "🍕🍕", "🍕🍕"]
+    assert all(utf16_len(message) <= 5 for message in messages)
+
+
+def test_blocks_are_packed_within_utf16_limit():
+    limit = 2 * 4 + utf16_len(ORDER_SEPARATOR)
+    blocks = ["🍕🍕", "🍔🍔", "🍣"]
+
+    messages = pack_messages(blocks, limit=limit)
+
+    assert messages == [f"🍕🍕{ORDER_SEPARATOR}🍔🍔", "🍣"]
+    assert all(utf16_len(message) <= limit for message in messages)
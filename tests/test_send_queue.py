@@ -0,0 +1,78 @@
+import asyncio
+import time
+
+from aiogram.methods import SendMessage
+
+from bot.common.rate_limiter import RateLimiter
+from bot.common.send_queue import OutboundQueue, Priority
+
+
+class FakeBot:
+    def __init__(self):
+        self.sent = []
+
+    async def __call__(self, method):
+        self.sent.append((method.chat_id, method.text, time.monotonic()))
+        return method.text
+
+
+def make_queue(workers: int = 2) -> OutboundQueue:
+    return OutboundQueue(
+        rate_limiter=RateLimiter(global_rate=1000, per_chat_rate=5, per_chat_burst=1),
+        workers=workers,
+        max_size=100,
+        max_retries=1,
+    )
+
+
+def test_throttled_chat_does_not_block_other_chats():
+    async def main():
+        queue = make_queue(workers=2)
+        bot = FakeBot()
+        started_at = time.monotonic()
+
+        burst = [
+            asyncio.create_task(
+                queue.send(bot, SendMessage(chat_id=1, text=f"render {index}"))
+            )
+            for index in range(5)
+        ]
+        await asyncio.sleep(0.01)
+        payment = await queue.send(
+            bot, SendMessage(chat_id=2, text="invoice"), priority=Priority.PAYMENT
+        )
+        payment_elapsed = time.monotonic() - started_at
+
+        await asyncio.gather(*burst)
+        await queue.close()
+        return bot.sent, payment, payment_elapsed
+
+    sent, payment, payment_elapsed = asyncio.run(main())
+
+    assert payment == "invoice"
+    # Chat 1 needs ~0.8s for its burst at 5 msg/s; chat 2 must not wait for it.
+    assert payment_elapsed < 0.1
+    assert [text for chat_id, text, _ in sent if chat_id == 1] == [
+        f"render {index}" for index in range(5)
+    ]
+
+
+def test_per_chat_rate_is_respected():
+    async def main():
+        queue = make_queue(workers=4)
+        bot = FakeBot()
+        await asyncio.gather(
+            *(
+                queue.send(bot, SendMessage(chat_id=1, text=str(index)))
+                for index in range(4)
+            )
+        )
+        await queue.close()
+        return bot.sent, queue
+
+    sent, queue = asyncio.run(main())
+    times = [sent_at for _, _, sent_at in sent]
+
+    assert len(sent) == 4
+    assert all(later - earlier >= 0.19 for earlier, later in zip(times, times[1:]))
+    assert queue.metrics["sent"] == 4
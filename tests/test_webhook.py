@@ -0,0 +1,74 @@
+import asyncio
+
+from aiogram import Bot, Dispatcher, Router
+from aiogram.types import Message
+from aiohttp.test_utils import TestClient, TestServer
+
+from bot.common.middlewares import ConcurrencyLimitMiddleware
+from bot.fake_telegram import make_updates, post_updates
+from bot.webhook import build_webhook_app
+
+SECRET = "webhook-secret"
+PATH = "/webhook"
+
+
+class Recorder:
+    def __init__(self, expected: int):
+        self.expected = expected
+        self.texts = []
+        self.active = 0
+        self.max_active = 0
+        self.done = asyncio.Event()
+
+    async def handle(self, message: Message) -> None:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+
+        self.texts.append(message.text)
+        if len(self.texts) == self.expected:
+            self.done.set()
+
+
+async def run_webhook(
+    updates, secret: str, recorder: Recorder, concurrency_limit: int = 2
+):
+    router = Router()
+    router.message()(recorder.handle)
+
+    dispatcher = Dispatcher()
+    dispatcher.update.outer_middleware(ConcurrencyLimitMiddleware(concurrency_limit))
+    dispatcher.include_router(router)
+
+    bot = Bot(token="123456:TEST")
+    app = build_webhook_app(dispatcher, bot, SECRET, PATH)
+
+    async with TestClient(TestServer(app)) as client:
+        report = await post_updates(client, PATH, secret, updates, concurrency=10)
+
+        if report["statuses"].get(200):
+            await asyncio.wait_for(recorder.done.wait(), timeout=5)
+
+    return report
+
+
+def test_webhook_hands_updates_to_dispatcher_within_concurrency_limit():
+    updates = make_updates(count=10, users=3, text="/start")
+    recorder = Recorder(expected=len(updates))
+
+    report = asyncio.run(run_webhook(updates, SECRET, recorder, concurrency_limit=2))
+
+    assert report["statuses"] == {200: 10}
+    assert recorder.texts == ["/start"] * 10
+    assert recorder.max_active == 2
+
+
+def test_webhook_rejects_wrong_secret():
+    updates = make_updates(count=3, users=1)
+    recorder = Recorder(expected=len(updates))
+
+    report = asyncio.run(run_webhook(updates, "wrong-secret", recorder))
+
+    assert report["statuses"] == {401: 3}
+    assert recorder.texts == []